@@ -0,0 +1,9 @@
+-- Square WebP/AVIF thumbnails of cached player photos.
+-- Filled by `python -m pipeline transcode` (scripts/data-generation) after `photos`:
+-- {"48.webp": "https://…/players/variants/ab/<sha256>-48.webp", "96.webp": …, "192.avif": …}.
+-- Pages pick the smallest variant that covers the rendered size with playerPhotoUrl
+-- (src/domains/livescore/utils/playerPhoto.ts) and fall back to photo_cached_url / photo_url.
+-- Run this in the Supabase SQL editor.
+
+alter table public.football_players
+  add column if not exists photo_variants jsonb;
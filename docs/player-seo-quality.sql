@@ -0,0 +1,19 @@
+-- Precomputed sitemap quality flag for football_players.
+-- Filled in bulk by `python -m pipeline seo-flags` (scripts/data-generation), which evaluates
+-- isWorthlessSitemapPlayer (src/domains/livescore/utils/playerSeoQuality.ts) after translation and slug generation.
+-- NULL means "not evaluated yet"; sitemap queries filter with `seo_worthless is not true` and keep the JS check for those rows.
+-- Until this runs, sitemap.ts detects the missing column and queries without the filter (JS check only).
+-- Run this in the Supabase SQL editor.
+
+alter table public.football_players
+  add column if not exists seo_worthless boolean;
+
+-- getPlayerSitemap / getPlayerSitemapCount: active named players in player_id order
+create index if not exists football_players_sitemap_idx
+  on public.football_players (player_id)
+  where is_active = true and name is not null and seo_worthless is not true;
+
+-- getCorePlayerSitemap / getPlayerSitemapByLeagueSlug: same filter by team
+create index if not exists football_players_sitemap_team_idx
+  on public.football_players (team_id, player_id)
+  where is_active = true and name is not null and seo_worthless is not true;
@@ -0,0 +1,24 @@
+-- Player/team entities detected in existing posts by the offline tagger
+-- (scripts/data-generation: python -m pipeline tag).
+-- Run this in the Supabase SQL editor.
+
+create table if not exists public.post_entity_tags (
+  post_id uuid not null references public.posts(id) on delete cascade,
+  entity_type text not null check (entity_type in ('team', 'player')),
+  entity_id bigint not null,
+  matched_text text not null default '',
+  source text not null default 'alias' check (source in ('alias', 'link')),
+  tagged_at timestamptz not null default now(),
+  primary key (post_id, entity_type, entity_id)
+);
+
+create index if not exists post_entity_tags_entity_idx
+  on public.post_entity_tags (entity_type, entity_id);
+
+alter table public.post_entity_tags enable row level security;
+
+drop policy if exists "Anyone can view post entity tags" on public.post_entity_tags;
+create policy "Anyone can view post entity tags"
+  on public.post_entity_tags
+  for select
+  using (true);
@@ -8,27 +8,20 @@ This script processes player data and creates properly formatted TypeScript expo
 import json
 import sys
 
-# Team information mapping
-TEAM_INFO = {
-    2929: {'english': 'Al-Ahli Jeddah', 'korean': '알 아흘리', 'const_name': 'AL_AHLI_JEDDAH'},
-    2977: {'english': 'Al-Ittihad Jeddah', 'korean': '알 이티하드', 'const_name': 'AL_ITTIHAD_JEDDAH'},
-    2934: {'english': 'Al-Nassr', 'korean': '알 나스르', 'const_name': 'AL_NASSR'},
-    2931: {'english': 'Al-Hilal', 'korean': '알 힐랄', 'const_name': 'AL_HILAL'},
-    2944: {'english': 'Al-Fateh', 'korean': '알 파테', 'const_name': 'AL_FATEH'},
-    2945: {'english': 'Al-Fayha', 'korean': '알 파이하', 'const_name': 'AL_FAYHA'},
-    2932: {'english': 'Al-Shabab', 'korean': '알 샤바브', 'const_name': 'AL_SHABAB'},
-    2938: {'english': 'Al-Taawoun', 'korean': '알 타아운', 'const_name': 'AL_TAAWOUN'},
-    2928: {'english': 'Al-Ettifaq', 'korean': '알 에티파크', 'const_name': 'AL_ETTIFAQ'},
-    10509: {'english': 'Al-Qadsiah', 'korean': '알 카디시아', 'const_name': 'AL_QADSIAH'},
-    2992: {'english': 'Al-Khaleej', 'korean': '알 칼리즈', 'const_name': 'AL_KHALEEJ'},
-    2939: {'english': 'Al-Raed', 'korean': '알 라이드', 'const_name': 'AL_RAED'},
-    2933: {'english': 'Al-Riyadh', 'korean': '알 리야드', 'const_name': 'AL_RIYADH'},
-    10511: {'english': 'Al-Okhdood', 'korean': '알 악두드', 'const_name': 'AL_OKHDOOD'},
-    2940: {'english': 'Al-Tai', 'korean': '알 타이', 'const_name': 'AL_TAI'},
-    2936: {'english': 'Al-Wehda', 'korean': '알 웨흐다', 'const_name': 'AL_WEHDA'},
-    2956: {'english': 'Damac', 'korean': '다막', 'const_name': 'DAMAC'},
-    10513: {'english': 'Al-Akhdoud', 'korean': '알 악두드', 'const_name': 'AL_AKHDOUD'}
-}
+from pipeline.bundle import check_bundle
+from pipeline.dry_run import preview_or_write
+from pipeline.emit import render_player_module
+from pipeline.records import PlayerRecord
+from pipeline.registry import load_registry
+from pipeline.translate import get_resolver
+
+# Team information (english name, korean name, const name) comes from team_registry.json,
+# generated by `python -m pipeline registry` from football_teams
+TEAM_INFO = {team['team_id']: team for team in load_registry().league_teams('saudi-pro-league')}
+
+def team_info(team_id, team_name=None):
+    """TEAM_INFO entry; teams missing from the registry fall back to the snapshot team_name (with a warning)"""
+    return load_registry().team_info(team_id, team_name, 'saudi-pro-league')
 
 # Famous player name translations (comprehensive list)
 KNOWN_PLAYERS = {
@@ -102,148 +95,119 @@ KNOWN_PLAYERS = {
     'Nasser Al-Dawsari': '나세르 알 다우사리',
 }
 
-def translate_to_korean(name):
-    """Translate player name to Korean"""
-
-    # Check known players first
-    if name in KNOWN_PLAYERS:
-        return KNOWN_PLAYERS[name]
-
-    # Handle Al- prefix names (common in Saudi Arabia)
-    if name.startswith('Al-') or name.startswith('Al '):
-        # Split and translate
-        parts = name.replace('Al-', 'Al ').split()
-        if len(parts) >= 2:
-            # Basic translation for Al- names
-            return '알 ' + ' '.join(parts[1:])
-
-    # Handle Abdul- names
-    if 'Abdul' in name or 'Abd' in name:
-        replacements = {
-            'Abdulrahman': '압둘라흐만',
-            'Abdullah': '압둘라',
-            'Abdulaziz': '압둘아지즈',
-            'Abdulfattah': '압둘파타흐',
-            'Abdulelah': '압둘엘라',
-            'Abdulhamid': '압둘하미드',
-        }
-        for eng, kor in replacements.items():
-            if eng in name:
-                name = name.replace(eng, kor)
-                return name
-
-    # Handle common Arabic first names
-    arabic_names = {
-        'Mohammed': '모하메드',
-        'Muhammad': '무함마드',
-        'Ahmad': '아흐마드',
-        'Ahmed': '아흐메드',
-        'Hassan': '하산',
-        'Hussein': '후세인',
-        'Khalid': '칼리드',
-        'Salman': '살만',
-        'Salem': '살렘',
-        'Fahad': '파하드',
-        'Faisal': '파이살',
-        'Omar': '오마르',
-        'Ali': '알리',
-        'Nasser': '나세르',
-        'Saud': '사우드',
-        'Yasir': '야시르',
-        'Yasser': '야세르',
-        'Firas': '피라스',
-        'Nawaf': '나와프',
-        'Walid': '왈리드',
-        'Saad': '사드',
-        'Ziyad': '지야드',
-        'Majed': '마제드',
-        'Turki': '투르키',
-    }
-
-    for eng, kor in arabic_names.items():
-        if eng in name:
-            name = name.replace(eng, kor)
-            return name
-
-    # Return original name if no translation found
-    # (will need manual review for these)
-    return name
-
-def generate_typescript_file(all_teams_data, output_path):
-    """Generate the TypeScript file with all player mappings"""
-
-    lines = []
-    lines.append("import { PlayerMapping } from './index';")
-    lines.append("")
-    lines.append("// Saudi Pro League (사우디 프로리그) Player Mappings")
-    lines.append("// Auto-generated file - Korean names translated based on pronunciation rules")
-    lines.append("")
-
-    all_const_names = []
-
-    # Generate each team's player array
-    for team_data in all_teams_data:
-        team_id = team_data['team_id']
-        players = team_data['players']
-        team_info = TEAM_INFO[team_id]
-
-        const_name = f"{team_info['const_name']}_PLAYERS"
-        all_const_names.append(const_name)
-
-        lines.append(f"// {team_info['english']} ({team_info['korean']}) - Team ID: {team_id} - {len(players)}명")
-        lines.append(f"export const {const_name}: PlayerMapping[] = [")
-
-        for player in players:
-            # Translate Korean name
-            korean_name = translate_to_korean(player['name'])
+# Abdul- names (substring replacement rule, used by pipeline.translate.rules)
+ABDUL_NAMES = {
+    'Abdulrahman': '압둘라흐만',
+    'Abdullah': '압둘라',
+    'Abdulaziz': '압둘아지즈',
+    'Abdulfattah': '압둘파타흐',
+    'Abdulelah': '압둘엘라',
+    'Abdulhamid': '압둘하미드',
+}
 
-            # Format player entry
-            number = player.get('number')
-            number_str = str(number) if number is not None else 'null'
+# Common Arabic first names (substring replacement rule)
+ARABIC_FIRST_NAMES = {
+    'Mohammed': '모하메드',
+    'Muhammad': '무함마드',
+    'Ahmad': '아흐마드',
+    'Ahmed': '아흐메드',
+    'Hassan': '하산',
+    'Hussein': '후세인',
+    'Khalid': '칼리드',
+    'Salman': '살만',
+    'Salem': '살렘',
+    'Fahad': '파하드',
+    'Faisal': '파이살',
+    'Omar': '오마르',
+    'Ali': '알리',
+    'Nasser': '나세르',
+    'Saud': '사우드',
+    'Yasir': '야시르',
+    'Yasser': '야세르',
+    'Firas': '피라스',
+    'Nawaf': '나와프',
+    'Walid': '왈리드',
+    'Saad': '사드',
+    'Ziyad': '지야드',
+    'Majed': '마제드',
+    'Turki': '투르키',
+}
 
-            age = player.get('age')
-            age_str = str(age) if age is not None else 'null'
+def translate_to_korean(name):
+    """Translate player name to Korean
 
-            position = player.get('position', 'Unknown')
+    Lexicon → cache → fuzzy reuse → rules (Al- prefix, Abdul-, Arabic first names) → LLM,
+    as declared by the saudi-pro-league profile in pipeline.translate.profiles.
+    """
+    return get_resolver('saudi-pro-league').translate(name)
 
-            line = f"  {{ id: {player['id']}, name: \"{player['name']}\", korean_name: \"{korean_name}\", team_id: {team_id}, position: \"{position}\", number: {number_str}, age: {age_str} }},"
-            lines.append(line)
+def translate_names(names, dry_run=False):
+    """Batch form of translate_to_korean: {name: korean}. One resolve_many call, so names that reach
+    the LLM tier share requests (and the cached prompt prefix) instead of one request per name.
+    dry_run: no LLM calls and no review queue writes (see build_resolver)."""
+    return get_resolver('saudi-pro-league', dry_run).translate_many(names)
 
-        lines.append("];")
-        lines.append("")
+def generate_typescript_file(all_teams_data, output_path, dry_run=False):
+    """Generate the TypeScript file with all player mappings
 
-    # Generate combined export
-    lines.append("// 사우디 프로리그 전체 선수 통합")
-    lines.append("export const SAUDI_PRO_LEAGUE_PLAYERS: PlayerMapping[] = [")
-    for const_name in all_const_names:
-        lines.append(f"  ...{const_name},")
-    lines.append("];")
-    lines.append("")
+    The league array is the single backing array; team arrays, the team_id range table
+    and the id-keyed lookup all point into it (see pipeline.emit).
+    """
 
-    # Write to file
-    content = '\n'.join(lines)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    korean_names = translate_names([player['name'] for team_data in all_teams_data for player in team_data['players']],
+                                   dry_run)
 
-    return len(all_const_names), sum(len(team['players']) for team in all_teams_data)
+    teams = []
+    for team_data in all_teams_data:
+        team_id = team_data['team_id']
+        info = team_info(team_id, team_data.get('team_name'))
+        players = [
+            PlayerRecord(player['id'], player['name'], korean_names[player['name']], team_id,
+                         player.get('position', 'Unknown'), player.get('number'), player.get('age'))
+            for player in team_data['players']
+        ]
+        teams.append({
+            'team_id': team_id,
+            'const_name': info['const_name'],
+            'comment': f"{info['name']} ({info['korean']}) - Team ID: {team_id} - {len(players)}명",
+            'players': players,
+        })
+
+    content = render_player_module('SAUDI_PRO_LEAGUE', teams, header=[
+        'Saudi Pro League (사우디 프로리그) Player Mappings',
+        'Auto-generated file - Korean names translated based on pronunciation rules',
+    ])
+
+    # Module size vs. the league budget (PIPELINE_BUNDLE_BUDGET=fail stops here before writing)
+    check_bundle(output_path, content, 'saudi-pro-league')
+
+    # Write to file (--dry-run: only print a per-player diff against the current file)
+    preview_or_write(output_path, content, dry_run)
+
+    return len(teams), sum(len(team['players']) for team in teams)
 
 def main():
     """Main function to read JSON data and generate file"""
 
+    dry_run = '--dry-run' in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != '--dry-run']
+
     # Read JSON data from stdin (will be provided by calling script)
-    if len(sys.argv) > 1:
-        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+    if args:
+        with open(args[0], 'r', encoding='utf-8') as f:
             all_teams_data = json.load(f)
     else:
-        print("Usage: python build_saudi_file.py <input_json_file>")
-        print("JSON format: [{'team_id': 2929, 'players': [{'id': 123, 'name': '...', ...}]}]")
+        print("Usage: python build_saudi_file.py <input_json_file> [--dry-run]")
+        print("JSON format: [{'team_id': 2929, 'team_name': '...', 'players': [{'id': 123, 'name': '...', ...}]}]")
         sys.exit(1)
 
     # Output path
     output_path = r"c:\Users\user\Desktop\web2\123\1234\src\domains\livescore\constants\players\saudi-pro-league.ts"
 
     # Generate file
-    num_teams, num_players = generate_typescript_file(all_teams_data, output_path)
+    num_teams, num_players = generate_typescript_file(all_teams_data, output_path, dry_run)
+    if dry_run:
+        return
 
     print(f"✅ Successfully generated saudi-pro-league.ts")
     print(f"   Teams: {num_teams}")
@@ -1,9 +1,17 @@
-#!/bin/bash
-# This script will be executed to fetch data team by team
-# and build the final TypeScript file
-
-echo "Fetching Saudi Pro League player data..."
-echo "This will fetch 18 teams with approximately 740 players"
-echo ""
-echo "Data will be saved to JSON file, then processed by Python script"
-echo "to generate the final TypeScript file with Korean translations."
+#!/bin/bash
+# Fetch Saudi Pro League squads through the Python pipeline fetcher
+# and build the final TypeScript file.
+#
+# Usage: bash fetch_and_build.sh [season]
+#   (re-runs only send conditional requests; unchanged squads come back as 304)
+set -e
+
+SEASON="${1:-2025}"
+cd "$(dirname "$0")"
+
+echo "Fetching Saudi Pro League player data (season $SEASON)..."
+python -m pipeline fetch --league saudi-pro-league --season "$SEASON"
+
+echo ""
+echo "Building TypeScript file with Korean translations..."
+python build_saudi_file.py .pipeline-cache/snapshots/saudi-pro-league.json
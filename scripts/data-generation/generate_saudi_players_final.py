@@ -3,29 +3,18 @@
 
 import json
 
+from pipeline.registry import load_registry
+from pipeline.translate import get_resolver
+
 # Saudi Pro League player data with Korean translations
 # This data structure will be populated from Supabase queries
 
-TEAM_INFO = {
-    2929: {'english': 'Al-Ahli Jeddah', 'korean': '알 아흘리'},
-    2977: {'english': 'Al-Ittihad Jeddah', 'korean': '알 이티하드'},
-    2934: {'english': 'Al-Nassr', 'korean': '알 나스르'},
-    2931: {'english': 'Al-Hilal', 'korean': '알 힐랄'},
-    2944: {'english': 'Al-Fateh', 'korean': '알 파테'},
-    2945: {'english': 'Al-Fayha', 'korean': '알 파이하'},
-    2932: {'english': 'Al-Shabab', 'korean': '알 샤바브'},
-    2938: {'english': 'Al-Taawoun', 'korean': '알 타아운'},
-    2928: {'english': 'Al-Ettifaq', 'korean': '알 에티파크'},
-    10509: {'english': 'Al-Qadsiah', 'korean': '알 카디시아'},
-    2992: {'english': 'Al-Khaleej', 'korean': '알 칼리즈'},
-    2939: {'english': 'Al-Raed', 'korean': '알 라이드'},
-    2933: {'english': 'Al-Riyadh', 'korean': '알 리야드'},
-    10511: {'english': 'Al-Okhdood', 'korean': '알 악두드'},
-    2940: {'english': 'Al-Tai', 'korean': '알 타이'},
-    2936: {'english': 'Al-Wehda', 'korean': '알 웨흐다'},
-    2956: {'english': 'Damac', 'korean': '다막'},
-    10513: {'english': 'Al-Akhdoud', 'korean': '알 악두드'}
-}
+# Team information (english/korean/const name) from team_registry.json (`python -m pipeline registry`)
+TEAM_INFO = {team['team_id']: team for team in load_registry().league_teams('saudi-pro-league')}
+
+def team_info(team_id, team_name=None):
+    """TEAM_INFO entry; teams missing from the registry fall back to the snapshot team_name (with a warning)"""
+    return load_registry().team_info(team_id, team_name, 'saudi-pro-league')
 
 # Korean name dictionary for famous and common players
 KNOWN_PLAYERS = {
@@ -97,108 +86,85 @@ KNOWN_PLAYERS = {
     'Nasser Al-Dawsari': '나세르 알 다우사리',
 }
 
+# Arabic name parts (token rule, used by pipeline.translate.rules)
+ARABIC_NAME_PARTS = {
+    'Al-': '알 ',
+    'Al': '알',
+    'Abd': '압드',
+    'Abdul': '압둘',
+    'Abdel': '압델',
+    'Abdulrahman': '압둘라흐만',
+    'Abdullah': '압둘라',
+    'Abdulaziz': '압둘아지즈',
+    'Abdulfattah': '압둘파타흐',
+    'Mohammed': '모하메드',
+    'Muhammad': '무함마드',
+    'Ahmad': '아흐마드',
+    'Ahmed': '아흐메드',
+    'Hassan': '하산',
+    'Hussein': '후세인',
+    'Hussain': '후사인',
+    'Khalid': '칼리드',
+    'Khaled': '칼레드',
+    'Salman': '살만',
+    'Salem': '살렘',
+    'Fahad': '파하드',
+    'Faisal': '파이살',
+    'Omar': '오마르',
+    'Umar': '우마르',
+    'Ali': '알리',
+    'Nasser': '나세르',
+    'Nawaf': '나와프',
+    'Saud': '사우드',
+    'Yazid': '야지드',
+    'Yasser': '야세르',
+    'Yasir': '야시르',
+    'Firas': '피라스',
+    'Walid': '왈리드',
+    'Saad': '사드',
+    'Ziyad': '지야드',
+    'Majed': '마제드',
+    'Turki': '투르키',
+    'Hamad': '하마드',
+    'Nawaf': '나와프',
+    'Osama': '오사마',
+    'Othman': '오스만',
+    'Rayan': '라얀',
+    'Saeed': '사이드',
+    'Sultan': '술탄',
+    'Talal': '탈랄',
+    'Tariq': '타리크',
+    'Youssef': '유세프',
+    'Yousef': '유세프',
+    # Common last name parts
+    'Dawsari': '다우사리',
+    'Shahrani': '샤흐라니',
+    'Bulayhi': '불라이히',
+    'Buraikan': '부라이칸',
+    'Shehri': '셰흐리',
+    'Ghareeb': '가리브',
+    'Muwallad': '무왈라드',
+    'Tambakti': '탐박티',
+    'Owais': '오와이스',
+    'Faraj': '파라즈',
+    'Otayf': '오타이프',
+    'Abdulhamid': '압둘하미드',
+}
+
 def translate_arabic_name(name):
-    """Translate Arabic names to Korean"""
-
-    # Check known players first
-    if name in KNOWN_PLAYERS:
-        return KNOWN_PLAYERS[name]
-
-    parts = name.split(' ')
-    translated_parts = []
-
-    # Arabic name translations
-    arabic_map = {
-        'Al-': '알 ',
-        'Al': '알',
-        'Abd': '압드',
-        'Abdul': '압둘',
-        'Abdel': '압델',
-        'Abdulrahman': '압둘라흐만',
-        'Abdullah': '압둘라',
-        'Abdulaziz': '압둘아지즈',
-        'Abdulfattah': '압둘파타흐',
-        'Mohammed': '모하메드',
-        'Muhammad': '무함마드',
-        'Ahmad': '아흐마드',
-        'Ahmed': '아흐메드',
-        'Hassan': '하산',
-        'Hussein': '후세인',
-        'Hussain': '후사인',
-        'Khalid': '칼리드',
-        'Khaled': '칼레드',
-        'Salman': '살만',
-        'Salem': '살렘',
-        'Fahad': '파하드',
-        'Faisal': '파이살',
-        'Omar': '오마르',
-        'Umar': '우마르',
-        'Ali': '알리',
-        'Nasser': '나세르',
-        'Nawaf': '나와프',
-        'Saud': '사우드',
-        'Yazid': '야지드',
-        'Yasser': '야세르',
-        'Yasir': '야시르',
-        'Firas': '피라스',
-        'Walid': '왈리드',
-        'Saad': '사드',
-        'Ziyad': '지야드',
-        'Majed': '마제드',
-        'Turki': '투르키',
-        'Hamad': '하마드',
-        'Nawaf': '나와프',
-        'Osama': '오사마',
-        'Othman': '오스만',
-        'Rayan': '라얀',
-        'Saeed': '사이드',
-        'Sultan': '술탄',
-        'Talal': '탈랄',
-        'Tariq': '타리크',
-        'Youssef': '유세프',
-        'Yousef': '유세프',
-        # Common last name parts
-        'Dawsari': '다우사리',
-        'Shahrani': '샤흐라니',
-        'Bulayhi': '불라이히',
-        'Buraikan': '부라이칸',
-        'Shehri': '셰흐리',
-        'Ghareeb': '가리브',
-        'Muwallad': '무왈라드',
-        'Tambakti': '탐박티',
-        'Owais': '오와이스',
-        'Faraj': '파라즈',
-        'Otayf': '오타이프',
-        'Abdulhamid': '압둘하미드',
-    }
-
-    for part in parts:
-        translated = False
-        for arabic, korean in arabic_map.items():
-            if part == arabic or part.startswith(arabic + '-') or part == arabic.rstrip('-'):
-                if arabic.endswith('-'):
-                    rest = part[len(arabic):]
-                    if rest and rest in arabic_map:
-                        translated_parts.append(korean + arabic_map[rest])
-                    else:
-                        translated_parts.append(korean + rest)
-                else:
-                    translated_parts.append(korean)
-                translated = True
-                break
-
-        if not translated:
-            # If no match, keep original or try basic transliteration
-            translated_parts.append(part)
-
-    return ' '.join(translated_parts)
+    """Translate Arabic names to Korean (saudi-pro-league resolver profile)"""
+    return get_resolver('saudi-pro-league').translate(name)
+
+def translate_arabic_names(names):
+    """Batch form of translate_arabic_name: {name: korean} from one resolve_many call (use this for whole squads)"""
+    return get_resolver('saudi-pro-league').translate_many(names)
 
 def generate_typescript_file(output_path):
     """Generate the TypeScript file with player mappings"""
 
     # This will be populated with actual data from Supabase
     # For now, creating structure
-    content = 'import { PlayerMapping } from \\'./index\\';\n\n'
+    content = "import { PlayerMapping } from './index';\n\n"
 
     content += '// Note: This file contains Saudi Pro League player mappings\n'
     content += '// Korean names are translated based on pronunciation rules:\n'
@@ -0,0 +1,9 @@
+"""
+선수 데이터 생성 파이프라인
+
+scripts/data-generation 의 리그별 스크립트가 공유하는 단계(fetch, 번역, 출력 등)를 모은 패키지.
+
+사용법:
+    cd scripts/data-generation
+    python -m pipeline <command> --help
+"""
@@ -0,0 +1,46 @@
+"""
+python -m pipeline <command> 진입점
+
+각 단계 모듈은 register(subparsers) 로 자신의 하위 명령을 등록한다.
+"""
+
+import argparse
+import importlib
+import sys
+
+COMMAND_MODULES = [
+    'pipeline.fetcher',
+    'pipeline.sync',
+    'pipeline.photos',
+    'pipeline.transcode',
+    'pipeline.translate',
+    'pipeline.translate.batch',
+    'pipeline.translate.review',
+    'pipeline.translate.evaluate',
+    'pipeline.player_index',
+    'pipeline.emit',
+    'pipeline.aliases',
+    'pipeline.tagging',
+    'pipeline.sitemap',
+    'pipeline.slugs',
+    'pipeline.seo_flags',
+    'pipeline.registry',
+    'pipeline.bundle',
+    'pipeline.warm_names',
+    'pipeline.patch',
+    'pipeline.backup',
+]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pipeline', description='선수 데이터 생성 파이프라인')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    for module_name in COMMAND_MODULES:
+        importlib.import_module(module_name).register(subparsers)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,425 @@
+"""
+선수/팀 별칭 Aho-Corasick 오토마톤 (본문 엔티티 링크용)
+
+supabase/functions/rss-news-bot/index.ts 는 실행마다 buildPlayerAliases/buildTeamAliases 로 별칭을 만들고
+findMatches 가 문장마다 모든 별칭을 indexOf 로 훑는다 (본문 길이 × 별칭 수).
+여기서는 같은 규칙으로 별칭을 모아 오토마톤 하나로 미리 컴파일해 두고, 로더가 본문을 한 번만 훑는다.
+
+edge function 과 같은 규칙:
+- 별칭 후보: 팀 name_ko/display_name/short_name/name, 선수 korean_name/display_name/name
+- aliasIsUsable (숫자만, 짧은 영문 4자 미만, 짧은 한글 선수 3자/팀 2자 미만 제외), 단독 팀 별칭 차단 목록
+- 팀은 INTERNAL_LINK_LEAGUE_IDS 의 클럽 팀만, 선수는 본문에서 찾은 팀 소속만 (find_entities 의 2단계)
+- 긴 별칭 우선, 엔티티당 첫 번째 경계 일치 하나, 겹치는 일치 제외, hasBoundary (한글 조사 허용)
+추가:
+- 비교는 글자 단위로 소문자 + 악센트 제거 → 'Joao Cancelo' 도 'João Cancelo' 와 일치 (오프셋 유지)
+- 영문 선수 이름의 이니셜 변형 ('G. Rulli'), 여러 선수에 겹치는 변형은 버린다
+
+산출물 (.pipeline-cache/aliases/aliases.json.gz):
+    records  별칭 레코드 (열 단위: type, id, team_id, alias, href), 순서 = 우선순위
+    patterns 정규화한 별칭 문자열, pattern_records 로 레코드 목록 연결
+    states   오토마톤 (edge_start/edge_chars/edge_targets 평탄화, fail, terminal, output_link)
+
+rss-news-bot 은 ENTITY_ALIASES_URL 로 게시된 산출물을 supabase/functions/rss-news-bot/aliasAutomaton.ts 로 읽는다
+(--store 로 aliases/aliases.json.gz 에 게시). 7일보다 오래됐거나 받지 못하면 예전처럼 DB 별칭으로 찾는다.
+
+사용법:
+    python -m pipeline aliases [--rows dump.json] [--out aliases.json.gz] [--store s3:<endpoint>/<bucket> --public-base-url <url>]
+    python -m pipeline aliases --match article.txt
+"""
+
+import gzip
+import json
+import re
+import time
+import unicodedata
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import config
+from .fetcher import _atomic_write
+
+ALIASES_PATH = config.CACHE_DIR / 'aliases' / 'aliases.json.gz'
+STORE_KEY = 'aliases/aliases.json.gz'
+FORMAT_VERSION = 1
+
+# rss-news-bot/index.ts 상수와 동일하게 유지
+MAX_ENTITY_LINKS = 24
+INTERNAL_LINK_LEAGUE_IDS = {39, 140, 78, 135, 61, 292, 293}
+BLOCKED_STANDALONE_TEAM_ALIASES = {'santos', '산투스', '산토스'}
+HANGUL_TOPIC_PARTICLES = set('은는이가을를와과도에의로')
+
+TEAM_COLUMNS = 'team_id,name,name_ko,display_name,short_name,slug,league_id,league_name,league_name_ko,country,country_ko'
+PLAYER_COLUMNS = 'player_id,name,korean_name,display_name,slug,team_id'
+
+HANGUL = re.compile(r'[가-힣]')
+ASCII_WORD = re.compile(r'[A-Za-z0-9]')
+
+
+def normalize_text(value) -> str:
+    return ' '.join(unicodedata.normalize('NFKC', str(value or '')).split())
+
+
+def is_ascii_text(value: str) -> bool:
+    return bool(value) and value.isascii()
+
+
+def normalize_comparable(value) -> str:
+    return normalize_text(value).lower().replace('-', ' ').replace('_', ' ')
+
+
+def alias_is_usable(alias: str, entity_type: str) -> bool:
+    normalized = normalize_text(alias)
+    if not normalized or normalized.isdigit():
+        return False
+    if is_ascii_text(normalized):
+        return len(normalized) >= 4
+    return len(normalized) >= (3 if entity_type == 'player' else 2)
+
+
+def collect_aliases(values, entity_type: str) -> list:
+    aliases, seen = [], set()
+    for value in values:
+        alias = normalize_text(value)
+        if not alias_is_usable(alias, entity_type) or alias.lower() in seen:
+            continue
+        seen.add(alias.lower())
+        aliases.append(alias)
+    return aliases
+
+
+def is_club_team(team: dict) -> bool:
+    team_names = {normalize_comparable(team.get(k)) for k in ('name', 'name_ko', 'display_name', 'short_name')} - {''}
+    country_names = {normalize_comparable(team.get(k)) for k in ('country', 'country_ko')} - {''}
+    league_name = normalize_comparable(f"{team.get('league_name') or ''} {team.get('league_name_ko') or ''}")
+    for marker in ('world cup', '월드컵', 'nations league', '국가', 'friendlies', '친선'):
+        if marker in league_name:
+            return False
+    return not (team_names & country_names)
+
+
+def is_internal_link_team(team: dict) -> bool:
+    return is_club_team(team) and int(team.get('league_id') or 0) in INTERNAL_LINK_LEAGUE_IDS
+
+
+def fold_char(ch: str) -> str:
+    """한 글자 정규화 (소문자 + 악센트 제거). 결과가 한 글자가 아니면 소문자만 → 본문 오프셋이 유지된다"""
+    lower = ch.lower()
+    if len(lower) != 1:
+        return ch
+    if lower.isascii():
+        return lower
+    stripped = ''.join(c for c in unicodedata.normalize('NFKD', lower) if not unicodedata.combining(c))
+    return stripped if len(stripped) == 1 else lower
+
+
+def fold_text(text: str) -> str:
+    return ''.join(fold_char(ch) for ch in text)
+
+
+def initial_variant(alias: str):
+    """'Gerónimo Rulli' → 'G. Rulli' (영문 두 단어 이상일 때만)"""
+    tokens = alias.split(' ')
+    if len(tokens) < 2 or not tokens[0][:1].isalpha() or HANGUL.search(alias) or tokens[0].endswith('.'):
+        return None
+    return ' '.join([tokens[0][0] + '.', *tokens[1:]])
+
+
+@dataclass(frozen=True)
+class AliasRecord:
+    type: str
+    id: int
+    team_id: int
+    alias: str
+    href: str
+
+    @property
+    def key(self) -> str:
+        return f'{self.type}-{self.id}'
+
+
+@dataclass(frozen=True)
+class Match:
+    start: int
+    end: int
+    record: AliasRecord
+
+
+def _href(kind: str, entity_id, slug) -> str:
+    return f'/livescore/football/{kind}/{entity_id}' + (f'/{slug}' if slug else '')
+
+
+def build_team_aliases(teams: list) -> list:
+    records, seen = [], set()
+    for team in filter(is_internal_link_team, teams):
+        for alias in collect_aliases([team.get('name_ko'), team.get('display_name'), team.get('short_name'), team.get('name')], 'team'):
+            if alias.lower() in BLOCKED_STANDALONE_TEAM_ALIASES or alias.lower() in seen:
+                continue
+            seen.add(alias.lower())
+            team_id = int(team['team_id'])
+            records.append(AliasRecord('team', team_id, team_id, alias, _href('team', team_id, team.get('slug'))))
+    return sorted(records, key=lambda r: -len(r.alias))
+
+
+def build_player_aliases(players: list) -> list:
+    """소속 팀 제한 없이 전체 선수 별칭. 같은 별칭이 여러 선수에 있으면 모두 두고 일치 시점에 본문 팀으로 고른다"""
+    records, seen = [], set()
+    primary = set()
+    variants = {}
+    for player in players:
+        player_id, team_id = int(player['player_id']), int(player.get('team_id') or 0)
+        href = _href('player', player_id, player.get('slug'))
+        for alias in collect_aliases([player.get('korean_name'), player.get('display_name'), player.get('name')], 'player'):
+            primary.add(fold_text(alias))
+            if (player_id, alias.lower()) not in seen:
+                seen.add((player_id, alias.lower()))
+                records.append(AliasRecord('player', player_id, team_id, alias, href))
+            variant = initial_variant(alias)
+            if variant and alias_is_usable(variant, 'player'):
+                variants.setdefault(fold_text(variant), {})[player_id] = AliasRecord('player', player_id, team_id, variant, href)
+
+    for key, owners in variants.items():
+        if len(owners) == 1 and key not in primary:
+            records.extend(owners.values())
+    return sorted(records, key=lambda r: -len(r.alias))
+
+
+def has_boundary(text: str, alias: str, start: int, end: int) -> bool:
+    before = text[start - 1] if start > 0 else ''
+    after = text[end] if end < len(text) else ''
+    if is_ascii_text(alias):
+        return not ASCII_WORD.search(before + after)
+    if HANGUL.match(before):
+        return False
+    if HANGUL.match(after) and after not in HANGUL_TOPIC_PARTICLES:
+        return False
+    return True
+
+
+class AliasAutomaton:
+    """정규화한 별칭 문자열 → 레코드 목록. 상태 전이는 상태별 dict"""
+
+    def __init__(self, records: list, patterns: list, pattern_records: list, goto: list, fail: list,
+                 terminal: list, output_link: list):
+        self.records = records
+        self.patterns = patterns
+        self.pattern_records = pattern_records
+        self.goto = goto
+        self.fail = fail
+        self.terminal = terminal
+        self.output_link = output_link
+
+    @classmethod
+    def build(cls, records: list) -> 'AliasAutomaton':
+        patterns, pattern_records, by_pattern = [], [], {}
+        for index, record in enumerate(records):
+            key = fold_text(record.alias)
+            if key not in by_pattern:
+                by_pattern[key] = len(patterns)
+                patterns.append(key)
+                pattern_records.append([])
+            pattern_records[by_pattern[key]].append(index)
+
+        goto, terminal = [{}], [-1]
+        for pattern_index, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                if ch not in goto[state]:
+                    goto.append({})
+                    terminal.append(-1)
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            terminal[state] = pattern_index
+
+        fail, output_link = [0] * len(goto), [-1] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in goto[state].items():
+                queue.append(child)
+                link = fail[state]
+                while link and ch not in goto[link]:
+                    link = fail[link]
+                fail[child] = goto[link].get(ch, 0)
+                target = fail[child]
+                output_link[child] = target if terminal[target] >= 0 else output_link[target]
+        return cls(records, patterns, pattern_records, goto, fail, terminal, output_link)
+
+    def to_dict(self) -> dict:
+        edge_start, edge_chars, edge_targets = [], [], []
+        for transitions in self.goto:
+            edge_start.append(len(edge_targets))
+            for ch in sorted(transitions):
+                edge_chars.append(ch)
+                edge_targets.append(transitions[ch])
+        edge_start.append(len(edge_targets))
+        return {
+            'format': FORMAT_VERSION,
+            'built_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'records': {
+                'type': [r.type for r in self.records],
+                'id': [r.id for r in self.records],
+                'team_id': [r.team_id for r in self.records],
+                'alias': [r.alias for r in self.records],
+                'href': [r.href for r in self.records],
+            },
+            'patterns': self.patterns,
+            'pattern_records': self.pattern_records,
+            'states': {
+                'edge_start': edge_start,
+                'edge_chars': ''.join(edge_chars),
+                'edge_targets': edge_targets,
+                'fail': self.fail,
+                'terminal': self.terminal,
+                'output_link': self.output_link,
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AliasAutomaton':
+        if data.get('format') != FORMAT_VERSION:
+            raise ValueError(f"Unsupported alias artifact format: {data.get('format')}")
+        columns = data['records']
+        records = [AliasRecord(*row) for row in zip(columns['type'], columns['id'], columns['team_id'],
+                                                    columns['alias'], columns['href'])]
+        states = data['states']
+        starts, chars, targets = states['edge_start'], states['edge_chars'], states['edge_targets']
+        goto = [dict(zip(chars[starts[i]:starts[i + 1]], targets[starts[i]:starts[i + 1]])) for i in range(len(starts) - 1)]
+        return cls(records, data['patterns'], data['pattern_records'], goto, states['fail'], states['terminal'],
+                   states['output_link'])
+
+    def save(self, path: Path = ALIASES_PATH) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(self.to_dict(), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        _atomic_write(path, gzip.compress(payload, mtime=0))
+        return path
+
+    @classmethod
+    def load(cls, path: Path = ALIASES_PATH) -> 'AliasAutomaton':
+        return cls.from_dict(json.loads(gzip.decompress(Path(path).read_bytes())))
+
+    @property
+    def state_count(self) -> int:
+        return len(self.goto)
+
+    def occurrences(self, text: str):
+        """(start, end, pattern_index) — 본문을 한 번 훑는다"""
+        goto, fail, terminal, output_link, patterns = self.goto, self.fail, self.terminal, self.output_link, self.patterns
+        state = 0
+        for position, ch in enumerate(fold_text(text)):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            hit = state if terminal[state] >= 0 else output_link[state]
+            while hit >= 0:
+                pattern = terminal[hit]
+                yield position + 1 - len(patterns[pattern]), position + 1, pattern
+                hit = output_link[hit]
+
+    def find_matches(self, text: str, used: set = None, context_team_ids=None, types=('player', 'team'),
+                     max_links=MAX_ENTITY_LINKS) -> list:
+        """findMatches 와 같은 선택: 별칭 우선순위(레코드 순서) → 위치 순으로 엔티티당 하나, 겹침 제외
+
+        context_team_ids: 선수는 이 팀 소속만 (None 이면 선수 제외 — edge function 과 동일)
+        max_links: used 가 이 수에 닿으면 중단 (None 이면 제한 없음)
+        """
+        used = set() if used is None else used
+        candidates = []
+        for start, end, pattern in self.occurrences(text):
+            seen_types = set()
+            for record_index in self.pattern_records[pattern]:
+                record = self.records[record_index]
+                if record.type not in types or record.type in seen_types:
+                    continue
+                if record.type == 'player' and (context_team_ids is None or record.team_id not in context_team_ids):
+                    continue
+                # buildPlayerAliases 처럼 같은 별칭은 종류별 첫 레코드만
+                seen_types.add(record.type)
+                if has_boundary(text, record.alias, start, end):
+                    candidates.append((record_index, start, end))
+
+        matches = []
+        for record_index, start, end in sorted(candidates):
+            if max_links is not None and len(used) >= max_links:
+                break
+            record = self.records[record_index]
+            if record.key in used or any(start < m.end and end > m.start for m in matches):
+                continue
+            matches.append(Match(start, end, record))
+            used.add(record.key)
+        return sorted(matches, key=lambda m: m.start)
+
+    def find_entities(self, text: str, max_links=MAX_ENTITY_LINKS) -> list:
+        """enrichRssContent 의 2단계: 팀 별칭으로 본문 팀을 먼저 찾고, 그 팀 소속 선수까지 포함해 다시 찾는다"""
+        context = {m.record.id for m in self.find_matches(text, types=('team',), max_links=max_links)}
+        return self.find_matches(text, context_team_ids=context, max_links=max_links)
+
+
+def build_automaton(teams: list, players: list) -> AliasAutomaton:
+    # rss-news-bot 과 같이 선수 별칭이 팀 별칭보다 먼저 (각각 긴 별칭 우선)
+    return AliasAutomaton.build(build_player_aliases(players) + build_team_aliases(teams))
+
+
+def load_automaton(path: Path = None) -> AliasAutomaton:
+    return AliasAutomaton.load(path or ALIASES_PATH)
+
+
+def fetch_alias_rows(db) -> tuple:
+    from .db import eq
+
+    teams = list(db.select_all('football_teams', TEAM_COLUMNS, [eq('is_active', True)], order=['team_id']))
+    players = list(db.select_all('football_players', PLAYER_COLUMNS, [eq('is_active', True)], order=['player_id']))
+    return teams, players
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('aliases', help='선수/팀 별칭 Aho-Corasick 오토마톤 빌드 (본문 엔티티 링크용)')
+    parser.add_argument('--rows', type=Path, default=None,
+                        help='{"teams": [...], "players": [...]} JSON 덤프 (기본: Supabase 에서 조회)')
+    parser.add_argument('--out', type=Path, default=ALIASES_PATH)
+    parser.add_argument('--match', type=Path, default=None, help='빌드 대신 저장된 오토마톤으로 텍스트 파일의 엔티티 확인')
+    parser.add_argument('--store', default=None, help=f'게시할 오브젝트 저장소 local:<dir> 또는 s3:<endpoint>/<bucket> ({STORE_KEY})')
+    parser.add_argument('--public-base-url', default=None, help='저장소의 공개 http(s) 주소 (local 저장소는 필수)')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    if args.match:
+        automaton = load_automaton(args.out)
+        text = args.match.read_text(encoding='utf-8')
+        started = time.perf_counter()
+        matches = automaton.find_entities(text, max_links=None)
+        elapsed = time.perf_counter() - started
+        for match in matches:
+            print(f"  {match.start:>7}  {match.record.key:<16} {text[match.start:match.end]}  → {match.record.href}")
+        print(f"✓ {len(matches)} entities in {len(text)} chars ({elapsed * 1000:.2f} ms)")
+        return
+
+    if args.rows:
+        rows = json.loads(args.rows.read_text(encoding='utf-8'))
+        teams, players = rows.get('teams') or [], rows.get('players') or []
+    else:
+        from .db import SupabaseRest
+
+        teams, players = fetch_alias_rows(SupabaseRest.from_env())
+
+    started = time.perf_counter()
+    automaton = build_automaton(teams, players)
+    path = automaton.save(args.out)
+    elapsed = time.perf_counter() - started
+    print(f"✓ {len(automaton.records)} aliases ({len(automaton.patterns)} patterns, {automaton.state_count} states) "
+          f"from {len(teams)} teams / {len(players)} players in {elapsed:.2f}s")
+    print(f"✓ {path} ({path.stat().st_size:,} bytes)")
+
+    if args.store:
+        from .http_client import HttpPool
+        from .object_store import open_store
+
+        with HttpPool() as pool:
+            store = open_store(args.store, args.public_base_url, pool=pool)
+            url = store.public_url(STORE_KEY)
+            if not url.startswith(('http://', 'https://')):
+                raise SystemExit(f"ENTITY_ALIASES_URL would be {url} — pass an http(s) --public-base-url (required for local stores)")
+            store.put(STORE_KEY, path.read_bytes(), 'application/gzip')
+        print(f"✓ Published: {url} (rss-news-bot ENTITY_ALIASES_URL)")
@@ -0,0 +1,237 @@
+"""
+콘텐츠 주소 기반 백업 저장소 + 실행 저널
+
+파일을 고치는 스크립트가 원본 옆에 <파일>.backup 전체 복사본을 쓰던 것을 대신한다.
+복사본은 실행마다 덮어써져 한 단계 전만 남았고, 소스 트리에 백업 파일이 흩어졌다.
+
+- 내용은 sha256 으로 주소를 매겨 한 번만 저장 (.pipeline-cache/backups/objects/ab/<sha256>.zst)
+  → 바뀌지 않은 파일을 다시 백업하면 해시 계산만 하고 쓰기 없음
+- 압축: zstandard 패키지, 없으면 zstd 실행 파일, 둘 다 없으면 gzip (.gz). 복원은 확장자로 판별
+- 실행 저널 (journal.jsonl): 실행 id, 명령, 시각, 파일 경로 → 해시. 한 줄에 한 실행 (append 만)
+- 복원: 저널의 해시로 blob 을 읽어 현재 내용과 다른 파일만 원자적으로 다시 쓴다
+
+    from pipeline.backup import backup_files
+    backup_files([path], 'translate_eredivisie_full')
+
+사용법:
+    python -m pipeline backups [--limit 20]
+    python -m pipeline restore --run <id | latest> [파일 ...] [--dry-run]
+    python -m pipeline backups --prune 50      # 최근 50 실행만 남기고 참조 없는 blob 삭제
+"""
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+
+from . import config
+from .fetcher import _atomic_write
+from .object_store import LocalObjectStore
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+BACKUP_DIR = config.CACHE_DIR / 'backups'
+ZSTD_LEVEL = 10
+
+
+class BackupError(RuntimeError):
+    pass
+
+
+def _zstd_binary():
+    return shutil.which(os.environ.get('PIPELINE_ZSTD', 'zstd'))
+
+
+def compress(data: bytes) -> tuple:
+    """(확장자, 압축된 바이트)"""
+    if zstandard is not None:
+        return 'zst', zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    binary = _zstd_binary()
+    if binary is not None:
+        result = subprocess.run([binary, '-q', '-c', f'-{ZSTD_LEVEL}'], input=data, capture_output=True, check=True)
+        return 'zst', result.stdout
+    return 'gz', gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def decompress(codec: str, data: bytes) -> bytes:
+    if codec == 'gz':
+        return gzip.decompress(data)
+    if zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    binary = _zstd_binary()
+    if binary is None:
+        raise BackupError('zstd blob found but neither the zstandard package nor a zstd binary is available')
+    return subprocess.run([binary, '-q', '-d', '-c'], input=data, capture_output=True, check=True).stdout
+
+
+class BackupStore:
+    def __init__(self, root: Path = BACKUP_DIR):
+        self.root = Path(root)
+        self.objects = LocalObjectStore(self.root / 'objects')
+        self.journal_path = self.root / 'journal.jsonl'
+        self._lock = threading.Lock()
+
+    def _blob_key(self, digest: str) -> str:
+        """이미 저장된 blob 키 (없으면 None)"""
+        for codec in ('zst', 'gz'):
+            key = f'{digest[:2]}/{digest}.{codec}'
+            if self.objects.exists(key):
+                return key
+        return None
+
+    def put(self, data: bytes) -> tuple:
+        """(sha256, 새로 저장한 압축 바이트 수 — 이미 있으면 0)"""
+        digest = hashlib.sha256(data).hexdigest()
+        if self._blob_key(digest) is not None:
+            return digest, 0
+        codec, packed = compress(data)
+        self.objects.put(f'{digest[:2]}/{digest}.{codec}', packed)
+        return digest, len(packed)
+
+    def get(self, digest: str) -> bytes:
+        key = self._blob_key(digest)
+        if key is None:
+            raise BackupError(f'Missing backup object {digest}')
+        data = decompress(key.rsplit('.', 1)[1], self.objects.get(key))
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise BackupError(f'Backup object {digest} is corrupt')
+        return data
+
+    def snapshot(self, paths, command: str) -> dict:
+        """파일들의 현재 내용을 저장하고 저널에 실행 하나를 추가. 없는 파일은 건너뛴다"""
+        now = datetime.datetime.now(datetime.timezone.utc)
+        files, stored = {}, 0
+        for path in paths:
+            path = Path(path)
+            if not path.is_file():
+                continue
+            digest, written = self.put(path.read_bytes())
+            files[str(path.resolve())] = digest
+            stored += written
+        run = {
+            'run': f"{now.strftime('%Y%m%d-%H%M%S')}-{hashlib.sha256(json.dumps(files).encode()).hexdigest()[:6]}",
+            'command': command,
+            'created_at': now.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'files': files,
+            'stored_bytes': stored,
+        }
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(run, ensure_ascii=False) + '\n')
+        return run
+
+    def runs(self) -> list:
+        """저널의 실행 목록 (오래된 것부터)"""
+        if not self.journal_path.exists():
+            return []
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def find_run(self, run_id: str) -> dict:
+        """'latest' 또는 실행 id (앞부분만 맞아도 하나로 정해지면 됨)"""
+        runs = self.runs()
+        if run_id == 'latest':
+            if not runs:
+                raise BackupError('No backup runs recorded')
+            return runs[-1]
+        matches = [run for run in runs if run['run'].startswith(run_id)]
+        if len(matches) != 1:
+            raise BackupError(f"{'Ambiguous' if matches else 'Unknown'} backup run: {run_id}")
+        return matches[0]
+
+    def restore(self, run_id: str, paths=None, dry_run: bool = False) -> list:
+        """[(경로, 상태)] 상태: 'restored' | 'unchanged'. paths 로 일부 파일만"""
+        run = self.find_run(run_id)
+        wanted = {str(Path(path).resolve()) for path in paths} if paths else None
+        if wanted:
+            unknown = wanted - set(run['files'])
+            if unknown:
+                raise BackupError(f"Not in run {run['run']}: {sorted(unknown)}")
+        results = []
+        for path, digest in run['files'].items():
+            if wanted is not None and path not in wanted:
+                continue
+            target = Path(path)
+            current = target.read_bytes() if target.exists() else None
+            if current is not None and hashlib.sha256(current).hexdigest() == digest:
+                results.append((path, 'unchanged'))
+                continue
+            if not dry_run:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                _atomic_write(target, self.get(digest))
+            results.append((path, 'restored'))
+        return results
+
+    def prune(self, keep: int) -> tuple:
+        """최근 keep 실행만 저널에 남기고 참조가 없어진 blob 삭제. (삭제한 실행 수, 삭제한 blob 수)"""
+        with self._lock:
+            runs = self.runs()
+            kept = runs[-keep:] if keep > 0 else []
+            referenced = {digest for run in kept for digest in run['files'].values()}
+            removed_blobs = 0
+            for blob in self.objects.root.glob('*/*'):
+                if blob.name.split('.', 1)[0] not in referenced:
+                    blob.unlink()
+                    removed_blobs += 1
+                    if not any(blob.parent.iterdir()):
+                        blob.parent.rmdir()
+            payload = ''.join(json.dumps(run, ensure_ascii=False) + '\n' for run in kept)
+            if runs:
+                _atomic_write(self.journal_path, payload.encode('utf-8'))
+        return len(runs) - len(kept), removed_blobs
+
+
+def backup_files(paths, command: str, store: BackupStore = None) -> dict:
+    """파일을 고치기 전에 호출. 실행 id 를 출력하고 저널 항목을 반환"""
+    run = (store or BackupStore()).snapshot(paths, command)
+    print(f"✓ Backup: run {run['run']} ({len(run['files'])} file(s), {run['stored_bytes'] / 1024:.1f} KiB new) "
+          f"— restore with: python -m pipeline restore --run {run['run']}")
+    return run
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('backups', help='백업 저장소의 실행 저널 목록 / 오래된 실행 정리')
+    parser.add_argument('--limit', type=int, default=20, help='최근 몇 개 실행을 보여줄지')
+    parser.add_argument('--prune', type=int, default=None, metavar='KEEP', help='최근 KEEP 실행만 남기고 정리')
+    parser.set_defaults(handler=run_list)
+
+    parser = subparsers.add_parser('restore', help='백업 실행 하나의 파일들을 복원')
+    parser.add_argument('--run', required=True, help="실행 id (앞부분만 써도 됨) 또는 'latest'")
+    parser.add_argument('files', nargs='*', type=Path, help='일부 파일만 복원')
+    parser.add_argument('--dry-run', action='store_true', help='복원할 파일만 출력')
+    parser.set_defaults(handler=run_restore)
+
+
+def run_list(args):
+    store = BackupStore()
+    if args.prune is not None:
+        runs, blobs = store.prune(args.prune)
+        print(f"✓ Pruned {runs} run(s) and {blobs} unreferenced object(s)")
+    runs = store.runs()
+    for run in runs[-args.limit:]:
+        print(f"  {run['run']}  {run['created_at']}  {run['command']:<28} {len(run['files']):>3} file(s)  "
+              f"{run.get('stored_bytes', 0) / 1024:>8.1f} KiB new")
+    size = sum(blob.stat().st_size for blob in store.objects.root.glob('*/*')) if store.objects.root.exists() else 0
+    print(f"✓ {len(runs)} run(s), objects {size / 1024:.1f} KiB → {store.root}")
+
+
+def run_restore(args):
+    store = BackupStore()
+    try:
+        results = store.restore(args.run, args.files or None, args.dry_run)
+    except BackupError as e:
+        raise SystemExit(str(e))
+    verb = 'would restore' if args.dry_run else 'restored'
+    for path, status in results:
+        print(f"  {verb if status == 'restored' else '= unchanged'}: {path}")
+    restored = sum(1 for _, status in results if status == 'restored')
+    print(f"✓ {restored} file(s) {verb}, {len(results) - restored} already identical")
@@ -0,0 +1,222 @@
+"""
+생성된 리그 모듈 크기 / 파싱 비용 리포트와 리그별 예산
+
+리그 TypeScript 모듈(emit, build_saudi_file.py, generate_j1_players.py 산출물)은 그대로 Next.js 번들에 들어간다.
+생성할 때마다 모듈별로 raw / gzip / brotli 크기와 선수 레코드 수를 재고, 리그별 예산과 비교한다.
+
+- brotli: brotli 패키지가 있으면 사용, 없으면 node 의 zlib (둘 다 없으면 생략). 품질 11 (정적 자산 기준)
+- 파싱/평가 시간 (선택, --parse 또는 PIPELINE_BUNDLE_PARSE=1): 생성 모듈의 타입 표기만 걷어낸 JS 를
+  node 의 vm.Script 로 컴파일(parse) / 실행(eval) 해 여러 번 잰 중앙값
+- 예산: BUNDLE_BUDGETS (리그별, 없으면 DEFAULT_BUDGET). --budgets 또는 PIPELINE_BUNDLE_BUDGETS 의
+  JSON 파일로 리그/항목 단위 덮어쓰기 ({"j1-league": {"gzip": 60000}})
+- 예산 초과: 기본은 ⚠ 출력 + 리포트, --budget-mode fail 또는 PIPELINE_BUNDLE_BUDGET=fail 이면 실행 실패
+
+    from pipeline.bundle import check_bundle
+    check_bundle(output_path, content, 'j1-league')
+
+사용법:
+    python -m pipeline bundle-size ../../src/domains/livescore/constants/players/*.ts [--parse] [--budget-mode fail]
+"""
+
+import gzip
+import json
+import os
+import re
+import shutil
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .dry_run import RECORD_PATTERN
+from .leagues import LEAGUES
+from .report import RunReport
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BROTLI_QUALITY = 11
+PARSE_RUNS = 5
+
+# 바이트 / 밀리초. 선수 한 줄이 약 150 바이트 → 팀 20개 × 35명 기준으로 여유를 둔 값
+DEFAULT_BUDGET = {'raw': 160_000, 'gzip': 32_000, 'brotli': 26_000, 'parse_ms': 20.0, 'eval_ms': 20.0}
+BUNDLE_BUDGETS = {
+    'saudi-pro-league': {'raw': 140_000, 'gzip': 28_000, 'brotli': 23_000},
+    'j1-league': {'raw': 160_000, 'gzip': 32_000, 'brotli': 26_000},
+    'eredivisie': {'raw': 140_000, 'gzip': 28_000, 'brotli': 23_000},
+    'primeira-liga': {'raw': 140_000, 'gzip': 28_000, 'brotli': 23_000},
+    'mls': {'raw': 220_000, 'gzip': 44_000, 'brotli': 36_000, 'parse_ms': 30.0, 'eval_ms': 30.0},
+}
+METRICS = ('raw', 'gzip', 'brotli', 'parse_ms', 'eval_ms')
+
+TS_IMPORT = re.compile(r'^import .*;$', re.MULTILINE)
+TS_EXPORT_CONST = re.compile(r'^export const (\w+):[^=\n]+= ', re.MULTILINE)
+
+NODE_MEASURE = r"""
+const vm = require('vm'), zlib = require('zlib');
+const { source, js, runs } = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const out = {
+  brotli: zlib.brotliCompressSync(Buffer.from(source, 'utf8'),
+    { params: { [zlib.constants.BROTLI_PARAM_QUALITY]: %d } }).length,
+};
+if (js !== null) {
+  const parse = [], evaluate = [];
+  for (let i = 0; i < runs; i++) {
+    // 소스가 같으면 V8 컴파일 캐시를 타므로 매번 주석을 달리한다
+    const started = process.hrtime.bigint();
+    const script = new vm.Script(`${js}\n//${i}`);
+    const compiled = process.hrtime.bigint();
+    script.runInNewContext({});
+    const finished = process.hrtime.bigint();
+    parse.push(Number(compiled - started) / 1e6);
+    evaluate.push(Number(finished - compiled) / 1e6);
+  }
+  const median = (values) => values.sort((a, b) => a - b)[Math.floor(values.length / 2)];
+  out.parse_ms = median(parse);
+  out.eval_ms = median(evaluate);
+}
+process.stdout.write(JSON.stringify(out));
+""" % BROTLI_QUALITY
+
+
+class BudgetExceeded(RuntimeError):
+    pass
+
+
+@dataclass
+class ModuleSize:
+    path: str
+    league: str
+    records: int
+    raw: int
+    gzip: int
+    brotli: int = None
+    parse_ms: float = None
+    eval_ms: float = None
+
+
+def node_binary():
+    return shutil.which(os.environ.get('PIPELINE_NODE', 'node'))
+
+
+def to_js(content: str) -> str:
+    """생성 모듈(render_player_module 형식)의 import 와 타입 표기를 걷어낸 JS"""
+    return TS_EXPORT_CONST.sub(r'const \1 = ', TS_IMPORT.sub('', content))
+
+
+def node_measure(source: bytes, js: str = None, runs: int = PARSE_RUNS) -> dict:
+    node = node_binary()
+    if node is None:
+        return {}
+    payload = json.dumps({'source': source.decode('utf-8'), 'js': js, 'runs': runs})
+    result = subprocess.run([node, '-e', NODE_MEASURE], input=payload, capture_output=True, text=True,
+                            encoding='utf-8', check=True)
+    return json.loads(result.stdout)
+
+
+def measure(content: str, path, league: str, parse: bool = False, runs: int = PARSE_RUNS) -> ModuleSize:
+    source = content.encode('utf-8')
+    size = ModuleSize(
+        path=str(path),
+        league=league,
+        records=sum(1 for _ in RECORD_PATTERN.finditer(content)),
+        raw=len(source),
+        gzip=len(gzip.compress(source, compresslevel=9, mtime=0)),
+    )
+    if brotli is not None:
+        size.brotli = len(brotli.compress(source, quality=BROTLI_QUALITY))
+    if parse or size.brotli is None:
+        measured = node_measure(source, to_js(content) if parse else None, runs)
+        if size.brotli is None:
+            size.brotli = measured.get('brotli')
+        size.parse_ms = measured.get('parse_ms')
+        size.eval_ms = measured.get('eval_ms')
+    return size
+
+
+def load_budgets(path: Path = None) -> dict:
+    """리그별 예산 (기본값 ← BUNDLE_BUDGETS ← JSON 파일)"""
+    budgets = {league: {**DEFAULT_BUDGET, **BUNDLE_BUDGETS.get(league, {})} for league in LEAGUES}
+    path = path or os.environ.get('PIPELINE_BUNDLE_BUDGETS')
+    if path:
+        for league, overrides in json.loads(Path(path).read_text(encoding='utf-8')).items():
+            budgets[league] = {**budgets.get(league, DEFAULT_BUDGET), **overrides}
+    return budgets
+
+
+def over_budget(size: ModuleSize, budget: dict) -> list:
+    """[(항목, 측정값, 예산)] — 측정하지 않은 항목은 비교하지 않는다"""
+    exceeded = []
+    for metric in METRICS:
+        value = getattr(size, metric)
+        if value is not None and metric in budget and value > budget[metric]:
+            exceeded.append((metric, value, budget[metric]))
+    return exceeded
+
+
+def format_size(size: ModuleSize) -> str:
+    parts = [f"{size.records} records", f"raw {size.raw / 1024:.1f} KiB", f"gzip {size.gzip / 1024:.1f} KiB"]
+    if size.brotli is not None:
+        parts.append(f"br {size.brotli / 1024:.1f} KiB")
+    if size.parse_ms is not None:
+        parts.append(f"parse {size.parse_ms:.2f} ms, eval {size.eval_ms:.2f} ms")
+    return f"{size.path}: " + ', '.join(parts)
+
+
+def check_bundle(path, content: str, league: str, parse: bool = None, mode: str = None, budgets: dict = None,
+                 report: RunReport = None) -> ModuleSize:
+    """크기를 재서 출력하고 예산과 비교. mode 'fail' 이면 초과 시 BudgetExceeded"""
+    if parse is None:
+        parse = os.environ.get('PIPELINE_BUNDLE_PARSE') == '1'
+    mode = mode or os.environ.get('PIPELINE_BUNDLE_BUDGET', 'report')
+    budget = (budgets or load_budgets()).get(league, DEFAULT_BUDGET)
+
+    size = measure(content, path, league, parse)
+    exceeded = over_budget(size, budget)
+    print(f"✓ Bundle {format_size(size)}")
+    for metric, value, limit in exceeded:
+        print(f"⚠ {league} {metric} {value:,} exceeds budget {limit:,}")
+
+    if report is not None:
+        section = report.section(f'bundle:{league}')
+        section.update({key: value for key, value in asdict(size).items() if value is not None})
+        section['over_budget'] = [metric for metric, _, _ in exceeded]
+    if exceeded and mode == 'fail':
+        raise BudgetExceeded(f"{league}: over budget ({', '.join(metric for metric, _, _ in exceeded)})")
+    return size
+
+
+def league_for(path: Path) -> str:
+    """emit 이 여러 리그를 쓸 때의 파일명 (<league>.ts) 으로 리그 추정"""
+    if path.stem in LEAGUES:
+        return path.stem
+    raise SystemExit(f'Cannot infer the league of {path}; pass --league')
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('bundle-size', help='리그 모듈의 raw/gzip/brotli 크기, 파싱 시간을 리그별 예산과 비교')
+    parser.add_argument('files', nargs='+', type=Path, help='생성된 리그 .ts 파일')
+    parser.add_argument('--league', default=None, help='리그 key (기본: 파일명)')
+    parser.add_argument('--parse', action='store_true', help='node 로 파싱/평가 시간도 측정')
+    parser.add_argument('--budgets', type=Path, default=None, help='예산 덮어쓰기 JSON')
+    parser.add_argument('--budget-mode', choices=['report', 'fail'], default=None,
+                        help='예산 초과 시 동작 (기본: PIPELINE_BUNDLE_BUDGET 또는 report)')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    if args.parse and node_binary() is None:
+        raise SystemExit('node not found (set PIPELINE_NODE)')
+    report = RunReport('bundle-size')
+    budgets = load_budgets(args.budgets)
+    failures = []
+    for path in args.files:
+        league = args.league or league_for(path)
+        try:
+            check_bundle(path, path.read_text(encoding='utf-8'), league, args.parse, args.budget_mode, budgets, report)
+        except BudgetExceeded as e:
+            failures.append(str(e))
+    print(f"✓ Report: {report.write()}")
+    if failures:
+        raise SystemExit('\n'.join(failures))
@@ -0,0 +1,92 @@
+"""
+football_players 열 단위(columnar) 스냅샷
+
+전체 테이블을 한 번 페이지 단위로 읽어 컬럼별 배열로 저장한다 (.pipeline-cache/players/football_players.json.gz).
+사이트맵처럼 전체 선수를 훑는 단계는 DB 대신 이 스냅샷을 읽는다.
+필요한 컬럼이 스냅샷에 없거나 --refresh 면 다시 받는다.
+값 종류가 적은 문자열 컬럼(INTERNED_COLUMNS)은 읽을 때 intern 해 행마다 같은 str 객체를 공유한다.
+"""
+
+import gzip
+import json
+import time
+from pathlib import Path
+
+from . import config
+from .fetcher import _atomic_write
+from .records import intern
+
+PLAYER_COLUMNS_PATH = config.CACHE_DIR / 'players' / 'football_players.json.gz'
+INTERNED_COLUMNS = ('team_name', 'position', 'nationality', 'nationality_ko')
+
+
+class ColumnSnapshot:
+    def __init__(self, columns: dict, fetched_at: str = None):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f'Column lengths differ: {sorted(lengths)}')
+        for name in INTERNED_COLUMNS:
+            if name in columns:
+                columns[name] = [intern(value) for value in columns[name]]
+        self.columns = columns
+        self.fetched_at = fetched_at
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    @property
+    def names(self) -> list:
+        return list(self.columns)
+
+    def has(self, names) -> bool:
+        return all(name in self.columns for name in names)
+
+    def column(self, name: str) -> list:
+        return self.columns[name]
+
+    def rows(self, names=None):
+        """컬럼 이름 → 값 dict 를 한 행씩 (names 로 필요한 컬럼만)"""
+        names = list(names or self.columns)
+        for values in zip(*(self.columns[name] for name in names)):
+            yield dict(zip(names, values))
+
+    @classmethod
+    def fetch(cls, db, table: str, columns: list, filters: list = None, order: list = None) -> 'ColumnSnapshot':
+        data = {name: [] for name in columns}
+        for row in db.select_all(table, ','.join(columns), filters, order):
+            for name in columns:
+                data[name].append(row.get(name))
+        return cls(data, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()))
+
+    def save(self, path: Path = PLAYER_COLUMNS_PATH) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({'fetched_at': self.fetched_at, 'columns': self.columns}, ensure_ascii=False,
+                             separators=(',', ':')).encode('utf-8')
+        _atomic_write(path, gzip.compress(payload, mtime=0))
+        return path
+
+    @classmethod
+    def load(cls, path: Path = PLAYER_COLUMNS_PATH) -> 'ColumnSnapshot':
+        data = json.loads(gzip.decompress(Path(path).read_bytes()))
+        return cls(data['columns'], data.get('fetched_at'))
+
+
+def player_columns(columns: list, path: Path = None, refresh: bool = False, db=None) -> ColumnSnapshot:
+    """활성 선수(name 있음) 스냅샷. 없거나 컬럼이 모자라거나 refresh 면 DB 에서 받아 저장"""
+    path = Path(path or PLAYER_COLUMNS_PATH)
+    if path.exists():
+        snapshot = ColumnSnapshot.load(path)
+        if not refresh and snapshot.has(columns):
+            return snapshot
+        # 다른 단계가 쓰는 컬럼도 유지
+        columns = list(dict.fromkeys([*snapshot.names, *columns]))
+
+    from .db import SupabaseRest, eq, not_is
+
+    db = db or SupabaseRest.from_env()
+    snapshot = ColumnSnapshot.fetch(db, 'football_players', columns, [eq('is_active', True), not_is('name', None)],
+                                    order=['player_id'])
+    snapshot.save(path)
+    print(f"✓ Snapshot: {len(snapshot)} players → {path}")
+    return snapshot
@@ -0,0 +1,34 @@
+"""
+파이프라인 공통 설정 (경로, API 엔드포인트)
+"""
+
+import os
+from pathlib import Path
+
+DATA_GENERATION_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = DATA_GENERATION_DIR.parent.parent
+
+# 응답 캐시, 스냅샷, 실행 리포트 등 재생성 가능한 산출물 (git 제외)
+CACHE_DIR = Path(os.environ.get('PIPELINE_CACHE_DIR') or DATA_GENERATION_DIR / '.pipeline-cache')
+SNAPSHOT_DIR = CACHE_DIR / 'snapshots'
+
+# API-Football
+API_BASE_URL = os.environ.get('FOOTBALL_API_BASE_URL', 'https://v3.football.api-sports.io')
+API_HOST = 'v3.football.api-sports.io'
+
+
+def api_key() -> str:
+    """src/domains/livescore/actions/footballApi.ts 와 같은 순서로 API 키 조회"""
+    return (
+        os.environ.get('FOOTBALL_API_KEY')
+        or os.environ.get('RAPID_API_KEY')
+        or os.environ.get('NEXT_PUBLIC_RAPIDAPI_KEY')
+        or ''
+    )
+
+# Anthropic API (Message Batches 대량 번역; 로컬 stand-in 은 ANTHROPIC_BASE_URL 로 지정)
+ANTHROPIC_BASE_URL = os.environ.get('ANTHROPIC_BASE_URL', 'https://api.anthropic.com')
+ANTHROPIC_VERSION = '2023-06-01'
+
+# 사이트 URL (src/shared/config/site.ts 와 같은 환경 변수/기본값)
+SITE_URL = os.environ.get('NEXT_PUBLIC_SITE_URL') or 'https://4590fb.com'
@@ -0,0 +1,146 @@
+"""
+Supabase(PostgREST) REST 클라이언트
+
+supabase-py 없이 /rest/v1 을 직접 호출한다. 파이프라인에 필요한 만큼만 구현:
+select(필터/정렬/페이지), 청크 단위 upsert, 조건부 update.
+502/503/504 는 fetcher 와 같은 간격으로 재시도한다 (PostgREST 는 실패한 요청을 적용하지 않으므로 upsert 도 안전).
+
+필터는 (컬럼, 'op.value') 튜플이며 eq/in_/lt/is_/or_ 헬퍼로 만든다.
+    db.select('football_players', 'player_id,name', [eq('team_id', 2934), is_('korean_name', 'null')])
+"""
+
+import json
+import os
+import time
+from urllib.parse import urlencode
+
+from .http_client import HttpPool
+
+PAGE_SIZE = 1000
+UPSERT_CHUNK_SIZE = 500
+MAX_ATTEMPTS = 3
+RETRY_DELAYS = [0.3, 1.2]
+RETRYABLE_STATUS = {502, 503, 504}
+
+
+class DatabaseError(RuntimeError):
+    pass
+
+
+def _literal(value) -> str:
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def eq(column: str, value):
+    return (column, f'eq.{_literal(value)}')
+
+
+def neq(column: str, value):
+    return (column, f'neq.{_literal(value)}')
+
+
+def lt(column: str, value):
+    return (column, f'lt.{_literal(value)}')
+
+
+def gte(column: str, value):
+    return (column, f'gte.{_literal(value)}')
+
+
+def is_(column: str, value):
+    return (column, f'is.{_literal(value)}')
+
+
+def not_is(column: str, value):
+    return (column, f'not.is.{_literal(value)}')
+
+
+def in_(column: str, values):
+    return (column, 'in.(' + ','.join(_literal(v) for v in values) + ')')
+
+
+def or_(*conditions: str):
+    """or_('last_api_sync.is.null', 'last_api_sync.lt.2025-01-01')"""
+    return ('or', '(' + ','.join(conditions) + ')')
+
+
+class SupabaseRest:
+    def __init__(self, url: str, key: str, pool: HttpPool = None):
+        if not url or not key:
+            raise DatabaseError('SUPABASE_URL/NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY are required.')
+        self.base_url = url.rstrip('/') + '/rest/v1'
+        self.key = key
+        self.pool = pool or HttpPool()
+        self.retries = 0
+
+    @classmethod
+    def from_env(cls, pool: HttpPool = None):
+        return cls(
+            os.environ.get('SUPABASE_URL') or os.environ.get('NEXT_PUBLIC_SUPABASE_URL'),
+            os.environ.get('SUPABASE_SERVICE_ROLE_KEY'),
+            pool=pool,
+        )
+
+    def _headers(self, extra: dict = None) -> dict:
+        headers = {
+            'apikey': self.key,
+            'Authorization': f'Bearer {self.key}',
+            'Content-Type': 'application/json',
+        }
+        headers.update(extra or {})
+        return headers
+
+    def _request(self, method: str, table: str, params: list, body=None, headers: dict = None):
+        url = f'{self.base_url}/{table}'
+        if params:
+            url = f'{url}?{urlencode(params, safe="(),.:*")}'
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8') if body is not None else None
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            response = self.pool.request(method, url, headers=self._headers(headers), body=data)
+            if response.status not in RETRYABLE_STATUS or attempt == MAX_ATTEMPTS:
+                break
+            self.retries += 1
+            time.sleep(RETRY_DELAYS[attempt - 1])
+        if response.status >= 400:
+            raise DatabaseError(f'{method} {table} failed ({response.status}): {response.body[:500].decode("utf-8", "replace")}')
+        return response
+
+    def select(self, table: str, columns: str = '*', filters: list = None, order: list = None,
+               limit: int = None, offset: int = None) -> list:
+        params = [('select', columns), *(filters or [])]
+        if order:
+            params.append(('order', ','.join(order)))
+        if limit is not None:
+            params.append(('limit', str(limit)))
+        if offset:
+            params.append(('offset', str(offset)))
+        response = self._request('GET', table, params)
+        return json.loads(response.body or b'[]')
+
+    def select_all(self, table: str, columns: str = '*', filters: list = None, order: list = None,
+                   page_size: int = PAGE_SIZE):
+        """limit/offset 페이지 단위로 전체 행을 순회 (generator)"""
+        offset = 0
+        while True:
+            rows = self.select(table, columns, filters, order, limit=page_size, offset=offset)
+            yield from rows
+            if len(rows) < page_size:
+                return
+            offset += page_size
+
+    def upsert(self, table: str, rows: list, on_conflict: str, chunk_size: int = UPSERT_CHUNK_SIZE,
+               ignore_duplicates: bool = False) -> int:
+        resolution = 'ignore-duplicates' if ignore_duplicates else 'merge-duplicates'
+        headers = {'Prefer': f'resolution={resolution},return=minimal'}
+        for start in range(0, len(rows), chunk_size):
+            self._request('POST', table, [('on_conflict', on_conflict)], rows[start:start + chunk_size], headers)
+        return len(rows)
+
+    def update(self, table: str, values: dict, filters: list):
+        if not filters:
+            raise DatabaseError('update without filters is not allowed')
+        self._request('PATCH', table, filters, values, {'Prefer': 'return=minimal'})
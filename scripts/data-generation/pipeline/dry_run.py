@@ -0,0 +1,130 @@
+"""
+--dry-run 미리보기: 생성 결과를 파일에 쓰지 않고 현재 파일과 선수 단위로 비교
+
+PlayerMapping 항목({ id: ..., name: "...", korean_name: ..., ... })을 id 별로 파싱해
+항목마다 해시를 만들고, 해시가 다른 항목만 자세히 비교한다.
+요약: 추가 / 삭제 / 이름 변경 / korean_name 변경 / 기타 필드 변경
+
+    from pipeline.dry_run import preview_or_write
+    preview_or_write(output_path, content, dry_run='--dry-run' in sys.argv)
+
+미리보기도 부작용이 없어야 하므로 번역은 get_resolver(league, dry_run=True) 로 한다
+(LLM tier 와 검수 큐 없이 → API 호출도, review.sqlite 기록도 없음).
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+RECORD_PATTERN = re.compile(
+    r'\{\s*id:\s*(?P<id>\d+),\s*name:\s*(?P<name>"(?:[^"\\]|\\.)*"),\s*'
+    r'korean_name:\s*(?P<korean>null|"(?:[^"\\]|\\.)*")(?P<rest>[^}]*)\}'
+)
+
+
+@dataclass(frozen=True)
+class Record:
+    name: str
+    korean_name: str
+    digest: bytes
+
+
+@dataclass
+class RecordDiff:
+    added: list = field(default_factory=list)            # [(id, name)]
+    removed: list = field(default_factory=list)          # [(id, name)]
+    renamed: list = field(default_factory=list)          # [(id, old, new)]
+    korean_changed: list = field(default_factory=list)   # [(id, name, old, new)]
+    other_changed: int = 0
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.renamed or self.korean_changed or self.other_changed)
+
+
+def _literal(value: str):
+    return None if value == 'null' else json.loads(value)
+
+
+def parse_records(content: str) -> dict:
+    """{player_id: Record}. 같은 id 가 여러 번 나오면 첫 항목 (팀 배열 + 리그 배열 중복 등)"""
+    records = {}
+    for match in RECORD_PATTERN.finditer(content):
+        player_id = int(match['id'])
+        if player_id in records:
+            continue
+        body = ' '.join(match.group(0).split())
+        records[player_id] = Record(
+            name=_literal(match['name']),
+            korean_name=_literal(match['korean']),
+            digest=hashlib.blake2b(body.encode('utf-8'), digest_size=8).digest(),
+        )
+    return records
+
+
+def diff_records(old: dict, new: dict) -> RecordDiff:
+    diff = RecordDiff()
+    for player_id, record in new.items():
+        before = old.get(player_id)
+        if before is None:
+            diff.added.append((player_id, record.name))
+        elif before.digest == record.digest:
+            diff.unchanged += 1
+        else:
+            touched = False
+            if before.name != record.name:
+                diff.renamed.append((player_id, before.name, record.name))
+                touched = True
+            if before.korean_name != record.korean_name:
+                diff.korean_changed.append((player_id, record.name, before.korean_name, record.korean_name))
+                touched = True
+            if not touched:
+                diff.other_changed += 1
+    diff.removed = [(player_id, record.name) for player_id, record in old.items() if player_id not in new]
+    return diff
+
+
+def diff_contents(old_content: str, new_content: str) -> RecordDiff:
+    return diff_records(parse_records(old_content), parse_records(new_content))
+
+
+def format_diff(label: str, diff: RecordDiff, limit: int = 10) -> str:
+    if not diff.changed:
+        return f"= {label}: no changes ({diff.unchanged} players)"
+
+    lines = [
+        f"~ {label}: +{len(diff.added)} added, -{len(diff.removed)} removed, {len(diff.renamed)} renamed, "
+        f"{len(diff.korean_changed)} korean_name changed, {diff.other_changed} other, {diff.unchanged} unchanged"
+    ]
+    for player_id, name in diff.added[:limit]:
+        lines.append(f"  + {player_id} {name}")
+    for player_id, name in diff.removed[:limit]:
+        lines.append(f"  - {player_id} {name}")
+    for player_id, old, new in diff.renamed[:limit]:
+        lines.append(f"  ~ {player_id} name: {old} → {new}")
+    for player_id, name, old, new in diff.korean_changed[:limit]:
+        lines.append(f"  ~ {player_id} {name}: {old} → {new}")
+    hidden = sum(max(0, len(items) - limit) for items in (diff.added, diff.removed, diff.renamed, diff.korean_changed))
+    if hidden:
+        lines.append(f"  ... {hidden} more")
+    return '\n'.join(lines)
+
+
+def preview_or_write(path, content: str, dry_run: bool) -> RecordDiff:
+    """dry_run 이면 현재 파일과 비교해 요약만 출력, 아니면 파일에 쓴다. 어느 쪽이든 diff 반환"""
+    path = Path(path)
+    try:
+        current = path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        current = ''
+    diff = diff_contents(current, content)
+
+    if dry_run:
+        print(format_diff(str(path), diff))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    return diff
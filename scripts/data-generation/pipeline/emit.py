@@ -0,0 +1,220 @@
+"""
+PlayerMapping TypeScript 파일 생성
+
+리그 파일 하나에 다음을 함께 출력한다:
+- <LEAGUE>_PLAYERS: 리그 전체 선수 배열 (팀 순서). 유일한 backing 배열
+- <TEAM>_PLAYERS: 기존 팀별 export 호환. backing 배열의 slice 라 선수 객체를 새로 만들지 않는다
+- <LEAGUE>_TEAM_RANGES: team_id → [start, end) (backing 배열 인덱스)
+- <LEAGUE>_PLAYERS_BY_ID: player id → 선수 (frozen, O(1) 조회, 모듈 초기화 때 Map/.find 불필요)
+
+예전처럼 팀 배열을 먼저 만들고 리그 배열을 [...A, ...B] 로 펼치면 import 시점에 배열이 한 번 더 복사된다.
+
+사용법:
+    python -m pipeline emit --league j1-league --out ../../src/domains/livescore/constants/players/j1-league.ts
+    python -m pipeline emit --league j1-league --out ... --dedupe   # 리그 간 중복 선수는 대표 팀에만 (pipeline.player_index)
+    python -m pipeline emit --league saudi-pro-league --league j1-league --out <players 디렉터리> --dry-run
+
+리그마다 모듈 크기(raw/gzip/brotli)를 재서 리그별 예산과 비교한다 (pipeline.bundle, --parse / --budget-mode fail).
+"""
+
+import json
+import re
+from pathlib import Path
+
+from . import config
+from .bundle import BudgetExceeded, check_bundle
+from .dry_run import preview_or_write
+from .fetcher import _atomic_write
+from .leagues import get_league
+from .records import PlayerRecord, read_snapshot
+from .report import RunReport
+
+
+def const_name(name: str) -> str:
+    """'Yokohama F. Marinos' → 'YOKOHAMA_F_MARINOS'"""
+    return re.sub(r'[^A-Z0-9]+', '_', name.upper()).strip('_')
+
+
+def ts_string(value) -> str:
+    # JSON 문자열 리터럴은 그대로 TS 문자열 리터럴 (따옴표/역슬래시 이스케이프 포함)
+    return 'null' if value is None else json.dumps(value, ensure_ascii=False)
+
+
+def ts_number(value) -> str:
+    return 'null' if value is None else str(int(value))
+
+
+def player_line(player: PlayerRecord) -> str:
+    return (
+        f"  {{ id: {player.id}, name: {ts_string(player.name)}, korean_name: {ts_string(player.korean_name)}, "
+        f"team_id: {player.team_id}, position: {ts_string(player.position)}, "
+        f"number: {ts_number(player.number)}, age: {ts_number(player.age)} }},"
+    )
+
+
+def duplicate_ids(teams: list) -> list:
+    """리그 안에서 두 팀 이상에 등장하는 player id (BY_ID 는 첫 소속을 가리킨다)"""
+    seen = set()
+    duplicates = []
+    for team in teams:
+        for player in team['players']:
+            if player.id in seen:
+                duplicates.append(player.id)
+            seen.add(player.id)
+    return duplicates
+
+
+def render_player_module(league_const: str, teams: list, header: list = ()) -> str:
+    """teams: [{team_id, const_name, comment, players: [PlayerRecord]}] (korean_name 이 채워진 레코드)"""
+    all_const = f'{league_const}_PLAYERS'
+    lines = ["import { PlayerMapping } from './index';", '']
+    lines.extend(f'// {text}' if text else '' for text in header)
+    if header:
+        lines.append('')
+
+    ranges = []
+    by_id = {}
+    index = 0
+
+    lines.append('// 리그 전체 선수 (팀 순서). 아래 팀별 배열과 조회 테이블은 모두 이 배열을 가리킨다')
+    lines.append(f'export const {all_const}: PlayerMapping[] = [')
+    for team in teams:
+        start = index
+        lines.append(f"  // {team['comment']}")
+        for player in team['players']:
+            lines.append(player_line(player))
+            by_id.setdefault(player.id, index)
+            index += 1
+        ranges.append((team, start, index))
+    lines.append('];')
+    lines.append('')
+
+    for team, start, end in ranges:
+        lines.append(f"// {team['comment']}")
+        lines.append(f"export const {team['const_name']}_PLAYERS: PlayerMapping[] = {all_const}.slice({start}, {end});")
+    lines.append('')
+
+    lines.append(f'// team_id → [start, end) ({all_const} 인덱스)')
+    lines.append(
+        f'export const {league_const}_TEAM_RANGES: Readonly<Record<number, readonly [number, number]>> = Object.freeze({{'
+    )
+    for team, start, end in ranges:
+        lines.append(f"  {team['team_id']}: [{start}, {end}],")
+    lines.append('});')
+    lines.append('')
+
+    lines.append('// player id → 선수 (여러 팀에 있으면 첫 소속)')
+    lines.append(
+        f'export const {league_const}_PLAYERS_BY_ID: Readonly<Record<number, PlayerMapping>> = Object.freeze({{'
+    )
+    for player_id, position in by_id.items():
+        lines.append(f'  {player_id}: {all_const}[{position}],')
+    lines.append('});')
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def snapshot_teams(league_key: str, snapshot: list, index=None, dry_run: bool = False) -> list:
+    """fetch 스냅샷(read_snapshot) → render_player_module 입력 (이름은 리그 resolver 로 한 번에 번역)
+
+    index(PlayerIndex) 가 있으면 대표 팀이 이 팀이 아닌 선수는 빼고, 번역은 인덱스 결과를 쓴다.
+    dry_run 이면 LLM 호출/검수 큐 기록 없이 번역한다 (build_resolver 참고).
+    """
+    if index is None:
+        from .translate import get_resolver
+
+        names = [player.name for team in snapshot for player in team['players']]
+        resolved = get_resolver(league_key, dry_run).resolve_many(names)
+
+    teams = []
+    for team in snapshot:
+        players = []
+        for player in team['players']:
+            if index is not None:
+                if not index.is_canonical(player.id, league_key, team['team_id']):
+                    continue
+                korean_name = index[player.id].korean_name
+            else:
+                resolution = resolved[player.name]
+                korean_name = resolution.korean if resolution else player.name
+            players.append(PlayerRecord(player.id, player.name, korean_name, team['team_id'], player.position,
+                                        player.number, player.age))
+        teams.append({
+            'team_id': team['team_id'],
+            'const_name': const_name(team['team_name']),
+            'comment': f"{team['team_name']} - Team ID: {team['team_id']} - {len(players)}명",
+            'players': players,
+        })
+    return teams
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('emit', help='스냅샷으로 PlayerMapping TypeScript 파일 생성 (id/팀 조회 테이블 포함)')
+    parser.add_argument('--league', action='append', required=True, help='리그 key (여러 번 지정 가능)')
+    parser.add_argument('--snapshot', type=Path, default=None, help='기본: .pipeline-cache/snapshots/<league>.json (리그 1개일 때만)')
+    parser.add_argument('--out', type=Path, required=True, help='출력 파일. 리그가 여러 개면 디렉터리 (<out>/<league>.ts)')
+    parser.add_argument('--dedupe', action='store_true',
+                        help='모든 리그 스냅샷의 player_id 인덱스로 다른 팀/리그와 겹치는 선수는 대표 팀에만 출력')
+    parser.add_argument('--dry-run', action='store_true', help='파일을 쓰지 않고 현재 파일과 선수 단위 diff 요약만 출력')
+    parser.add_argument('--parse', action='store_true', help='node 로 모듈 파싱/평가 시간도 측정 (pipeline.bundle)')
+    parser.add_argument('--budget-mode', choices=['report', 'fail'], default=None,
+                        help='모듈 크기 예산 초과 시 동작 (기본: PIPELINE_BUNDLE_BUDGET 또는 report)')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    if len(args.league) > 1 and args.snapshot:
+        raise SystemExit('--snapshot can only be used with a single --league')
+    leagues = [get_league(key) for key in args.league]
+
+    snapshots = {}
+    for league in leagues:
+        snapshot_path = Path(args.snapshot or config.SNAPSHOT_DIR / f"{league['key']}.json")
+        snapshots[league['key']] = (read_snapshot(snapshot_path), int(snapshot_path.stat().st_mtime))
+
+    index = None
+    if args.dedupe:
+        from .player_index import PlayerIndex, load_snapshots
+
+        from .translate import get_resolver
+
+        index = PlayerIndex({**load_snapshots(), **snapshots})
+        index.translate(lambda league: get_resolver(league, args.dry_run), leagues=set(snapshots))
+
+    report = RunReport('emit')
+    for league in leagues:
+        out = args.out if len(leagues) == 1 else args.out / f"{league['key']}.ts"
+        try:
+            emit_league(league, snapshots[league['key']][0], out, index, args.dry_run,
+                        bundle={'parse': args.parse, 'mode': args.budget_mode, 'report': report})
+        except BudgetExceeded as e:
+            raise SystemExit(f'{e} — {out} not written')
+
+    if not args.dry_run:
+        from .translate import get_resolver
+
+        for league in leagues:
+            get_resolver(league['key']).record(report)
+        print(f"✓ Report: {report.write()}")
+
+
+def emit_league(league: dict, snapshot: list, out: Path, index=None, dry_run: bool = False, bundle: dict = None):
+    """bundle: check_bundle 인자 (parse, mode, report). 예산 초과로 실패하면 파일을 쓰지 않는다"""
+    teams = snapshot_teams(league['key'], snapshot, index, dry_run)
+    content = render_player_module(const_name(league['key']), teams,
+                                   header=[f"{league['name']} ({league['korean']}) Player Mappings"])
+    check_bundle(out, content, league['key'], **(bundle or {}))
+
+    if dry_run:
+        preview_or_write(out, content, dry_run=True)
+        return
+    out.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(out, content.encode('utf-8'))
+
+    if index is not None:
+        dropped = sum(len(team['players']) for team in snapshot) - sum(len(team['players']) for team in teams)
+        print(f"✓ Dedupe: {dropped} squad row(s) emitted under their canonical team instead")
+    duplicates = duplicate_ids(teams)
+    if duplicates:
+        print(f"⚠ {len(duplicates)} player id(s) appear in more than one team (BY_ID keeps the first): {duplicates[:10]}")
+    print(f"✓ {out}: {len(teams)} teams, {sum(len(t['players']) for t in teams)} players")
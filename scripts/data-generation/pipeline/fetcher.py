@@ -0,0 +1,292 @@
+"""
+API-Football 스쿼드 fetcher
+
+fetch_saudi_data.js / generate_saudi_pro_league.js 처럼 리그마다 순차 요청하고 매번 전체를 다시 받는 대신:
+- HttpPool 로 커넥션을 재사용하고
+- 엔드포인트별 토큰 버킷으로 요청 속도를 제한하며, 일일 할당량(x-ratelimit-requests-remaining)을 지키고
+- 응답을 URL 기준 디스크 캐시에 ETag/Last-Modified 와 함께 저장해 재동기화 시 조건부 요청(304)만 보낸다.
+
+결과는 리그별 스냅샷 JSON 으로 저장된다 (build_saudi_file.py 입력 형식과 동일):
+    [{"team_id": 2929, "team_name": "...", "players": [{"id": 1, "name": "...", ...}]}]
+응답의 선수는 받자마자 PlayerRecord(pipeline.records)로 줄여 들고 다닌다.
+
+사용법:
+    python -m pipeline fetch --league saudi-pro-league --league j1-league --season 2025
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import urlencode
+
+from . import config
+from .http_client import HttpPool
+from .leagues import get_league
+from .records import PlayerRecord, intern, snapshot_json
+
+# 엔드포인트별 초당 요청 수 (API-Football 분당 제한 기준)
+ENDPOINT_RATE_LIMITS = {
+    'teams': 2.0,
+    'players/squads': 5.0,
+    'players/profiles': 5.0,
+}
+DEFAULT_RATE_LIMIT = 5.0
+
+# 일일 잔여 할당량이 이 값 이하로 떨어지면 더 요청하지 않음 (footballApi.ts 경고 기준과 동일)
+DEFAULT_QUOTA_RESERVE = 100
+
+MAX_ATTEMPTS = 3
+RETRY_DELAYS = [0.3, 1.2]
+RETRYABLE_STATUS = {429, 502, 503, 504}
+
+
+class QuotaExceeded(RuntimeError):
+    """일일 할당량 또는 실행당 요청 한도를 다 쓴 경우"""
+
+
+class ApiError(RuntimeError):
+    pass
+
+
+class RateLimiter:
+    """토큰 버킷 (스레드 안전). acquire() 는 토큰이 생길 때까지 대기"""
+
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: bytes
+    etag: str = None
+    last_modified: str = None
+
+
+class ResponseCache:
+    """URL 별 응답 본문 + 검증자(ETag/Last-Modified) 디스크 캐시"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.directory / f'{key}.json', self.directory / f'{key}.body'
+
+    def load(self, url: str):
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            body = body_path.read_bytes()
+        except (FileNotFoundError, ValueError):
+            return None
+        if meta.get('url') != url:
+            return None
+        return CachedResponse(url=url, body=body, etag=meta.get('etag'), last_modified=meta.get('last_modified'))
+
+    def store(self, url: str, body: bytes, etag: str = None, last_modified: str = None):
+        meta_path, body_path = self._paths(url)
+        _atomic_write(body_path, body)
+        meta = {'url': url, 'etag': etag, 'last_modified': last_modified, 'stored_at': time.time()}
+        _atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+
+
+def _atomic_write(path: Path, data: bytes):
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+@dataclass
+class FetchStats:
+    requests: int = 0
+    not_modified: int = 0
+    downloaded_bytes: int = 0
+    retries: int = 0
+    quota_remaining: int = None
+
+
+class ApiFootballFetcher:
+    """API-Football GET 요청 (커넥션 풀 + 속도 제한 + 할당량 + 조건부 캐시)"""
+
+    def __init__(self, base_url: str = None, api_key: str = None, cache_dir: Path = None,
+                 pool: HttpPool = None, rate_limits: dict = None,
+                 quota_reserve: int = DEFAULT_QUOTA_RESERVE, max_requests: int = None):
+        self.base_url = (base_url or config.API_BASE_URL).rstrip('/')
+        self.api_key = api_key if api_key is not None else config.api_key()
+        self.cache = ResponseCache(cache_dir or config.CACHE_DIR / 'http')
+        self.pool = pool or HttpPool()
+        self.rate_limits = {**ENDPOINT_RATE_LIMITS, **(rate_limits or {})}
+        self.quota_reserve = quota_reserve
+        self.max_requests = max_requests
+        self.stats = FetchStats()
+        self._limiters = {}
+        self._lock = threading.Lock()
+
+    def _limiter(self, endpoint: str) -> RateLimiter:
+        with self._lock:
+            if endpoint not in self._limiters:
+                self._limiters[endpoint] = RateLimiter(self.rate_limits.get(endpoint, DEFAULT_RATE_LIMIT))
+            return self._limiters[endpoint]
+
+    def build_url(self, endpoint: str, params: dict = None) -> str:
+        # 파라미터 알파벳 순 정렬 → 같은 요청은 항상 같은 캐시 키 (footballApi.ts 와 동일)
+        query = urlencode(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+        return f'{self.base_url}/{endpoint}?{query}' if query else f'{self.base_url}/{endpoint}'
+
+    def _reserve_request(self):
+        with self._lock:
+            if self.max_requests is not None and self.stats.requests >= self.max_requests:
+                raise QuotaExceeded(f'Request budget exhausted ({self.max_requests})')
+            remaining = self.stats.quota_remaining
+            if remaining is not None and remaining <= self.quota_reserve:
+                raise QuotaExceeded(f'Daily quota reserve reached (remaining: {remaining})')
+            self.stats.requests += 1
+
+    def _record_quota(self, response):
+        remaining = response.header('x-ratelimit-requests-remaining')
+        if remaining is None:
+            return
+        try:
+            value = int(remaining)
+        except ValueError:
+            return
+        with self._lock:
+            if self.stats.quota_remaining is None or value < self.stats.quota_remaining:
+                self.stats.quota_remaining = value
+
+    def get(self, endpoint: str, params: dict = None) -> dict:
+        url = self.build_url(endpoint, params)
+        cached = self.cache.load(url)
+
+        headers = {'x-rapidapi-host': config.API_HOST, 'x-rapidapi-key': self.api_key}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            self._limiter(endpoint).acquire()
+            self._reserve_request()
+            response = self.pool.request('GET', url, headers=headers)
+            self._record_quota(response)
+
+            if response.status == 304 and cached:
+                with self._lock:
+                    self.stats.not_modified += 1
+                return json.loads(cached.body)
+
+            if response.status == 200:
+                data = json.loads(response.body)
+                # HTTP 200 이어도 body 에 에러가 있을 수 있음
+                if data.get('errors') and isinstance(data['errors'], (dict, list)) and len(data['errors']) > 0:
+                    raise ApiError(f'API-Football error for {endpoint}: {json.dumps(data["errors"], ensure_ascii=False)}')
+                with self._lock:
+                    self.stats.downloaded_bytes += len(response.body)
+                self.cache.store(url, response.body, response.header('etag'), response.header('last-modified'))
+                return data
+
+            if response.status in RETRYABLE_STATUS and attempt < MAX_ATTEMPTS:
+                with self._lock:
+                    self.stats.retries += 1
+                time.sleep(RETRY_DELAYS[attempt - 1])
+                continue
+
+            raise ApiError(f'API-Football {response.status} for {url}')
+
+        raise ApiError(f'API-Football request failed: {endpoint}')
+
+
+def _squad_players(squad: dict, team_id: int) -> list:
+    return [PlayerRecord.from_squad(p, team_id) for p in squad.get('players') or []]
+
+
+def fetch_leagues(fetcher: ApiFootballFetcher, league_keys: list, season: int, workers: int = 8) -> dict:
+    """여러 리그의 팀 목록 → 전체 스쿼드를 하나의 스레드 풀에서 동시에 가져옴
+
+    반환: {league_key: [{'team_id', 'team_name', 'players': [PlayerRecord]}]}
+    """
+    leagues = [get_league(key) for key in league_keys]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        team_lists = list(executor.map(
+            lambda league: fetcher.get('teams', {'league': league['league_id'], 'season': season}),
+            leagues,
+        ))
+
+        jobs = []
+        for league, data in zip(leagues, team_lists):
+            for entry in data.get('response') or []:
+                team = entry.get('team') or {}
+                jobs.append((league['key'], team.get('id'), team.get('name')))
+
+        squads = list(executor.map(lambda job: fetcher.get('players/squads', {'team': job[1]}), jobs))
+
+    result = {league['key']: [] for league in leagues}
+    for (league_key, team_id, team_name), data in zip(jobs, squads):
+        squad = (data.get('response') or [{}])[0]
+        result[league_key].append({'team_id': team_id, 'team_name': intern(team_name),
+                                   'players': _squad_players(squad, team_id)})
+    return result
+
+
+def write_snapshots(leagues: dict, directory: Path = None) -> list:
+    """리그별 스냅샷 JSON 저장. 저장한 경로 목록 반환"""
+    directory = Path(directory or config.SNAPSHOT_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for league_key, teams in leagues.items():
+        path = directory / f'{league_key}.json'
+        _atomic_write(path, json.dumps(snapshot_json(teams), ensure_ascii=False, indent=2).encode('utf-8'))
+        paths.append(path)
+    return paths
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('fetch', help='API-Football 스쿼드를 가져와 리그별 스냅샷 저장')
+    parser.add_argument('--league', action='append', required=True, help='리그 key (여러 번 지정 가능)')
+    parser.add_argument('--season', type=int, required=True)
+    parser.add_argument('--base-url', default=None, help='API 주소 (로컬 stand-in 서버 테스트용)')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--max-requests', type=int, default=None, help='이번 실행에서 보낼 최대 요청 수')
+    parser.add_argument('--quota-reserve', type=int, default=DEFAULT_QUOTA_RESERVE)
+    parser.add_argument('--out', type=Path, default=None, help='스냅샷 디렉터리')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    with HttpPool(max_per_host=args.workers) as pool:
+        fetcher = ApiFootballFetcher(base_url=args.base_url, pool=pool,
+                                     quota_reserve=args.quota_reserve, max_requests=args.max_requests)
+        leagues = fetch_leagues(fetcher, args.league, args.season, workers=args.workers)
+        paths = write_snapshots(leagues, args.out)
+
+    for path in paths:
+        print(f"✓ Snapshot: {path}")
+    stats = asdict(fetcher.stats)
+    print(f"✓ Requests: {stats['requests']} (304 Not Modified: {stats['not_modified']}, retries: {stats['retries']})")
+    print(f"✓ Downloaded: {stats['downloaded_bytes']:,} bytes, connections opened: {pool.connections_opened}")
+    if stats['quota_remaining'] is not None:
+        print(f"✓ Daily quota remaining: {stats['quota_remaining']}")
@@ -0,0 +1,117 @@
+"""
+호스트별 keep-alive 커넥션을 재사용하는 HTTP 클라이언트
+
+urllib.request 는 요청마다 새 TCP/TLS 연결을 맺기 때문에, 같은 호스트로 수백 번 요청하는
+fetch/사진 단계에서는 http.client 커넥션을 풀에 보관해 재사용한다. 스레드 안전.
+"""
+
+import http.client
+import queue
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+# 재사용한 커넥션이 서버 쪽에서 이미 닫혔을 때 발생하는 예외 (새 커넥션으로 1회 재시도)
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: dict = field(default_factory=dict)  # 헤더 이름은 소문자
+    body: bytes = b''
+
+    def header(self, name: str, default=None):
+        return self.headers.get(name.lower(), default)
+
+
+class HttpPool:
+    """(scheme, host, port) 별 커넥션 풀. 호스트당 동시 연결 수는 max_per_host 로 제한"""
+
+    def __init__(self, max_per_host: int = 8, timeout: float = 20.0):
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._slots = {}
+        self.connections_opened = 0
+
+    def _host_state(self, key):
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue()
+                self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return self._idle[key], self._slots[key]
+
+    def _connect(self, scheme: str, host: str, port):
+        with self._lock:
+            self.connections_opened += 1
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def request(self, method: str, url: str, headers: dict = None, body: bytes = None) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        key = (scheme, parts.hostname, parts.port)
+        path = parts.path or '/'
+        if parts.query:
+            path = f'{path}?{parts.query}'
+
+        idle, slots = self._host_state(key)
+        with slots:
+            try:
+                conn, reused = idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._connect(scheme, parts.hostname, parts.port), False
+
+            try:
+                response = self._send(conn, method, path, headers, body)
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                conn = self._connect(scheme, parts.hostname, parts.port)
+                response = self._send(conn, method, path, headers, body)
+            except Exception:
+                conn.close()
+                raise
+
+            if response.header('connection', '').lower() == 'close':
+                conn.close()
+            else:
+                idle.put(conn)
+            return response
+
+    @staticmethod
+    def _send(conn, method, path, headers, body) -> HttpResponse:
+        conn.request(method, path, body=body, headers=headers or {})
+        raw = conn.getresponse()
+        data = raw.read()
+        return HttpResponse(
+            status=raw.status,
+            headers={k.lower(): v for k, v in raw.getheaders()},
+            body=data,
+        )
+
+    def close(self):
+        with self._lock:
+            pools = list(self._idle.values())
+        for idle in pools:
+            while True:
+                try:
+                    idle.get_nowait().close()
+                except queue.Empty:
+                    break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,20 @@
+"""
+파이프라인이 다루는 리그 목록
+
+key 는 CLI 인자(--league)와 스냅샷 파일명에 쓰이고, league_id 는 API-Football 리그 ID.
+"""
+
+LEAGUES = {
+    'saudi-pro-league': {'league_id': 307, 'name': 'Saudi Pro League', 'korean': '사우디 프로리그'},
+    'j1-league': {'league_id': 98, 'name': 'J1 League', 'korean': 'J1리그'},
+    'eredivisie': {'league_id': 88, 'name': 'Eredivisie', 'korean': '에레디비시'},
+    'primeira-liga': {'league_id': 94, 'name': 'Primeira Liga', 'korean': '프리메이라리가'},
+    'mls': {'league_id': 253, 'name': 'MLS', 'korean': 'MLS'},
+}
+
+
+def get_league(key: str) -> dict:
+    """리그 key 로 설정 조회 (없으면 ValueError)"""
+    if key not in LEAGUES:
+        raise ValueError(f"Unknown league '{key}' (available: {', '.join(sorted(LEAGUES))})")
+    return {'key': key, **LEAGUES[key]}
@@ -0,0 +1,90 @@
+"""
+콘텐츠 주소 기반 오브젝트 저장소
+
+키는 호출하는 쪽이 콘텐츠 해시로 만든다 (같은 이미지는 같은 키 → 한 번만 저장).
+- LocalObjectStore: 로컬 디렉터리
+- S3ObjectStore: S3 호환 엔드포인트에 path-style PUT/HEAD (로컬 stand-in 또는 서명 없는 게이트웨이)
+"""
+
+import os
+from pathlib import Path
+from urllib.parse import quote
+
+from .http_client import HttpPool
+
+
+class ObjectStoreError(RuntimeError):
+    pass
+
+
+class LocalObjectStore:
+    def __init__(self, root: Path, public_base_url: str = None):
+        self.root = Path(root)
+        self.public_base_url = (public_base_url or self.root.resolve().as_uri()).rstrip('/')
+
+    def exists(self, key: str) -> bool:
+        return (self.root / key).exists()
+
+    def put(self, key: str, data: bytes, content_type: str = None):
+        path = self.root / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def get(self, key: str) -> bytes:
+        return (self.root / key).read_bytes()
+
+    def public_url(self, key: str) -> str:
+        return f'{self.public_base_url}/{key}'
+
+
+class S3ObjectStore:
+    def __init__(self, endpoint: str, bucket: str, public_base_url: str = None,
+                 pool: HttpPool = None, headers: dict = None):
+        self.endpoint = endpoint.rstrip('/')
+        self.bucket = bucket
+        self.public_base_url = (public_base_url or f'{self.endpoint}/{bucket}').rstrip('/')
+        self.pool = pool or HttpPool()
+        self.headers = headers or {}
+
+    def _url(self, key: str) -> str:
+        return f'{self.endpoint}/{self.bucket}/{quote(key)}'
+
+    def exists(self, key: str) -> bool:
+        response = self.pool.request('HEAD', self._url(key), headers=self.headers)
+        if response.status == 404:
+            return False
+        if response.status >= 400:
+            raise ObjectStoreError(f'HEAD {key} failed ({response.status})')
+        return True
+
+    def put(self, key: str, data: bytes, content_type: str = None):
+        headers = {**self.headers, 'Content-Length': str(len(data))}
+        if content_type:
+            headers['Content-Type'] = content_type
+        response = self.pool.request('PUT', self._url(key), headers=headers, body=data)
+        if response.status >= 400:
+            raise ObjectStoreError(f'PUT {key} failed ({response.status})')
+
+    def get(self, key: str) -> bytes:
+        response = self.pool.request('GET', self._url(key), headers=self.headers)
+        if response.status >= 400:
+            raise ObjectStoreError(f'GET {key} failed ({response.status})')
+        return response.body
+
+    def public_url(self, key: str) -> str:
+        return f'{self.public_base_url}/{key}'
+
+
+def open_store(spec: str, public_base_url: str = None, pool: HttpPool = None):
+    """'local:<dir>' 또는 's3:<endpoint>/<bucket>' 형식의 저장소 지정"""
+    kind, _, target = spec.partition(':')
+    if kind == 'local':
+        return LocalObjectStore(Path(target), public_base_url)
+    if kind == 's3':
+        endpoint, _, bucket = target.rstrip('/').rpartition('/')
+        if not endpoint or not bucket:
+            raise ValueError(f"Invalid s3 store '{spec}' (expected s3:<endpoint>/<bucket>)")
+        return S3ObjectStore(endpoint, bucket, public_base_url, pool=pool)
+    raise ValueError(f"Unknown object store '{spec}' (expected local:<dir> or s3:<endpoint>/<bucket>)")
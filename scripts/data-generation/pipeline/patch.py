@@ -0,0 +1,186 @@
+"""
+리그 선수 파일 korean_name 일괄 패치
+
+translate_eredivisie_full.py / translate_eredivisie_players.py 는 eredivisie.ts 한 파일만 한 스레드로 고친다.
+이 단계는 glob 으로 지정한 리그 파일 전체의 korean_name 을 한 번에 채우거나(null 만) 다시 번역한다(--refresh).
+새 사전을 모든 리그에 반영할 때 한 번 실행하면 된다.
+
+- 리그는 파일명(<league>.ts)으로 정한다. 리그 파일이 아니면 건너뛰고, --league 로 지정할 수 있다
+- 먼저 모든 파일의 이름을 리그별로 모아 리그마다 resolve_many 를 한 번 → 캐시/유사 이름/LLM tier 는 리그 단위
+  배치로 한 번만 탄다. 리그 resolver 들은 영구 캐시, fuzzy tier, 검수 큐를 공유한다 (translate.profiles)
+- 그 다음 파일을 worker 스레드에서 병렬로 패치 (resolver 메모 적중). korean_name 값만 바꾸고 다른 필드,
+  줄 배치, 줄바꿈(CRLF)은 그대로 둔다
+- 번역이 없으면 기존 값 유지. --refresh 는 기존 값과 다른 번역이 나온 선수만 교체
+- 파일별 리포트: 선수 수, 채움, 교체, 미번역, 검수 필요, 소요 시간
+- 쓰기 전에 대상 파일을 백업 저장소(pipeline.backup)에 남긴다 → python -m pipeline restore --run <id>
+- TS 파일만 고치고 DB 의 korean_name 은 쓰지 않으므로 SEO 품질 플래그(seo_worthless)는 다시 계산하지 않는다
+
+사용법:
+    python -m pipeline patch "../../src/domains/livescore/constants/players/*.ts" [--refresh] [--workers 8] [--dry-run]
+"""
+
+import glob
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .backup import backup_files
+from .dry_run import RECORD_PATTERN, RecordDiff, _literal, diff_contents, format_diff
+from .emit import ts_string
+from .fetcher import _atomic_write
+from .leagues import LEAGUES
+from .report import RunReport
+
+DEFAULT_WORKERS = 8
+
+
+@dataclass
+class PatchResult:
+    path: Path
+    league: str
+    records: int = 0
+    filled: int = 0
+    refreshed: int = 0
+    unresolved: int = 0
+    needs_review: int = 0
+    seconds: float = 0.0
+    diff: RecordDiff = None
+
+    @property
+    def changed(self) -> int:
+        return self.filled + self.refreshed
+
+
+def expand_paths(patterns) -> list:
+    """glob 패턴(셸이 펼친 경로 포함) → 중복 없는 파일 목록 (정렬)"""
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(str(pattern), recursive=True)
+        paths.update(Path(match) for match in (matches or [pattern]) if Path(match).is_file())
+    return sorted(paths)
+
+
+def wanted_names(content: str, refresh: bool) -> list:
+    """번역할 이름 (null 인 선수, refresh 면 전체)"""
+    names = {}
+    for match in RECORD_PATTERN.finditer(content):
+        if refresh or match['korean'] == 'null':
+            names[_literal(match['name'])] = None
+    return list(names)
+
+
+def patch_content(content: str, resolutions: dict, refresh: bool, result: PatchResult) -> str:
+    """korean_name 값만 바꾼 내용. 같은 id 가 여러 배열에 나오면 모두 같은 값으로 바뀐다"""
+    seen = set()
+
+    def replace(match):
+        current = _literal(match['korean'])
+        if current is not None and not refresh:
+            return match.group(0)
+        name = _literal(match['name'])
+        resolution = resolutions.get(name)
+        first = match['id'] not in seen
+        seen.add(match['id'])
+        if resolution is None:
+            result.unresolved += first
+            return match.group(0)
+        if resolution.korean == current:
+            return match.group(0)
+        if first:
+            result.needs_review += resolution.needs_review
+            if current is None:
+                result.filled += 1
+            else:
+                result.refreshed += 1
+        text = match.group(0)
+        start, end = match.start('korean') - match.start(), match.end('korean') - match.start()
+        return text[:start] + ts_string(resolution.korean) + text[end:]
+
+    return RECORD_PATTERN.sub(replace, content)
+
+
+def patch_file(path: Path, league: str, content: str, resolver, refresh: bool = False,
+               dry_run: bool = False) -> PatchResult:
+    started = time.perf_counter()
+    result = PatchResult(path, league)
+    result.records = len({match['id'] for match in RECORD_PATTERN.finditer(content)})
+    names = wanted_names(content, refresh)
+    resolutions = resolver.resolve_many(names) if names else {}
+    patched = patch_content(content, resolutions, refresh, result)
+    result.diff = diff_contents(content, patched)
+    if patched != content and not dry_run:
+        _atomic_write(path, patched.encode('utf-8'))
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('patch', help='리그 선수 파일 여러 개의 korean_name 을 병렬로 채움/재번역')
+    parser.add_argument('files', nargs='+', help='리그 .ts 파일 또는 glob 패턴')
+    parser.add_argument('--league', default=None, choices=sorted(LEAGUES), help='모든 파일에 쓸 리그 (기본: 파일명)')
+    parser.add_argument('--refresh', action='store_true', help='이미 있는 korean_name 도 다시 번역해 다르면 교체')
+    parser.add_argument('--tiers', default=None, help='tier 순서 덮어쓰기 (예: lexicon,cache,fuzzy)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='동시에 패치할 파일 수')
+    parser.add_argument('--dry-run', action='store_true', help='파일을 쓰지 않고 파일별 선수 diff 요약만 출력')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    from .translate import build_resolver, get_resolver
+
+    files = []
+    for path in expand_paths(args.files):
+        league = args.league or (path.stem if path.stem in LEAGUES else None)
+        if league is None:
+            print(f"⚠ Skipping {path}: not a league file (pass --league)")
+            continue
+        files.append((path, league, path.read_bytes().decode('utf-8')))
+    if not files:
+        raise SystemExit('No league files matched')
+
+    leagues = sorted({league for _, league, _ in files})
+    tiers = args.tiers.split(',') if args.tiers else None
+    # --dry-run 은 LLM 호출/검수 큐 기록 없이 (build_resolver 참고)
+    resolvers = {league: build_resolver(league, tiers, dry_run=args.dry_run) if tiers else get_resolver(league, args.dry_run)
+                 for league in leagues}
+    names = {league: {} for league in leagues}
+    for _, league, content in files:
+        names[league].update(dict.fromkeys(wanted_names(content, args.refresh)))
+
+    report = RunReport('patch')
+    if not args.dry_run:
+        report.section('patch')['backup_run'] = backup_files([path for path, _, _ in files], 'patch')['run']
+    workers = max(1, args.workers)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # 리그별 배치 번역으로 resolver 를 데운 뒤 파일 단위 패치 (메모 적중)
+        list(pool.map(lambda league: resolvers[league].resolve_many(list(names[league])), leagues))
+        warmed = time.perf_counter() - started
+        results = list(pool.map(lambda item: patch_file(item[0], item[1], item[2], resolvers[item[1]],
+                                                        args.refresh, args.dry_run), files))
+
+    for result in results:
+        if args.dry_run:
+            print(format_diff(str(result.path), result.diff))
+        print(f"✓ {result.path.name} ({result.league}): {result.records} players, {result.filled} filled, "
+              f"{result.refreshed} refreshed, {result.unresolved} unresolved, {result.needs_review} to review "
+              f"({result.seconds * 1000:.0f} ms)")
+        report.section(f'patch:{result.path.name}').update({
+            'league': result.league, 'records': result.records, 'filled': result.filled,
+            'refreshed': result.refreshed, 'unresolved': result.unresolved, 'needs_review': result.needs_review,
+            'ms': round(result.seconds * 1000, 3),
+        })
+
+    changed = sum(result.changed for result in results)
+    report.section('patch').update({
+        'files': len(results), 'files_changed': sum(1 for result in results if result.changed),
+        'players_changed': changed, 'unique_names': sum(len(values) for values in names.values()),
+        'workers': workers, 'warm_ms': round(warmed * 1000, 3),
+    })
+    for league in leagues:
+        resolvers[league].record(report)
+    verb = 'would change' if args.dry_run else 'changed'
+    print(f"✓ {len(results)} file(s), {changed} korean_name(s) {verb} "
+          f"(warm {warmed:.2f}s, total {time.perf_counter() - started:.2f}s, {workers} workers)")
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,283 @@
+"""
+선수 사진 캐싱 (photo_url → photo_cached_url)
+
+- 대상 판단은 DB 행이 기준: photo_cached_url 이 비었으면 대상, 채워져 있으면 이미 캐시된 것으로 본다.
+  sync 가 API 의 사진 URL 이 바뀐 선수의 photo_cached_url 을 비우므로 DB 만으로 판단된다.
+  progress.jsonl 은 보조 — 이 머신에서 캐시한 기록과 현재 photo_url 이 다르면 다시 받는다
+  (새 머신/CI 에서 progress 가 없어도 이미 캐시된 사진은 다시 받지 않음)
+- asyncio 세마포어로 동시 다운로드 수를 제한하고, 다운로드는 HttpPool 커넥션을 재사용
+- 콘텐츠 해시(sha256)를 키로 저장 → 같은 이미지(기본 실루엣 등)는 한 번만 업로드
+- 완료 항목을 progress.jsonl 에 즉시 기록 → 중단 후 다시 실행하면 이어서 진행
+- 실패(연결 오류, 200 이 아닌 응답, 빈 본문)도 progress 에 상태와 함께 남기고 리포트에 집계. 다음 실행에서
+  다시 시도하며, 같은 URL 이 전에 실패했으면 retried 로 센다
+- 저장소 업로드나 DB upsert 가 실패해도 그 선수(또는 그 flush 의 선수들)만 실패로 기록하고 나머지는 계속
+- photo_cached_url 은 flush 단위로 모아 bulk upsert. http(s) 가 아닌 주소는 쓰지 않는다
+  (local 저장소는 --public-base-url 필수 — 없으면 file:// 주소가 DB 에 들어감)
+
+사용법:
+    python -m pipeline photos --store local:./public-cache --public-base-url https://cdn.example.com/players
+    python -m pipeline photos --store s3:http://127.0.0.1:8062/player-photos
+"""
+
+import asyncio
+import hashlib
+import http.client
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from . import config
+from .db import DatabaseError, SupabaseRest, eq, not_is
+from .http_client import HttpPool
+from .object_store import ObjectStoreError, open_store
+from .report import RunReport
+
+PHOTO_COLUMNS = 'player_id,name,display_name,team_id,photo_url,photo_cached_url'
+DEFAULT_CONCURRENCY = 16
+FLUSH_EVERY = 200
+
+# 매직 바이트 → (확장자, content-type)
+IMAGE_SIGNATURES = [
+    (b'\x89PNG\r\n\x1a\n', 'png', 'image/png'),
+    (b'\xff\xd8\xff', 'jpg', 'image/jpeg'),
+    (b'GIF8', 'gif', 'image/gif'),
+]
+
+
+def sniff_image(data: bytes) -> tuple:
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'webp', 'image/webp'
+    for signature, ext, content_type in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return ext, content_type
+    return 'bin', 'application/octet-stream'
+
+
+def object_key(digest: str, ext: str) -> str:
+    return f'players/{digest[:2]}/{digest}.{ext}'
+
+
+class PhotoProgress:
+    """player_id → {photo_url, key} 완료 기록 + {photo_url, status, error} 실패 기록 (append-only JSONL)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries = {}
+        self.failures = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # 중단 시 잘린 마지막 줄
+                    if 'key' in entry:
+                        self.entries[entry['player_id']] = entry
+                        self.failures.pop(entry['player_id'], None)
+                    else:
+                        self.failures[entry['player_id']] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def get(self, player_id: int, photo_url: str):
+        entry = self.entries.get(player_id)
+        if entry and entry['photo_url'] == photo_url:
+            return entry
+        return None
+
+    def failed_before(self, player_id: int, photo_url: str) -> bool:
+        entry = self.failures.get(player_id)
+        return entry is not None and entry['photo_url'] == photo_url
+
+    def record(self, player_id: int, photo_url: str, key: str):
+        entry = {'player_id': player_id, 'photo_url': photo_url, 'key': key}
+        self.entries[player_id] = entry
+        self.failures.pop(player_id, None)
+        self._write(entry)
+
+    def record_failure(self, player_id: int, photo_url: str, status, error: str):
+        entry = {'player_id': player_id, 'photo_url': photo_url, 'status': status, 'error': error}
+        self.failures[player_id] = entry
+        self._write(entry)
+
+    def _write(self, entry: dict):
+        self._file.write(json.dumps(entry) + '\n')
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+@dataclass
+class PhotoStats:
+    candidates: int = 0
+    downloaded: int = 0
+    downloaded_bytes: int = 0
+    uploaded: int = 0
+    deduplicated: int = 0
+    resumed: int = 0
+    failed: int = 0
+    retried: int = 0
+    updated_rows: int = 0
+    already_cached: int = 0
+    source_changed: int = 0
+
+
+def needs_caching(row: dict, progress: PhotoProgress, stats: PhotoStats = None) -> bool:
+    """DB 의 photo_cached_url 이 기준. progress 는 원본 URL 이 바뀐 것을 알 때만 쓴다"""
+    if not row.get('photo_url'):
+        return False
+    if not row.get('photo_cached_url'):
+        return True
+    entry = progress.entries.get(row['player_id'])
+    changed = entry is not None and entry['photo_url'] != row['photo_url']
+    if stats is not None:
+        stats.source_changed += changed
+        stats.already_cached += not changed
+    return changed
+
+
+class PhotoCacher:
+    def __init__(self, store, pool: HttpPool, progress: PhotoProgress, db: SupabaseRest = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, flush_every: int = FLUSH_EVERY):
+        self.store = store
+        self.pool = pool
+        self.progress = progress
+        self.db = db
+        self.concurrency = concurrency
+        self.flush_every = flush_every
+        self.stats = PhotoStats()
+        self.failures = []
+        self._uploads = {}  # key → Task (같은 이미지 동시 업로드 방지)
+        self._pending = []
+        self._pending_sources = []  # _pending 과 같은 순서의 원본 행 (upsert 실패 기록용)
+
+    async def _store_once(self, key: str, data: bytes, content_type: str):
+        if await asyncio.to_thread(self.store.exists, key):
+            self.stats.deduplicated += 1
+            return
+        await asyncio.to_thread(self.store.put, key, data, content_type)
+        self.stats.uploaded += 1
+
+    def _fail(self, row: dict, status, error: str):
+        self.stats.failed += 1
+        self.failures.append({'player_id': row['player_id'], 'photo_url': row['photo_url'], 'status': status,
+                              'error': error})
+        self.progress.record_failure(row['player_id'], row['photo_url'], status, error)
+
+    async def _cache_one(self, row: dict, semaphore: asyncio.Semaphore):
+        if self.progress.failed_before(row['player_id'], row['photo_url']):
+            self.stats.retried += 1
+        entry = self.progress.get(row['player_id'], row['photo_url'])
+        if entry:
+            self.stats.resumed += 1
+            key = entry['key']
+        else:
+            async with semaphore:
+                try:
+                    response = await asyncio.to_thread(self.pool.request, 'GET', row['photo_url'])
+                except (OSError, http.client.HTTPException) as e:
+                    print(f"⚠ {row['player_id']}: {e}")
+                    self._fail(row, None, str(e))
+                    return
+                if response.status != 200 or not response.body:
+                    self._fail(row, response.status, 'empty body' if response.status == 200 else f'HTTP {response.status}')
+                    return
+                self.stats.downloaded += 1
+                self.stats.downloaded_bytes += len(response.body)
+
+                ext, content_type = sniff_image(response.body)
+                key = object_key(hashlib.sha256(response.body).hexdigest(), ext)
+                if key in self._uploads:
+                    self.stats.deduplicated += 1
+                else:
+                    self._uploads[key] = asyncio.ensure_future(self._store_once(key, response.body, content_type))
+                try:
+                    await self._uploads[key]
+                except (ObjectStoreError, OSError, http.client.HTTPException) as e:
+                    print(f"⚠ {row['player_id']}: store {key}: {e}")
+                    self._fail(row, None, f'store: {e}')
+                    return
+            self.progress.record(row['player_id'], row['photo_url'], key)
+
+        self._pending.append({
+            'player_id': row['player_id'],
+            'name': row['name'],
+            'display_name': row['display_name'],
+            'team_id': row['team_id'],
+            'photo_cached_url': self.store.public_url(key),
+        })
+        self._pending_sources.append(row)
+        if len(self._pending) >= self.flush_every:
+            await self.flush()
+
+    async def flush(self):
+        rows, self._pending = self._pending, []
+        sources, self._pending_sources = self._pending_sources, []
+        if rows and self.db is not None:
+            try:
+                await asyncio.to_thread(self.db.upsert, 'football_players', rows, 'player_id')
+            except (DatabaseError, OSError, http.client.HTTPException) as e:
+                # 업로드는 끝났으므로 다음 실행은 progress 에서 키를 이어받아 upsert 만 다시 한다
+                print(f"⚠ photo_cached_url upsert failed for {len(rows)} player(s): {e}")
+                for row in sources:
+                    self._fail(row, None, f'db: {e}')
+                return
+        self.stats.updated_rows += len(rows)
+
+    async def run(self, rows: list) -> PhotoStats:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            await asyncio.gather(*(self._cache_one(row, semaphore) for row in rows))
+        finally:
+            await self.flush()
+        return self.stats
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('photos', help='선수 사진을 오브젝트 저장소에 캐싱하고 photo_cached_url 갱신')
+    parser.add_argument('--store', required=True, help='local:<dir> 또는 s3:<endpoint>/<bucket>')
+    parser.add_argument('--public-base-url', default=None, help='photo_cached_url 에 쓸 공개 http(s) 주소 (local 저장소는 필수)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--limit', type=int, default=None, help='이번 실행에서 처리할 최대 선수 수')
+    parser.add_argument('--progress', type=Path, default=config.CACHE_DIR / 'photos' / 'progress.jsonl')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    with HttpPool(max_per_host=args.concurrency) as pool:
+        db = SupabaseRest.from_env(pool=pool)
+        store = open_store(args.store, args.public_base_url, pool=pool)
+        if not store.public_url('').startswith(('http://', 'https://')):
+            raise SystemExit(f"photo_cached_url would be {store.public_url('')}… — pass an http(s) --public-base-url "
+                             f"(required for local stores)")
+        progress = PhotoProgress(args.progress)
+        try:
+            rows = db.select_all('football_players', PHOTO_COLUMNS,
+                                 [eq('is_active', True), not_is('photo_url', None)], order=['player_id'])
+            cacher = PhotoCacher(store, pool, progress, db, concurrency=args.concurrency)
+            stats = cacher.stats
+            candidates = [row for row in rows if needs_caching(row, progress, stats)]
+            if args.limit is not None:
+                candidates = candidates[:args.limit]
+            stats.candidates = len(candidates)
+            asyncio.run(cacher.run(candidates))
+        finally:
+            progress.close()
+
+    print(f"✓ Candidates: {stats.candidates} (resumed from progress: {stats.resumed}, "
+          f"source URL changed: {stats.source_changed}, already cached in DB: {stats.already_cached})")
+    print(f"✓ Downloaded: {stats.downloaded} ({stats.downloaded_bytes:,} bytes)")
+    print(f"✓ Uploaded: {stats.uploaded}, deduplicated: {stats.deduplicated}")
+    print(f"✓ photo_cached_url updated: {stats.updated_rows}")
+    if stats.failed:
+        by_status = {}
+        for failure in cacher.failures:
+            by_status[str(failure['status'] or 'error')] = by_status.get(str(failure['status'] or 'error'), 0) + 1
+        print(f"⚠ Failed: {stats.failed} ({', '.join(f'{status}: {count}' for status, count in sorted(by_status.items()))}; "
+              f"{stats.retried} had failed before) — recorded in {args.progress}")
+
+    report = RunReport('photos')
+    report.section('photos').update(asdict(stats))
+    report.section('failures').update({str(failure['player_id']): failure for failure in cacher.failures})
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,196 @@
+"""
+리그 전체 player_id 인덱스 (이적/임대/비활성 중복 제거)
+
+리그별 스냅샷을 모두 읽어 player_id 마다 등장 위치(리그, 팀)를 모으고, 정확히 하나의 대표(canonical)
+레코드와 팀을 정한다. 번역은 대표 레코드의 리그 resolver 로 id 당 한 번만 한다.
+emit --dedupe 는 이 인덱스를 써서 대표 팀이 아닌 곳의 중복 선수를 출력하지 않는다.
+
+대표 선택 순서: 더 최근에 받은 스냅샷 → 등번호가 있는 쪽 → leagues.LEAGUES 순서 → team_id
+
+충돌 리포트 (.pipeline-cache/index/conflicts.json):
+- name: 같은 id 인데 스냅샷마다 영문 이름이 다름
+- translation: 같은 id 인데 리그 resolver 마다 한글 이름이 다름 (LLM 은 호출하지 않고 비교)
+
+사용법:
+    python -m pipeline index [--league saudi-pro-league --league j1-league]
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import config
+from .fetcher import _atomic_write
+from .leagues import LEAGUES
+from .records import PlayerRecord, read_snapshot
+from .report import RunReport
+
+
+@dataclass
+class Occurrence:
+    league: str
+    team_id: int
+    team_name: str
+    player: PlayerRecord
+    snapshot_time: int
+
+
+@dataclass
+class IndexEntry:
+    player_id: int
+    occurrences: list = field(default_factory=list)
+    korean_name: str = None
+    korean_tier: str = None
+
+    @property
+    def canonical(self) -> Occurrence:
+        return self.occurrences[0]
+
+    @property
+    def duplicated(self) -> bool:
+        return len(self.occurrences) > 1
+
+
+def _priority(occurrence: Occurrence):
+    league_order = list(LEAGUES).index(occurrence.league) if occurrence.league in LEAGUES else len(LEAGUES)
+    return (-occurrence.snapshot_time, occurrence.player.number is None, league_order, occurrence.team_id)
+
+
+def load_snapshots(leagues=None, directory: Path = None) -> dict:
+    """{league: (teams, 스냅샷 수정 시각)}. leagues 가 없으면 디렉터리에 있는 스냅샷 전부"""
+    directory = Path(directory or config.SNAPSHOT_DIR)
+    keys = leagues or sorted(path.stem for path in directory.glob('*.json'))
+    snapshots = {}
+    for key in keys:
+        path = directory / f'{key}.json'
+        snapshots[key] = (read_snapshot(path), int(path.stat().st_mtime))
+    return snapshots
+
+
+class PlayerIndex:
+    def __init__(self, snapshots: dict):
+        self.entries = {}
+        for league, (teams, snapshot_time) in snapshots.items():
+            for team in teams:
+                for player in team['players']:
+                    entry = self.entries.setdefault(player.id, IndexEntry(player.id))
+                    entry.occurrences.append(Occurrence(league, team['team_id'], team['team_name'], player, snapshot_time))
+        for entry in self.entries.values():
+            entry.occurrences.sort(key=_priority)
+
+    def __contains__(self, player_id) -> bool:
+        return player_id in self.entries
+
+    def __getitem__(self, player_id) -> IndexEntry:
+        return self.entries[player_id]
+
+    def is_canonical(self, player_id, league: str, team_id) -> bool:
+        canonical = self.entries[player_id].canonical
+        return canonical.league == league and canonical.team_id == team_id
+
+    def duplicates(self) -> list:
+        return [entry for entry in self.entries.values() if entry.duplicated]
+
+    def translate(self, resolver_for=None, leagues=None):
+        """대표 레코드 이름을 대표 리그 resolver 로 id 당 한 번 번역 (leagues 로 대상 리그 제한)"""
+        if resolver_for is None:
+            from .translate import get_resolver as resolver_for
+
+        by_league = {}
+        for entry in self.entries.values():
+            if leagues is not None and entry.canonical.league not in leagues:
+                continue
+            by_league.setdefault(entry.canonical.league, []).append(entry)
+
+        for league, entries in by_league.items():
+            resolved = resolver_for(league).resolve_many([entry.canonical.player.name for entry in entries])
+            for entry in entries:
+                resolution = resolved[entry.canonical.player.name]
+                if resolution is not None:
+                    entry.korean_name, entry.korean_tier = resolution.korean, resolution.tier
+                else:
+                    entry.korean_name = entry.canonical.player.name
+
+    def conflicts(self, resolver_for=None) -> list:
+        """이름/번역이 엇갈리는 중복 선수 목록. 다른 리그 번역 비교에는 LLM tier 를 쓰지 않는다"""
+        if resolver_for is None:
+            from .translate import get_resolver as resolver_for
+
+        conflicts = []
+        for entry in self.duplicates():
+            names = sorted({occurrence.player.name for occurrence in entry.occurrences})
+            translations = {}
+            for occurrence in entry.occurrences:
+                if occurrence is entry.canonical and entry.korean_name is not None:
+                    korean = entry.korean_name
+                else:
+                    resolution = resolver_for(occurrence.league).resolve(occurrence.player.name, skip=('llm',))
+                    korean = resolution.korean if resolution else None
+                if korean is not None:
+                    translations[f'{occurrence.league}/{occurrence.team_id}'] = korean
+
+            kinds = []
+            if len(names) > 1:
+                kinds.append('name')
+            if len(set(translations.values())) > 1:
+                kinds.append('translation')
+            if kinds:
+                conflicts.append({
+                    'player_id': entry.player_id,
+                    'kinds': kinds,
+                    'canonical': f'{entry.canonical.league}/{entry.canonical.team_id}',
+                    'names': names,
+                    'translations': translations,
+                })
+        return conflicts
+
+    def to_rows(self) -> list:
+        return [
+            {
+                'player_id': entry.player_id,
+                'name': entry.canonical.player.name,
+                'korean_name': entry.korean_name,
+                'league': entry.canonical.league,
+                'team_id': entry.canonical.team_id,
+                'also_in': [f'{o.league}/{o.team_id}' for o in entry.occurrences[1:]],
+            }
+            for entry in sorted(self.entries.values(), key=lambda e: e.player_id)
+        ]
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('index', help='리그 스냅샷 전체 player_id 인덱스 + 중복/충돌 리포트')
+    parser.add_argument('--league', action='append', default=None, help='기본: 스냅샷 디렉터리의 모든 리그')
+    parser.add_argument('--out', type=Path, default=None, help='기본: .pipeline-cache/index')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    index = PlayerIndex(load_snapshots(args.league))
+    index.translate()
+    conflicts = index.conflicts()
+
+    out_dir = Path(args.out or config.CACHE_DIR / 'index')
+    out_dir.mkdir(parents=True, exist_ok=True)
+    _atomic_write(out_dir / 'players.json', json.dumps(index.to_rows(), ensure_ascii=False, indent=2).encode('utf-8'))
+    _atomic_write(out_dir / 'conflicts.json', json.dumps(conflicts, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    occurrences = sum(len(entry.occurrences) for entry in index.entries.values())
+    print(f"✓ Players: {len(index.entries)} unique ({occurrences} squad rows, {len(index.duplicates())} duplicated)")
+    for conflict in conflicts[:20]:
+        print(f"⚠ {conflict['player_id']} [{','.join(conflict['kinds'])}] canonical={conflict['canonical']} "
+              f"names={conflict['names']} translations={conflict['translations']}")
+    if len(conflicts) > 20:
+        print(f"  ... {len(conflicts) - 20} more")
+    print(f"✓ Index: {out_dir / 'players.json'}")
+    print(f"✓ Conflicts: {out_dir / 'conflicts.json'} ({len(conflicts)})")
+
+    from .translate import get_resolver
+
+    report = RunReport('index')
+    report.add('index', 'players', len(index.entries))
+    report.add('index', 'duplicated', len(index.duplicates()))
+    report.add('index', 'conflicts', len(conflicts))
+    for league in {entry.canonical.league for entry in index.entries.values()}:
+        get_resolver(league).record(report)
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,85 @@
+"""
+선수 레코드 (fetch → 번역 → emit 구간의 compact 타입)
+
+API 스쿼드 응답이나 football_players 행을 dict 그대로 단계 사이에 넘기면 선수마다 dict 하나에
+select '*' 의 api_data, search_vector 같은 큰 필드까지 따라다닌다. 경계(fetch, 스냅샷 읽기, DB 조회)에서
+PlayerMapping 에 필요한 필드만 남긴 PlayerRecord 로 바꾸고, 그 뒤로는 레코드만 넘긴다.
+
+- __slots__ 라 인스턴스 dict 가 없다. 필드 8개 + 객체 헤더
+- position 처럼 값 종류가 적은 문자열은 sys.intern → 선수마다 같은 str 객체를 공유
+- 팀 이름/const 이름은 선수에 복사하지 않고 팀 단위(teams 목록의 team dict)에 한 번만 둔다
+- DB 에서는 PLAYER_SELECT 컬럼만 요청한다 (select '*' 대신)
+
+    records = [PlayerRecord.from_row(row) for row in db.select_all('football_players', PLAYER_SELECT, filters)]
+"""
+
+import json
+import sys
+from pathlib import Path
+
+PLAYER_SELECT = 'player_id,name,korean_name,team_id,position,number,age'
+
+# 스냅샷 파일(.pipeline-cache/snapshots/<league>.json)의 선수 필드. 형식은 fetch 때와 같다
+SNAPSHOT_FIELDS = ('id', 'name', 'age', 'number', 'position', 'photo')
+
+
+def intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class PlayerRecord:
+    __slots__ = ('id', 'name', 'korean_name', 'team_id', 'position', 'number', 'age', 'photo')
+
+    def __init__(self, id: int, name: str, korean_name: str = None, team_id: int = None, position: str = None,
+                 number: int = None, age: int = None, photo: str = None):
+        self.id = id
+        self.name = name
+        self.korean_name = korean_name
+        self.team_id = team_id
+        self.position = intern(position)
+        self.number = number
+        self.age = age
+        self.photo = photo
+
+    @classmethod
+    def from_squad(cls, player: dict, team_id: int = None) -> 'PlayerRecord':
+        """API-Football players/squads 항목 또는 스냅샷 파일 항목"""
+        return cls(player['id'], player.get('name'), team_id=team_id, position=player.get('position'),
+                   number=player.get('number'), age=player.get('age'), photo=player.get('photo'))
+
+    @classmethod
+    def from_row(cls, row: dict) -> 'PlayerRecord':
+        """football_players 행 (PLAYER_SELECT 밖의 컬럼은 버린다)"""
+        return cls(row['player_id'], row.get('name'), row.get('korean_name'), row.get('team_id'), row.get('position'),
+                   row.get('number'), row.get('age'))
+
+    def to_snapshot(self) -> dict:
+        return {field: getattr(self, field) for field in SNAPSHOT_FIELDS}
+
+    def __repr__(self) -> str:
+        return f'PlayerRecord(id={self.id!r}, name={self.name!r}, korean_name={self.korean_name!r}, team_id={self.team_id!r})'
+
+
+def snapshot_records(teams: list) -> list:
+    """스냅샷 JSON(팀 목록) → 선수가 PlayerRecord 인 팀 목록. 팀 이름은 intern"""
+    return [
+        {
+            'team_id': team['team_id'],
+            'team_name': intern(team['team_name']),
+            'players': [PlayerRecord.from_squad(player, team['team_id']) for player in team['players']],
+        }
+        for team in teams
+    ]
+
+
+def read_snapshot(path: Path) -> list:
+    return snapshot_records(json.loads(Path(path).read_text(encoding='utf-8')))
+
+
+def snapshot_json(teams: list) -> list:
+    """snapshot_records 의 역변환 (스냅샷 파일에 쓰는 형식)"""
+    return [
+        {'team_id': team['team_id'], 'team_name': team['team_name'],
+         'players': [player.to_snapshot() for player in team['players']]}
+        for team in teams
+    ]
@@ -0,0 +1,234 @@
+"""
+팀/국적 한글 이름 레지스트리
+
+팀 정보(영문, 한글, TS 상수명)가 리그 스크립트마다 TEAM_INFO / teams 리터럴로 복사돼 있고,
+football_players.nationality_ko 는 채우는 단계가 없다. 이 단계는 팀 이름과 국적을 한 번만 번역해
+team_registry.json (커밋되는 산출물)에 모으고, 선수 테이블의 team_name / nationality_ko 를 일괄로 채운다.
+
+- 팀 한글 이름: football_teams.name_ko → 레지스트리에 있던 값 → 번역 tier (teams 프로필)
+- 국적 한글 이름: football_teams 의 country/country_ko → 레지스트리에 있던 값 → 번역 tier (nationalities 프로필)
+  football_teams 에 country_ko 가 있는 나라는 선수 국적에 없어도 모두 레지스트리에 싣는다 (nationalities 사전)
+- 번역 tier 는 lexicon(레지스트리) → cache → LLM. 캐시는 선수 이름과 섞이지 않게 registry.sqlite 를 따로 쓴다
+- 레지스트리 팀은 파이프라인 리그(leagues.py) 소속 팀 + 이미 등록된 팀. const_name 은 한 번 정해지면 유지
+- football_players 는 선수 열 단위 스냅샷(columns.py)과 비교해 값이 바뀌는 선수만 upsert
+  (team_name = football_teams.name, nationality_ko = 국적 한글 이름)
+- 끝으로 DB 의 최신 korean_name 으로 SEO 품질 플래그(seo_worthless)를 다시 계산 (pipeline.seo_flags)
+
+생성기(build_saudi_file.py, generate_j1_players.py 등)는 load_registry().league_teams(<리그>) 로 팀 목록을 읽는다.
+
+사용법:
+    python -m pipeline registry [--refresh] [--dry-run]
+"""
+
+import json
+from pathlib import Path
+
+from . import config
+from .columns import PLAYER_COLUMNS_PATH, player_columns
+from .emit import const_name
+from .fetcher import _atomic_write
+from .leagues import LEAGUES
+from .report import RunReport
+
+REGISTRY_PATH = config.DATA_GENERATION_DIR / 'team_registry.json'
+REGISTRY_COLUMNS = ['player_id', 'name', 'display_name', 'team_id', 'team_name', 'nationality', 'nationality_ko']
+TEAM_COLUMNS = 'team_id,name,name_ko,league_id,country,country_ko'
+
+def _block(lines: list) -> str:
+    return '{\n' + ',\n'.join(f'    {line}' for line in lines) + '\n  }' if lines else '{}'
+
+
+class TeamRegistry:
+    """teams: {team_id: {'name', 'korean', 'const_name', 'league'}}, nationalities: {영문: 한글}"""
+
+    def __init__(self, teams: dict = None, nationalities: dict = None):
+        self.teams = teams or {}
+        self.nationalities = nationalities or {}
+
+    def team(self, team_id: int) -> dict:
+        return self.teams[team_id]
+
+    def team_info(self, team_id: int, team_name: str = None, league: str = None) -> dict:
+        """레지스트리 팀 정보. 등록되지 않은 팀은 스냅샷의 팀 이름과 const_name() 으로 대신하고 경고한다"""
+        team = self.teams.get(team_id)
+        if team is not None:
+            return {'team_id': team_id, **team}
+        name = team_name or f'Team {team_id}'
+        print(f"⚠ Team {team_id} ({name}) is not in team_registry.json — using the snapshot name "
+              f"(run python -m pipeline registry to translate it)")
+        return {'team_id': team_id, 'name': name, 'korean': name, 'const_name': const_name(name), 'league': league}
+
+    def league_teams(self, league: str) -> list:
+        """리그 팀 목록 [{'team_id', 'name', 'korean', 'const_name', 'league'}] (레지스트리 순서)"""
+        return [{'team_id': team_id, **team} for team_id, team in self.teams.items() if team.get('league') == league]
+
+    def lexicon(self, group: str) -> dict:
+        """번역 tier 용 사전 ('teams': 영문 팀 이름 → 한글, 'nationalities': 국적 → 한글)"""
+        if group == 'teams':
+            return {team['name']: team['korean'] for team in self.teams.values() if team.get('korean')}
+        return dict(self.nationalities)
+
+    def to_json(self) -> str:
+        # 한 줄에 한 팀/국적 → 사람이 검수할 때 diff 가 작다. 팀은 등록 순서 유지 (생성되는 TS 의 팀 순서)
+        teams = [f'"{team_id}": {json.dumps(team, ensure_ascii=False)}' for team_id, team in self.teams.items()]
+        nationalities = [f'{json.dumps(english, ensure_ascii=False)}: {json.dumps(korean, ensure_ascii=False)}'
+                         for english, korean in sorted(self.nationalities.items())]
+        return f'{{\n  "teams": {_block(teams)},\n  "nationalities": {_block(nationalities)}\n}}\n'
+
+    def save(self, path: Path = REGISTRY_PATH) -> Path:
+        path = Path(path)
+        _atomic_write(path, self.to_json().encode('utf-8'))
+        return path
+
+    @classmethod
+    def load(cls, path: Path = REGISTRY_PATH) -> 'TeamRegistry':
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        data = json.loads(path.read_text(encoding='utf-8'))
+        teams = {int(team_id): team for team_id, team in data.get('teams', {}).items()}
+        return cls(teams, data.get('nationalities', {}))
+
+
+_registry = None
+
+
+def load_registry() -> TeamRegistry:
+    """프로세스 안에서 한 번만 읽는다 (생성기, 번역 사전)"""
+    global _registry
+    if _registry is None:
+        _registry = TeamRegistry.load()
+    return _registry
+
+
+def _translate(resolver, names: list) -> dict:
+    if not names or resolver is None:
+        return {}
+    return {name: resolution.korean for name, resolution in resolver.resolve_many(names).items()
+            if resolution is not None and resolution.korean}
+
+
+def build_registry(team_rows: list, nationalities, previous: TeamRegistry, team_resolver=None,
+                   nationality_resolver=None) -> TeamRegistry:
+    """football_teams 행 + 선수 국적 목록 → 새 레지스트리. DB 값 → 기존 레지스트리 → 번역 tier 순"""
+    league_keys = {league['league_id']: key for key, league in LEAGUES.items()}
+    teams = {}
+    for team_id, team in previous.teams.items():
+        teams[team_id] = dict(team)
+    # 새 팀은 기존 팀 뒤에 영문 이름순으로 붙인다
+    for row in sorted(team_rows, key=lambda r: (str(r.get('name') or '').casefold(), r['team_id'])):
+        league = league_keys.get(row.get('league_id'))
+        team_id = row['team_id']
+        if league is None and team_id not in teams:
+            continue
+        current = teams.setdefault(team_id, {'name': row['name'], 'korean': None,
+                                             'const_name': const_name(row['name']), 'league': league})
+        current['korean'] = row.get('name_ko') or current.get('korean')
+        current['league'] = current.get('league') or league
+
+    untranslated = sorted({team['name'] for team in teams.values() if not team.get('korean')})
+    translated = _translate(team_resolver, untranslated)
+    for team in teams.values():
+        if not team.get('korean'):
+            team['korean'] = translated.get(team['name'])
+
+    countries = {}
+    for row in team_rows:
+        if row.get('country') and row.get('country_ko'):
+            countries.setdefault(row['country'], row['country_ko'])
+        # 국가대표팀은 name == country
+        if row.get('name') == row.get('country') and row.get('name_ko'):
+            countries[row['name']] = row['name_ko']
+
+    mapping = dict(previous.nationalities)
+    mapping.update(countries)
+    wanted = sorted({str(value).strip() for value in nationalities if value and str(value).strip()})
+    mapping.update(_translate(nationality_resolver, [name for name in wanted if name not in mapping]))
+    return TeamRegistry(teams, mapping)
+
+
+def player_updates(rows, team_names: dict, registry: TeamRegistry) -> list:
+    """team_name / nationality_ko 가 바뀌는 선수만 upsert 행으로"""
+    updates = []
+    for row in rows:
+        team_name = team_names.get(row['team_id']) or row.get('team_name')
+        nationality = str(row.get('nationality') or '').strip()
+        nationality_ko = registry.nationalities.get(nationality) or row.get('nationality_ko')
+        if team_name == row.get('team_name') and nationality_ko == row.get('nationality_ko'):
+            continue
+        updates.append({'player_id': row['player_id'], 'name': row['name'], 'display_name': row['display_name'],
+                        'team_id': row['team_id'], 'team_name': team_name, 'nationality_ko': nationality_ko})
+    return updates
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('registry', help='팀/국적 한글 이름 레지스트리 생성 + 선수 team_name/nationality_ko 일괄 채움')
+    parser.add_argument('--snapshot', type=Path, default=PLAYER_COLUMNS_PATH, help='선수 열 단위 스냅샷')
+    parser.add_argument('--refresh', action='store_true', help='스냅샷을 DB 에서 다시 받음')
+    parser.add_argument('--out', type=Path, default=REGISTRY_PATH, help='레지스트리 파일')
+    parser.add_argument('--no-translate', action='store_true', help='번역 tier 를 쓰지 않고 DB/레지스트리 값만')
+    parser.add_argument('--chunk-size', type=int, default=500, help='upsert 청크 크기')
+    parser.add_argument('--dry-run', action='store_true', help='DB 를 쓰지 않고 바뀔 선수 수와 레지스트리만 출력')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    from .db import SupabaseRest
+
+    report = RunReport('registry')
+    db = SupabaseRest.from_env()
+    team_rows = list(db.select_all('football_teams', TEAM_COLUMNS, order=['team_id']))
+    snapshot = player_columns(REGISTRY_COLUMNS, args.snapshot, args.refresh, db)
+
+    team_resolver = nationality_resolver = None
+    if not args.no_translate:
+        from .translate import build_resolver
+
+        team_resolver = build_resolver('teams', dry_run=args.dry_run)
+        nationality_resolver = build_resolver('nationalities', dry_run=args.dry_run)
+
+    previous = TeamRegistry.load(args.out)
+    registry = build_registry(team_rows, snapshot.column('nationality'), previous, team_resolver, nationality_resolver)
+    missing_teams = sorted(team['name'] for team in registry.teams.values() if not team.get('korean'))
+    missing_nationalities = sorted({str(value).strip() for value in snapshot.column('nationality') if value}
+                                   - set(registry.nationalities))
+
+    team_names = {row['team_id']: row['name'] for row in team_rows}
+    updates = player_updates(snapshot.rows(REGISTRY_COLUMNS), team_names, registry)
+
+    report.section('registry').update({
+        'teams': len(registry.teams), 'teams_added': len(set(registry.teams) - set(previous.teams)),
+        'teams_without_korean': len(missing_teams), 'nationalities': len(registry.nationalities),
+        'nationalities_added': len(set(registry.nationalities) - set(previous.nationalities)),
+        'nationalities_without_korean': len(missing_nationalities), 'player_updates': len(updates),
+    })
+    for resolver in (team_resolver, nationality_resolver):
+        if resolver is not None:
+            resolver.record(report)
+    if missing_teams:
+        print(f"⚠ {len(missing_teams)} team(s) without a Korean name: {missing_teams[:10]}")
+    if missing_nationalities:
+        print(f"⚠ {len(missing_nationalities)} nationality(ies) without a Korean name: {missing_nationalities[:10]}")
+
+    if args.dry_run:
+        print(registry.to_json())
+        print(f"✓ Dry run: {len(updates)} player(s) would be updated")
+        return
+
+    print(f"✓ Registry: {len(registry.teams)} teams, {len(registry.nationalities)} nationalities → {registry.save(args.out)}")
+    if updates:
+        db.upsert('football_players', updates, on_conflict='player_id', chunk_size=args.chunk_size)
+        changed = {row['player_id']: row for row in updates}
+        for name in ('team_name', 'nationality_ko'):
+            values = snapshot.column(name)
+            for position, player_id in enumerate(snapshot.column('player_id')):
+                if player_id in changed:
+                    values[position] = changed[player_id][name]
+        snapshot.save(args.snapshot)
+
+    print(f"✓ Updated team_name/nationality_ko for {len(updates)} of {len(snapshot)} players")
+
+    from .seo_flags import refresh_flags
+
+    refresh_flags(db, args.snapshot, args.chunk_size, report)
+    print(f"✓ Report: {report.write()}")
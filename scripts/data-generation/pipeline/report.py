@@ -0,0 +1,41 @@
+"""
+실행 리포트
+
+단계별 수치를 섹션 단위로 모아 .pipeline-cache/reports/<command>-<timestamp>.json 으로 저장한다.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from . import config
+
+
+class RunReport:
+    def __init__(self, command: str):
+        self.command = command
+        self.started_at = time.time()
+        self.sections = {}
+
+    def section(self, name: str) -> dict:
+        return self.sections.setdefault(name, {})
+
+    def add(self, section: str, key: str, amount=1):
+        values = self.section(section)
+        values[key] = values.get(key, 0) + amount
+
+    def to_dict(self) -> dict:
+        return {
+            'command': self.command,
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+            'elapsed_seconds': round(time.time() - self.started_at, 3),
+            **self.sections,
+        }
+
+    def write(self, directory: Path = None) -> Path:
+        directory = Path(directory or config.CACHE_DIR / 'reports')
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started_at))
+        path = directory / f'{self.command}-{stamp}.json'
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding='utf-8')
+        return path
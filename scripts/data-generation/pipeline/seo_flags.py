@@ -0,0 +1,99 @@
+"""
+선수 SEO 품질 플래그 일괄 계산 (football_players.seo_worthless)
+
+사이트맵(src/shared/seo/sitemap.ts)은 선수 페이지를 읽을 때마다 행을 전부 가져와 isWorthlessSitemapPlayer 로
+버린다. 번역(korean_name)과 slug 가 정해진 뒤 같은 규칙(seo_quality.is_worthless_sitemap_player)을 여기서
+한 번 평가해 football_players.seo_worthless 에 저장한다 → 사이트맵 쿼리는 WHERE seo_worthless IS NOT TRUE 로
+DB 에서 거른다 (아직 계산하지 않은 NULL 행은 통과하고 JS 규칙이 그대로 거른다).
+
+- 컬럼/인덱스: docs/player-seo-quality.sql (Supabase SQL 편집기에서 한 번 실행). 컬럼이 없는 DB 에서는
+  사이트맵이 필터 없이 조회하고 JS 규칙으로만 거른다
+- 선수 열 단위 스냅샷(columns.py)을 훑어 저장된 값과 다른 선수만 청크 단위 upsert, 스냅샷의 열도 갱신
+- DB 의 korean_name/slug 를 쓰는 명령(slugs, batch-translate, registry)이 끝에 refresh_flags 로 자동 실행한다.
+  DB 를 직접 고쳤다면 --refresh 로 실행
+
+사용법:
+    python -m pipeline seo-flags [--refresh] [--dry-run]
+"""
+
+from pathlib import Path
+
+from .columns import PLAYER_COLUMNS_PATH, player_columns
+from .report import RunReport
+from .seo_quality import is_worthless_sitemap_player
+
+SEO_COLUMNS = ['player_id', 'slug', 'name', 'display_name', 'korean_name', 'team_id', 'seo_worthless']
+
+
+def plan_flags(snapshot) -> dict:
+    """{player_id: 새 seo_worthless} — 저장된 값과 다른 선수만"""
+    changed = {}
+    for row in snapshot.rows(SEO_COLUMNS):
+        worthless = is_worthless_sitemap_player(row)
+        if row['seo_worthless'] is not worthless:
+            changed[row['player_id']] = worthless
+    return changed
+
+
+def write_flags(snapshot, db, snapshot_path: Path = PLAYER_COLUMNS_PATH, chunk_size: int = 500,
+                dry_run: bool = False, report: RunReport = None) -> dict:
+    changed = plan_flags(snapshot)
+    flags = snapshot.column('seo_worthless')
+    worthless = sum(1 for player_id, flag in zip(snapshot.column('player_id'), flags)
+                    if changed.get(player_id, flag))
+    if report is not None:
+        report.section('seo_flags').update({'players': len(snapshot), 'worthless': worthless, 'changed': len(changed)})
+
+    if changed and not dry_run:
+        rows = snapshot.rows(SEO_COLUMNS)
+        updates = [
+            {'player_id': row['player_id'], 'name': row['name'], 'display_name': row['display_name'],
+             'team_id': row['team_id'], 'seo_worthless': changed[row['player_id']]}
+            for row in rows if row['player_id'] in changed
+        ]
+        db.upsert('football_players', updates, on_conflict='player_id', chunk_size=chunk_size)
+
+        for position, player_id in enumerate(snapshot.column('player_id')):
+            if player_id in changed:
+                flags[position] = changed[player_id]
+        snapshot.save(snapshot_path)
+
+    verb = 'would change' if dry_run else 'changed'
+    print(f"✓ SEO flags: {worthless} of {len(snapshot)} players worthless, {len(changed)} flag(s) {verb}")
+    return changed
+
+
+def refresh_flags(db=None, snapshot_path: Path = PLAYER_COLUMNS_PATH, chunk_size: int = 500, report: RunReport = None,
+                  refresh: bool = True) -> dict:
+    """korean_name/slug 를 쓴 명령의 마지막 단계. refresh 면 스냅샷을 DB 에서 다시 받아 바뀐 번역을 반영
+
+    DB 설정이 없거나 seo_worthless 컬럼이 아직 없으면 경고만 하고 넘어간다 (본 작업은 이미 끝남)
+    """
+    from .db import DatabaseError, SupabaseRest
+
+    try:
+        db = db or SupabaseRest.from_env()
+        snapshot = player_columns(SEO_COLUMNS, snapshot_path, refresh, db)
+        return write_flags(snapshot, db, snapshot_path, chunk_size, report=report)
+    except DatabaseError as e:
+        print(f"⚠ SEO flags not refreshed ({e}) — run: python -m pipeline seo-flags --refresh")
+        return {}
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('seo-flags', help='선수 SEO 품질 플래그(seo_worthless)를 계산해 DB 에 일괄 저장')
+    parser.add_argument('--snapshot', type=Path, default=PLAYER_COLUMNS_PATH, help='선수 열 단위 스냅샷')
+    parser.add_argument('--refresh', action='store_true', help='스냅샷을 DB 에서 다시 받음 (번역/slug 변경 반영)')
+    parser.add_argument('--chunk-size', type=int, default=500, help='upsert 청크 크기')
+    parser.add_argument('--dry-run', action='store_true', help='DB 를 쓰지 않고 바뀔 플래그 수만 출력')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    from .db import SupabaseRest
+
+    report = RunReport('seo-flags')
+    db = None if args.dry_run else SupabaseRest.from_env()
+    snapshot = player_columns(SEO_COLUMNS, args.snapshot, args.refresh, db)
+    write_flags(snapshot, db, args.snapshot, args.chunk_size, args.dry_run, report)
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,52 @@
+"""
+선수 SEO 품질 규칙 (TypeScript 규칙의 Python 이식)
+
+- src/domains/livescore/utils/playerSeoQuality.ts: isWorthlessSitemapPlayer
+- src/domains/livescore/actions/player/slug.ts:  isUsablePlayerSlug
+규칙을 바꾸면 양쪽을 같이 고친다.
+"""
+
+import re
+
+UNKNOWN_VALUES = {'', '알수없음', '알 수 없음', 'unknown', 'n/a', 'na', 'null', 'undefined'}
+
+FALLBACK_ENGLISH_NAME = re.compile(r'^player[-_\s]*\d+$', re.IGNORECASE)
+FALLBACK_KOREAN_NAME = re.compile(r'^선수\s*\d+$')
+GENERATED_SLUG = re.compile(r'^player-\d+$')
+
+
+def normalize_value(value) -> str:
+    return str(value if value is not None else '').strip()
+
+
+def is_unknown_value(value) -> bool:
+    normalized = normalize_value(value).lower()
+    return normalized in UNKNOWN_VALUES or 'nan' in normalized
+
+
+def is_fallback_player_name(name: str, player_id=None) -> bool:
+    normalized = name.strip()
+    if not normalized:
+        return True
+    if FALLBACK_ENGLISH_NAME.match(normalized) or FALLBACK_KOREAN_NAME.match(normalized):
+        return True
+    if player_id and normalized in (str(player_id), f'#{player_id}'):
+        return True
+    return False
+
+
+def is_usable_player_slug(slug) -> bool:
+    normalized = normalize_value(slug).lower()
+    return bool(normalized) and normalized != 'player' and not GENERATED_SLUG.match(normalized) and not normalized.isdigit()
+
+
+def is_worthless_sitemap_player(player: dict) -> bool:
+    """이름이 대체값('Player 123', '선수 1', id)이거나 slug 가 없거나 생성된 값이면 사이트맵에서 제외"""
+    name = normalize_value(player.get('korean_name') or player.get('display_name') or player.get('name'))
+    player_id = player.get('player_id')
+    if is_fallback_player_name(name, player_id):
+        return True
+
+    slug = normalize_value(player.get('slug')).lower()
+    player_id = str(player_id if player_id is not None else '')
+    return not slug or slug == 'player' or slug == player_id or (bool(player_id) and slug == f'player-{player_id}')
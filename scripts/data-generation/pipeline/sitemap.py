@@ -0,0 +1,160 @@
+"""
+정적 선수 사이트맵 shard
+
+src/shared/seo/sitemap.ts 의 getPlayerSitemap 은 요청마다 football_players 를 count: 'exact' 로 세고
+.range() 로 페이지를 읽은 뒤 isWorthlessSitemapPlayer 로 걸러낸다.
+여기서는 선수 열 단위 스냅샷(columns.py)을 한 번만 훑어 같은 규칙으로 거르고,
+50,000 URL 단위 gzip shard 와 sitemap index 를 미리 만들어 둔다 → 크롤러 요청은 정적 파일 읽기.
+
+- URL: <SITE_URL>/livescore/football/player/<id>/<slug>, lastmod = updated_at
+- XML 형식은 src/shared/seo/sitemapXml.ts (sitemapUrlsetXml / sitemapIndexXml) 와 동일
+- shard 순서는 player_id 순 (getPlayerSitemap 과 같은 정렬)
+
+게시: --store 로 shard 와 index 를 오브젝트 저장소의 sitemaps/players/ 에 올린다 (photos 와 같은 저장소 지정).
+사이트는 PLAYER_SITEMAP_INDEX_URL 이 설정돼 있으면 /sitemaps/livescore-players.xml 에서 그 index 를 내보내고
+(src/shared/seo/sitemap.ts getPublishedPlayerSitemapIndex), 없으면 지금처럼 DB 를 페이지로 읽는다.
+--store 없이 실행하면 --out 에만 쓰므로 shard 를 직접 올릴 위치를 --base-url 로 지정해야 한다.
+shard 가 사이트와 다른 호스트(CDN)에 있으면 검색 엔진이 받아들이도록 그 호스트도 Search Console 에서 확인해 둔다.
+
+사용법:
+    python -m pipeline sitemap --store s3:https://s3.example.com/bucket --public-base-url https://cdn.example.com [--refresh]
+    python -m pipeline sitemap --base-url https://cdn.example.com/sitemaps/players [--out .pipeline-cache/sitemaps]
+"""
+
+import gzip
+import time
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from . import config
+from .columns import PLAYER_COLUMNS_PATH, player_columns
+from .fetcher import _atomic_write
+from .http_client import HttpPool
+from .object_store import open_store
+from .report import RunReport
+from .seo_quality import is_usable_player_slug, is_worthless_sitemap_player
+
+SITEMAP_PAGE_SIZE = 50000
+SITEMAP_COLUMNS = ['player_id', 'slug', 'updated_at', 'name', 'display_name', 'korean_name']
+STORE_PREFIX = 'sitemaps/players'
+INDEX_NAME = 'players-index.xml'
+XML_ENTITIES = {'"': '&quot;', "'": '&apos;'}
+
+
+def _escape(value: str) -> str:
+    return escape(str(value), XML_ENTITIES)
+
+
+def urlset_xml(entries: list) -> str:
+    """entries: [(url, lastmod | None)]"""
+    urls = '\n'.join(
+        f'  <url>\n    <loc>{_escape(url)}</loc>' + (f'\n    <lastmod>{_escape(lastmod)}</lastmod>' if lastmod else '') + '\n  </url>'
+        for url, lastmod in entries
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+            'xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">\n'
+            f'{urls}\n</urlset>\n')
+
+
+def sitemap_index_xml(entries: list) -> str:
+    """entries: [(loc, lastmod | None)]"""
+    sitemaps = '\n'.join(
+        f'  <sitemap>\n    <loc>{_escape(loc)}</loc>' + (f'\n    <lastmod>{_escape(lastmod)}</lastmod>' if lastmod else '') + '\n  </sitemap>'
+        for loc, lastmod in entries
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f'{sitemaps}\n</sitemapindex>\n')
+
+
+def player_entries(snapshot, site_url: str = None):
+    """(url, lastmod) — getPlayerSitemap 과 같은 필터 (id > 0, 가치 없는 선수 제외, 쓸 수 있는 slug)"""
+    site_url = (site_url or config.SITE_URL).rstrip('/')
+    for row in snapshot.rows(SITEMAP_COLUMNS):
+        if not row['player_id'] or row['player_id'] <= 0 or is_worthless_sitemap_player(row):
+            continue
+        if not is_usable_player_slug(row['slug']):
+            continue
+        yield f"{site_url}/livescore/football/player/{row['player_id']}/{row['slug']}", row['updated_at']
+
+
+def write_shards(entries, out_dir: Path, base_url: str, page_size: int = SITEMAP_PAGE_SIZE) -> list:
+    """shard 를 쓰고 [(loc, lastmod, URL 수)] 반환. 이전 실행에서 남은 초과 shard 는 지운다"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    shards, page = [], []
+
+    def flush():
+        index = len(shards)
+        name = f'players-{index}.xml.gz'
+        _atomic_write(out_dir / name, gzip.compress(urlset_xml(page).encode('utf-8'), mtime=0))
+        lastmod = max((lastmod for _, lastmod in page if lastmod), default=None)
+        shards.append((f'{base_url}/{name}', lastmod, len(page)))
+
+    for entry in entries:
+        page.append(entry)
+        if len(page) >= page_size:
+            flush()
+            page = []
+    if page or not shards:
+        flush()
+
+    for stale in out_dir.glob('players-*.xml.gz'):
+        suffix = stale.name[len('players-'):-len('.xml.gz')]
+        if suffix.isdigit() and int(suffix) >= len(shards):
+            stale.unlink()
+    return shards
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('sitemap', help='선수 사이트맵을 50k URL gzip shard + index 로 미리 생성')
+    parser.add_argument('--snapshot', type=Path, default=PLAYER_COLUMNS_PATH, help='선수 열 단위 스냅샷')
+    parser.add_argument('--refresh', action='store_true', help='스냅샷을 DB 에서 다시 받음')
+    parser.add_argument('--out', type=Path, default=config.CACHE_DIR / 'sitemaps')
+    parser.add_argument('--store', default=None,
+                        help=f'게시할 오브젝트 저장소 local:<dir> 또는 s3:<endpoint>/<bucket> ({STORE_PREFIX}/ 아래)')
+    parser.add_argument('--public-base-url', default=None, help='저장소의 공개 http(s) 주소 (local 저장소는 필수)')
+    parser.add_argument('--base-url', default=None, help='--store 없이 쓸 때 shard 를 올릴 공개 URL 접두사 (필수)')
+    parser.add_argument('--site-url', default=None, help='선수 URL 도메인 (기본: NEXT_PUBLIC_SITE_URL)')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    with HttpPool() as pool:
+        store = open_store(args.store, args.public_base_url, pool=pool) if args.store else None
+        if store is not None:
+            base_url = store.public_url(STORE_PREFIX)
+            if not base_url.startswith(('http://', 'https://')):
+                raise SystemExit(f"shard URLs would be {base_url}/… — pass an http(s) --public-base-url "
+                                 f"(required for local stores)")
+        elif args.base_url:
+            base_url = args.base_url.rstrip('/')
+        else:
+            raise SystemExit('Pass --store to publish the shards, or --base-url with the public URL you will upload '
+                             f'{args.out} to')
+
+        report = RunReport('sitemap')
+        snapshot = player_columns(SITEMAP_COLUMNS, args.snapshot, args.refresh)
+
+        started = time.perf_counter()
+        shards = write_shards(player_entries(snapshot, args.site_url), args.out, base_url)
+        index_path = args.out / INDEX_NAME
+        _atomic_write(index_path, sitemap_index_xml([(loc, lastmod) for loc, lastmod, _ in shards]).encode('utf-8'))
+        elapsed = time.perf_counter() - started
+
+        if store is not None:
+            # shard 를 먼저 올리고 index 는 마지막에 → index 가 아직 없는 shard 를 가리키는 순간이 없다
+            for shard in range(len(shards)):
+                name = f'players-{shard}.xml.gz'
+                store.put(f'{STORE_PREFIX}/{name}', (args.out / name).read_bytes(), 'application/gzip')
+            store.put(f'{STORE_PREFIX}/{INDEX_NAME}', index_path.read_bytes(), 'application/xml')
+            report.section('sitemap')['published'] = store.public_url(f'{STORE_PREFIX}/{INDEX_NAME}')
+
+    urls = sum(count for _, _, count in shards)
+    report.section('sitemap').update({'players': len(snapshot), 'urls': urls, 'excluded': len(snapshot) - urls,
+                                      'shards': len(shards), 'seconds': round(elapsed, 3)})
+    print(f"✓ {urls} URLs from {len(snapshot)} players ({len(snapshot) - urls} excluded) → {len(shards)} shard(s) in {elapsed:.2f}s")
+    print(f"✓ Index: {index_path}")
+    if store is not None:
+        print(f"✓ Published: {report.sections['sitemap']['published']} (set PLAYER_SITEMAP_INDEX_URL to serve it)")
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,202 @@
+"""
+선수 slug 일괄 생성 (전역 충돌 해결)
+
+slug 가 없거나 쓸 수 없는 선수(isUsablePlayerSlug 가 거부하는 'player-123', 숫자만)는
+src/domains/livescore/actions/player/slug.ts 가 런타임에 DB → API-Football 순으로 이름을 다시 찾는다.
+여기서는 선수 열 단위 스냅샷을 한 번 훑어 모든 선수의 slug 를 미리 만든다.
+
+- slugify 는 src/domains/livescore/utils/slugs.ts 와 같은 규칙 (음역표, 악센트 제거, 소문자, 하이픈)
+- 이름 후보 순서는 getPlayerLinkSlug 와 같고 (name → korean_name → display_name),
+  후보가 slug 로 비면 다음 후보, 한글만 남으면 국어의 로마자 표기(음절 단위)로 변환
+- 이미 쓸 수 있는 slug 는 그대로 두고 먼저 전역 집합에 등록 (URL 유지)
+- 스냅샷은 활성 선수만 담으므로, 비활성 선수를 포함해 slug 가 있는 모든 행을 DB 에서 따로 읽어 전역 집합에 먼저 넣는다
+- 새 slug 가 겹치면 player_id 순으로 '-2', '-3' … 을 붙인다 → 같은 입력이면 항상 같은 결과
+- 결과는 football_players.slug 에 청크 단위 upsert, 스냅샷의 slug 열도 갱신
+- 이어서 새 slug 로 SEO 품질 플래그(seo_worthless)를 다시 계산해 저장 (pipeline.seo_flags)
+
+사용법:
+    python -m pipeline slugs [--refresh] [--dry-run]
+"""
+
+import re
+import unicodedata
+from pathlib import Path
+
+from .columns import PLAYER_COLUMNS_PATH, player_columns
+from .db import SupabaseRest, not_is
+from .report import RunReport
+from .seo_quality import is_usable_player_slug
+
+SLUG_COLUMNS = ['player_id', 'slug', 'name', 'display_name', 'korean_name', 'team_id']
+
+SLUG_TRANSLITERATIONS = {
+    'Æ': 'AE', 'æ': 'ae', 'Ð': 'D', 'ð': 'd', 'Đ': 'D', 'đ': 'd', 'Þ': 'Th', 'þ': 'th', 'Ł': 'L', 'ł': 'l',
+    'Ø': 'O', 'ø': 'o', 'Œ': 'OE', 'œ': 'oe', 'ß': 'ss', 'Ŋ': 'N', 'ŋ': 'n',
+}
+TURKISH_REPLACEMENTS = [('ıİ', 'i'), ('ğĞ', 'g'), ('şŞ', 's'), ('çÇ', 'c'), ('öÖ', 'o'), ('üÜ', 'u')]
+
+NON_SLUG_CHARS = re.compile(r'[^a-zA-Z0-9_\s-]')
+WHITESPACE = re.compile(r'\s+')
+DASHES = re.compile(r'-+')
+GENERATED_PLAYER_SLUG = re.compile(r'^player-\d+$')
+
+# 국어의 로마자 표기법 (음절 단위, 음운 변화는 반영하지 않음)
+INITIALS = ['g', 'kk', 'n', 'd', 'tt', 'r', 'm', 'b', 'pp', 's', 'ss', '', 'j', 'jj', 'ch', 'k', 't', 'p', 'h']
+MEDIALS = ['a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa', 'wae', 'oe', 'yo', 'u', 'wo', 'we', 'wi',
+           'yu', 'eu', 'ui', 'i']
+FINALS = ['', 'k', 'k', 'k', 'n', 'n', 'n', 't', 'l', 'k', 'm', 'l', 'l', 'l', 'p', 'l', 'm', 'p', 'p', 't', 't',
+          'ng', 't', 't', 'k', 't', 'p', 't']
+
+
+def slugify(text: str) -> str:
+    for chars, replacement in TURKISH_REPLACEMENTS:
+        text = re.sub(f'[{chars}]', replacement, text)
+    text = ''.join(SLUG_TRANSLITERATIONS.get(ch, ch) for ch in text)
+    text = ''.join(ch for ch in unicodedata.normalize('NFD', text) if not '\u0300' <= ch <= '\u036f')
+    text = NON_SLUG_CHARS.sub('', unicodedata.normalize('NFC', text)).strip().lower()
+    return DASHES.sub('-', WHITESPACE.sub('-', text)).strip('-')
+
+
+def get_player_slug_from_name(name: str) -> str:
+    slug = slugify(name)
+    return '' if slug == 'player' or GENERATED_PLAYER_SLUG.match(slug) else slug
+
+
+def romanize_hangul(text: str) -> str:
+    out = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(INITIALS[code // 588] + MEDIALS[(code % 588) // 28] + FINALS[code % 28])
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+
+def name_slug(row: dict) -> str:
+    """이름 후보를 차례로 slug 로 바꿔 처음 나온 쓸 수 있는 값 (없으면 '')"""
+    candidates = [row.get('name'), row.get('korean_name'), row.get('display_name')]
+    for candidate in candidates:
+        slug = get_player_slug_from_name(str(candidate or '').strip())
+        if slug:
+            return slug
+    for candidate in candidates:
+        slug = get_player_slug_from_name(romanize_hangul(str(candidate or '').strip()))
+        if slug:
+            return slug
+    return ''
+
+
+class SlugAllocator:
+    """전역 slug 집합. 겹치면 '-2', '-3' … 중 처음 비는 값"""
+
+    def __init__(self):
+        self.taken = set()
+        self._next_suffix = {}
+
+    def claim(self, slug: str) -> bool:
+        """기존 slug 등록. 이미 있으면 False (기존 데이터의 중복)"""
+        key = slug.lower()
+        if key in self.taken:
+            return False
+        self.taken.add(key)
+        return True
+
+    def allocate(self, base: str) -> str:
+        if base not in self.taken:
+            self.taken.add(base)
+            return base
+        suffix = self._next_suffix.get(base, 2)
+        while f'{base}-{suffix}' in self.taken:
+            suffix += 1
+        self._next_suffix[base] = suffix + 1
+        slug = f'{base}-{suffix}'
+        self.taken.add(slug)
+        return slug
+
+
+def reserved_slugs(db: SupabaseRest, rows: list) -> list:
+    """rows(활성 선수 스냅샷)에 없는 선수가 가진 slug — 비활성 선수도 URL 이 남아 있으므로 다시 쓰면 안 된다"""
+    active = {row['player_id'] for row in rows}
+    return [row['slug'].strip() for row in db.select_all('football_players', 'player_id,slug', [not_is('slug', None)],
+                                                          order=['player_id'])
+            if row['player_id'] not in active and row['slug'].strip()]
+
+
+def plan_slugs(rows: list, reserved=()) -> tuple:
+    """(새 slug {player_id: slug}, 기존 slug 중복 수, slug 를 못 만든 선수 id 목록)
+
+    reserved: rows 밖의 선수가 이미 가진 slug (reserved_slugs). 새 slug 는 이것과도 겹치지 않게 만든다
+    """
+    allocator = SlugAllocator()
+    for slug in reserved:
+        allocator.claim(slug)
+    pending = []
+    existing_duplicates = 0
+    for row in sorted(rows, key=lambda r: r['player_id']):
+        if is_usable_player_slug(row.get('slug')):
+            existing_duplicates += not allocator.claim(row['slug'].strip())
+        else:
+            pending.append(row)
+
+    assigned, failed = {}, []
+    for row in pending:
+        base = name_slug(row)
+        if base:
+            assigned[row['player_id']] = allocator.allocate(base)
+        else:
+            failed.append(row['player_id'])
+    return assigned, existing_duplicates, failed
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('slugs', help='slug 가 없거나 쓸 수 없는 선수의 slug 일괄 생성 (전역 중복 해결)')
+    parser.add_argument('--snapshot', type=Path, default=PLAYER_COLUMNS_PATH, help='선수 열 단위 스냅샷')
+    parser.add_argument('--refresh', action='store_true', help='스냅샷을 DB 에서 다시 받음')
+    parser.add_argument('--chunk-size', type=int, default=500, help='upsert 청크 크기')
+    parser.add_argument('--dry-run', action='store_true', help='DB 를 쓰지 않고 생성될 slug 만 출력')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    report = RunReport('slugs')
+    snapshot = player_columns(SLUG_COLUMNS, args.snapshot, args.refresh)
+    rows = list(snapshot.rows(SLUG_COLUMNS))
+    db = SupabaseRest.from_env()
+    reserved = reserved_slugs(db, rows)
+    assigned, existing_duplicates, failed = plan_slugs(rows, reserved)
+
+    report.section('slugs').update({'players': len(rows), 'reserved': len(reserved), 'assigned': len(assigned),
+                                    'existing_duplicates': existing_duplicates, 'failed': len(failed)})
+    if existing_duplicates:
+        print(f"⚠ {existing_duplicates} existing slug(s) are shared by more than one player (left unchanged)")
+    if failed:
+        print(f"⚠ {len(failed)} player(s) have no name usable for a slug: {failed[:10]}")
+
+    if args.dry_run:
+        by_id = {row['player_id']: row for row in rows}
+        for player_id, slug in list(assigned.items())[:20]:
+            print(f"  {player_id:>8}  {by_id[player_id].get('name')!s:<30} → {slug}")
+        print(f"✓ Dry run: {len(assigned)} slug(s) would be written")
+        return
+
+    from .seo_flags import refresh_flags
+
+    if assigned:
+        by_id = {row['player_id']: row for row in rows}
+        updates = [
+            {'player_id': player_id, 'name': by_id[player_id]['name'], 'display_name': by_id[player_id]['display_name'],
+             'team_id': by_id[player_id]['team_id'], 'slug': slug}
+            for player_id, slug in assigned.items()
+        ]
+        db.upsert('football_players', updates, on_conflict='player_id', chunk_size=args.chunk_size)
+
+        slugs = snapshot.column('slug')
+        for position, player_id in enumerate(snapshot.column('player_id')):
+            if player_id in assigned:
+                slugs[position] = assigned[player_id]
+        snapshot.save(args.snapshot)
+
+    print(f"✓ Assigned {len(assigned)} slug(s) for {len(rows)} players")
+    refresh_flags(db, args.snapshot, args.chunk_size, report, refresh=False)
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,32 @@
+"""
+로컬 stand-in 서버
+
+실제 API/스토리지 대신 같은 프로토콜을 흉내 내는 로컬 서버. 운영 자격 증명 없이
+파이프라인을 실행하고 동작(조건부 요청, 할당량 등)을 확인할 때 사용한다.
+"""
+
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+
+@contextmanager
+def serve(server: StandinServer):
+    """백그라운드 스레드에서 서버를 띄우고 base_url 을 돌려줌"""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.base_url
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
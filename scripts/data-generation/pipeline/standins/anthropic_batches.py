@@ -0,0 +1,175 @@
+"""
+Anthropic Message Batches API stand-in
+
+POST /v1/messages/batches, GET /v1/messages/batches/<id>, GET /v1/messages/batches/<id>/results 만 흉내 낸다.
+배치는 조회(poll)를 ticks_to_complete 번 받은 뒤 ended 가 되고, 결과는 JSONL 로 내려준다.
+번역은 파이프라인 사전에 있으면 그 값, 없으면 '<이름> (번역)' 을 돌려준다.
+errored_every=N 이면 N 번째 요청마다 errored 결과를 섞는다 (재시도/집계 확인용).
+usage 는 글자 수로 대충 계산하며, 첫 요청 이후의 system prefix 는 cache_read 로 잡는다.
+
+사용법:
+    python -m pipeline.standins.anthropic_batches --port 8063
+"""
+
+import argparse
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+from . import StandinServer
+
+NAME_LINE = re.compile(r'^\d+\.\s+(.+)$', re.MULTILINE)
+
+
+def default_translate(name: str):
+    from ..translate.lexicons import load_all_lexicons
+
+    return load_all_lexicons().get(name, f'{name} (번역)')
+
+
+class AnthropicBatchStandin(StandinServer):
+    def __init__(self, address=('127.0.0.1', 0), translate=default_translate, ticks_to_complete: int = 2,
+                 errored_every: int = 0):
+        super().__init__(address, _Handler)
+        self.translate = translate
+        self.ticks_to_complete = ticks_to_complete
+        self.errored_every = errored_every
+        self.batches = {}
+        self.request_log = []
+        self.lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._cached_prefixes = set()
+
+    def create_batch(self, requests: list) -> dict:
+        with self.lock:
+            batch_id = f'msgbatch_{next(self._ids):06d}'
+            self.batches[batch_id] = {'requests': requests, 'polls': 0, 'results': None,
+                                      'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}
+        return self.describe(batch_id)
+
+    def describe(self, batch_id: str) -> dict:
+        batch = self.batches[batch_id]
+        total = len(batch['requests'])
+        ended = batch['results'] is not None
+        counts = {'processing': 0 if ended else total, 'succeeded': 0, 'errored': 0, 'canceled': 0, 'expired': 0}
+        for line in batch['results'] or []:
+            counts[line['result']['type']] += 1
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': counts,
+            'created_at': batch['created_at'],
+            'results_url': f'{self.base_url}/v1/messages/batches/{batch_id}/results' if ended else None,
+        }
+
+    def poll(self, batch_id: str) -> dict:
+        with self.lock:
+            batch = self.batches[batch_id]
+            batch['polls'] += 1
+            if batch['results'] is None and batch['polls'] >= self.ticks_to_complete:
+                batch['results'] = [self._process(i, request) for i, request in enumerate(batch['requests'], 1)]
+            return self.describe(batch_id)
+
+    def _process(self, index: int, request: dict) -> dict:
+        if self.errored_every and index % self.errored_every == 0:
+            return {'custom_id': request['custom_id'], 'result': {
+                'type': 'errored',
+                'error': {'type': 'error', 'error': {'type': 'overloaded_error', 'message': 'Overloaded'}},
+            }}
+
+        params = request['params']
+        prompt = params['messages'][0]['content']
+        system = ''.join(block['text'] for block in params.get('system', []))
+        names = NAME_LINE.findall(prompt)
+        text = json.dumps({name: self.translate(name) for name in names}, ensure_ascii=False)
+
+        prefix_tokens = len(system) // 4
+        cached = system in self._cached_prefixes
+        self._cached_prefixes.add(system)
+        return {'custom_id': request['custom_id'], 'result': {
+            'type': 'succeeded',
+            'message': {
+                'id': f'msg_{request["custom_id"]}',
+                'type': 'message',
+                'role': 'assistant',
+                'model': params.get('model'),
+                'content': [{'type': 'text', 'text': text}],
+                'stop_reason': 'end_turn',
+                'usage': {
+                    'input_tokens': len(prompt) // 4,
+                    'output_tokens': len(text) // 4,
+                    'cache_creation_input_tokens': 0 if cached else prefix_tokens,
+                    'cache_read_input_tokens': prefix_tokens if cached else 0,
+                },
+            },
+        }}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str = 'application/json'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, status: int, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+
+    def _not_found(self):
+        self._json(404, {'type': 'error', 'error': {'type': 'not_found_error', 'message': 'Batch not found'}})
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self.server.request_log.append(('POST', path))
+        if path != '/v1/messages/batches':
+            return self._not_found()
+        try:
+            requests = json.loads(body)['requests']
+        except (ValueError, KeyError):
+            return self._json(400, {'type': 'error', 'error': {'type': 'invalid_request_error', 'message': 'requests required'}})
+        self._json(200, self.server.create_batch(requests))
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        self.server.request_log.append(('GET', path))
+        parts = path.strip('/').split('/')
+        if parts[:3] != ['v1', 'messages', 'batches'] or len(parts) not in (4, 5) or parts[3] not in self.server.batches:
+            return self._not_found()
+
+        batch_id = parts[3]
+        if len(parts) == 4:
+            return self._json(200, self.server.poll(batch_id))
+
+        results = self.server.batches[batch_id]['results']
+        if parts[4] != 'results' or results is None:
+            return self._not_found()
+        body = '\n'.join(json.dumps(line, ensure_ascii=False) for line in results).encode('utf-8')
+        self._send(200, body, 'application/binary')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Anthropic Message Batches API stand-in')
+    parser.add_argument('--port', type=int, default=8063)
+    parser.add_argument('--ticks', type=int, default=2, help='ended 가 되기까지 필요한 조회 수')
+    parser.add_argument('--errored-every', type=int, default=0)
+    args = parser.parse_args()
+
+    server = AnthropicBatchStandin(('127.0.0.1', args.port), ticks_to_complete=args.ticks, errored_every=args.errored_every)
+    print(f"Anthropic batch stand-in: {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+API-Football stand-in 서버
+
+teams / players/squads / players/profiles 엔드포인트를 시드 데이터로 응답한다.
+응답마다 ETag, Last-Modified, x-ratelimit-* 헤더를 붙이고 조건부 요청에는 304 를 돌려준다.
+
+사용법:
+    python -m pipeline.standins.api_football --port 8061 [--seed seed.json]
+    FOOTBALL_API_BASE_URL=http://127.0.0.1:8061 python -m pipeline fetch --league saudi-pro-league --season 2025
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlsplit
+
+from ..leagues import LEAGUES
+from . import StandinServer
+
+POSITIONS = ['Goalkeeper', 'Defender', 'Midfielder', 'Attacker']
+
+
+def synthetic_dataset(teams_per_league: int = 4, players_per_team: int = 25) -> dict:
+    """리그 → 팀 → 선수 구조의 결정적인 가짜 데이터
+
+    팀은 PostgREST stand-in 과 같이 team_registry.json 의 팀(사우디, J1)을 쓰고, 없는 리그만 가짜 팀
+    → fetch 스냅샷으로 돌리는 생성기(build_saudi_file.py 등)가 레지스트리에 없는 팀 id 를 만나지 않는다.
+    """
+    from ..registry import load_registry
+
+    registry = load_registry()
+    leagues = {}
+    next_player_id = 1
+    for index, (key, league) in enumerate(sorted(LEAGUES.items())):
+        league_teams = [(team['team_id'], team['name']) for team in registry.league_teams(key)] or [
+            ((index + 1) * 1000 + t, f'{league["name"]} Team {t + 1}') for t in range(teams_per_league)
+        ]
+        teams = []
+        for team_id, team_name in league_teams:
+            players = []
+            for n in range(players_per_team):
+                players.append({
+                    'id': next_player_id,
+                    'name': f'Player {next_player_id}',
+                    'age': 18 + (next_player_id % 17),
+                    'number': n + 1,
+                    'position': POSITIONS[n % len(POSITIONS)],
+                    'photo': f'https://media.api-sports.io/football/players/{next_player_id}.png',
+                })
+                next_player_id += 1
+            teams.append({'id': team_id, 'name': team_name, 'players': players})
+        leagues[str(league['league_id'])] = teams
+    return leagues
+
+
+class ApiFootballStandin(StandinServer):
+    def __init__(self, address=('127.0.0.1', 0), dataset: dict = None, daily_quota: int = 7500):
+        super().__init__(address, _Handler)
+        self.dataset = dataset or synthetic_dataset()
+        self.quota_remaining = daily_quota
+        self.last_modified = formatdate(usegmt=True)
+        self.request_log = []
+        self.lock = threading.Lock()
+
+    def update_player(self, player_id: int, **fields):
+        """데이터 변경 (다음 요청부터 새 ETag → 200 응답)"""
+        with self.lock:
+            for teams in self.dataset.values():
+                for team in teams:
+                    for player in team['players']:
+                        if player['id'] == player_id:
+                            player.update(fields)
+            self.last_modified = formatdate(usegmt=True)
+
+    def route(self, path: str, query: dict):
+        if path == '/teams':
+            teams = self.dataset.get(query.get('league', ''), [])
+            return [{'team': {'id': t['id'], 'name': t['name']}} for t in teams]
+        if path == '/players/squads':
+            for teams in self.dataset.values():
+                for team in teams:
+                    if str(team['id']) == query.get('team'):
+                        return [{'team': {'id': team['id'], 'name': team['name']}, 'players': team['players']}]
+            return []
+        if path == '/players/profiles':
+            for teams in self.dataset.values():
+                for team in teams:
+                    for player in team['players']:
+                        if str(player['id']) == query.get('player'):
+                            return [{'player': {**player, 'team': {'id': team['id'], 'name': team['name']}}}]
+            return []
+        return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+        with server.lock:
+            server.quota_remaining -= 1
+            remaining = server.quota_remaining
+            response = server.route(parts.path, query)
+            last_modified = server.last_modified
+
+        if response is None:
+            self._send(404, b'{"message":"Endpoint not found"}', {})
+            server.request_log.append((parts.path, 404))
+            return
+
+        body = json.dumps({
+            'get': parts.path.lstrip('/'),
+            'parameters': query,
+            'errors': [],
+            'results': len(response),
+            'response': response,
+        }, ensure_ascii=False).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers = {
+            'ETag': etag,
+            'Last-Modified': last_modified,
+            'x-ratelimit-requests-remaining': str(remaining),
+        }
+
+        if self.headers.get('If-None-Match') == etag:
+            self._send(304, b'', headers)
+            server.request_log.append((parts.path, 304))
+            return
+
+        self._send(200, body, {**headers, 'Content-Type': 'application/json'})
+        server.request_log.append((parts.path, 200))
+
+    def _send(self, status: int, body: bytes, headers: dict):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API-Football stand-in 서버')
+    parser.add_argument('--port', type=int, default=8061)
+    parser.add_argument('--seed', default=None, help='{league_id: [team...]} 형식 JSON (없으면 가짜 데이터)')
+    parser.add_argument('--daily-quota', type=int, default=7500)
+    args = parser.parse_args()
+
+    dataset = None
+    if args.seed:
+        with open(args.seed, 'r', encoding='utf-8') as f:
+            dataset = json.load(f)
+
+    server = ApiFootballStandin(('127.0.0.1', args.port), dataset=dataset, daily_quota=args.daily_quota)
+    print(f"API-Football stand-in: {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+S3 호환 오브젝트 저장소 stand-in
+
+path-style /<bucket>/<key> 에 대한 PUT/GET/HEAD 만 지원하는 메모리 저장소.
+사진 캐싱 단계의 업로드 대상이자, 원본 사진 URL 을 흉내 내는 다운로드 소스로도 쓴다.
+
+사용법:
+    python -m pipeline.standins.object_store --port 8062
+"""
+
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import unquote, urlsplit
+
+from . import StandinServer
+
+
+class ObjectStoreStandin(StandinServer):
+    def __init__(self, address=('127.0.0.1', 0)):
+        super().__init__(address, _Handler)
+        self.objects = {}  # path → (content_type, bytes)
+        self.request_log = []
+        self.lock = threading.Lock()
+
+    def seed(self, path: str, data: bytes, content_type: str = 'application/octet-stream'):
+        with self.lock:
+            self.objects['/' + path.lstrip('/')] = (content_type, data)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _path(self) -> str:
+        return unquote(urlsplit(self.path).path)
+
+    def _lookup(self):
+        path = self._path()
+        with self.server.lock:
+            self.server.request_log.append((self.command, path))
+            return self.server.objects.get(path)
+
+    def do_HEAD(self):
+        found = self._lookup()
+        self.send_response(200 if found else 404)
+        self.send_header('Content-Length', str(len(found[1]) if found else 0))
+        self.end_headers()
+
+    def do_GET(self):
+        found = self._lookup()
+        if not found:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        content_type, data = found
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_PUT(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        data = self.rfile.read(length)
+        with self.server.lock:
+            self.server.request_log.append(('PUT', self._path()))
+            self.server.objects[self._path()] = (self.headers.get('Content-Type', 'application/octet-stream'), data)
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='S3 호환 오브젝트 저장소 stand-in')
+    parser.add_argument('--port', type=int, default=8062)
+    args = parser.parse_args()
+
+    server = ObjectStoreStandin(('127.0.0.1', args.port))
+    print(f"Object store stand-in: {server.base_url}")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
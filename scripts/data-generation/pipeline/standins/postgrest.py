@@ -0,0 +1,498 @@
+"""
+Supabase(PostgREST) stand-in 서버
+
+/rest/v1/<table> 을 메모리 테이블로 응답한다. 파이프라인(db.SupabaseRest)과 supabase-js 가 쓰는 만큼만 구현:
+- GET/HEAD: select 컬럼 목록, 필터 (eq, neq, gt, gte, lt, lte, is, in, like, ilike, not.<op>, or=(...), and=(...)),
+  order (a,b.desc,c.asc.nullslast), limit/offset 와 Range 헤더, Prefer: count=exact → Content-Range
+- POST: insert / upsert (Prefer: resolution=merge-duplicates|ignore-duplicates, on_conflict), return=minimal|representation
+- PATCH / DELETE: 필터에 맞는 행 수정/삭제
+- 실제 PostgREST 처럼 한 번에 max_rows(기본 1000)행까지만 돌려주고, bulk insert 의 키가 행마다 다르면 400,
+  NOT NULL 컬럼이 빠진 upsert 행은 400 (football_players 는 name, display_name, team_id 필요)
+
+지연/오류 주입 (배치 크기, 동시성, 재시도 동작을 한 머신에서 재기 위해):
+- latency_ms + 0~jitter_ms 무작위 + 응답/요청 행 수 × row_latency_us
+- error_rate 확률 또는 error_every 번째 요청마다 error_status(기본 503) — 쓰기 요청은 적용 전에 실패
+
+시드는 football_teams / football_players. 기본은 team_registry.json 의 팀(사우디, J1)과 나머지 리그의 가짜 팀에
+결정적인 가짜 선수를 채운 데이터, --seed 로 {table: [행...]} JSON 을 줄 수 있다.
+
+사용법:
+    python -m pipeline.standins.postgrest --port 8064 [--latency-ms 40 --jitter-ms 20 --error-rate 0.02]
+    SUPABASE_URL=http://127.0.0.1:8064 SUPABASE_SERVICE_ROLE_KEY=local python -m pipeline slugs --refresh --dry-run
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qsl, urlsplit
+
+from ..leagues import LEAGUES
+from . import StandinServer
+from .api_football import POSITIONS
+
+MAX_ROWS = 1000
+RESERVED_PARAMS = {'select', 'order', 'limit', 'offset', 'on_conflict', 'columns'}
+PRIMARY_KEYS = {'football_players': ['player_id'], 'football_teams': ['team_id']}
+NOT_NULL = {
+    'football_players': ['player_id', 'name', 'display_name', 'team_id'],
+    'football_teams': ['team_id', 'name', 'display_name', 'country', 'league_id', 'league_name'],
+}
+NATIONALITIES = ['Japan', 'Saudi Arabia', 'Brazil', 'Netherlands', 'Portugal', 'USA', 'Korea Republic', 'France']
+# 가짜 선수 이름 = 이름 × 성 조합 (slugs/번역 단계가 'Player N' 같은 대체 이름으로 거르지 않게)
+GIVEN_NAMES = ['Kenta', 'Yuki', 'Salem', 'Fahad', 'Lucas', 'Rafael', 'Daan', 'Joao', 'Tyler', 'Min-Jae',
+               'Hiroki', 'Abdullah', 'Mateus', 'Thijs', 'Diogo', 'Jordan', 'Ryo', 'Nasser', 'Bruno', 'Sem']
+FAMILY_NAMES = ['Tanaka', 'Suzuki', 'Al-Dawsari', 'Al-Shahrani', 'Silva', 'Santos', 'de Jong', 'Bakker',
+                'Costa', 'Pereira', 'Miller', 'Adams', 'Kim', 'Watanabe', 'Al-Faraj', 'Oliveira', 'Visser',
+                'Ferreira', 'Johnson', 'Yamamoto', 'Al-Qahtani', 'Souza', 'Smit', 'Rodrigues', 'Brown',
+                'Ito', 'Nakamura', 'Al-Harbi', 'Lima', 'Jansen', 'Martins', 'Davis', 'Kobayashi', 'Hayashi',
+                'Al-Otaibi', 'Gomes', 'Mulder', 'Lopes', 'Wilson', 'Sato']
+# 시드 행의 created_at / updated_at. last_api_sync 는 null (sync 가 전부 stale 로 보고 갱신)
+SEED_TIMESTAMP = '2025-01-01T00:00:00+00:00'
+LEAGUE_COUNTRIES = {'saudi-pro-league': 'Saudi-Arabia', 'j1-league': 'Japan', 'eredivisie': 'Netherlands',
+                    'primeira-liga': 'Portugal', 'mls': 'USA'}
+LEAGUE_COUNTRIES_KO = {'Saudi-Arabia': '사우디아라비아', 'Japan': '일본', 'Netherlands': '네덜란드', 'Portugal': '포르투갈',
+                       'USA': '미국'}
+
+
+class RequestError(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+def synthetic_tables(teams_per_league: int = 4, players_per_team: int = 25) -> dict:
+    """레지스트리 팀(없는 리그는 가짜 팀) + 결정적인 가짜 선수"""
+    from ..registry import load_registry
+
+    registry = load_registry()
+    teams, players = [], []
+    next_player_id = 1
+    for index, (key, league) in enumerate(sorted(LEAGUES.items())):
+        league_teams = registry.league_teams(key) or [
+            {'team_id': (index + 1) * 1000 + t, 'name': f"{league['name']} Team {t + 1}", 'korean': None}
+            for t in range(teams_per_league)
+        ]
+        for team in league_teams:
+            teams.append({
+                'team_id': team['team_id'], 'name': team['name'], 'display_name': team['name'],
+                'name_ko': team.get('korean'), 'league_id': league['league_id'], 'league_name': league['name'],
+                'short_name': None, 'slug': None, 'league_name_ko': league.get('korean'),
+                'country': LEAGUE_COUNTRIES.get(key, league['name']),
+                'country_ko': LEAGUE_COUNTRIES_KO.get(LEAGUE_COUNTRIES.get(key)), 'is_active': True,
+                'created_at': SEED_TIMESTAMP, 'updated_at': SEED_TIMESTAMP,
+            })
+            for n in range(players_per_team):
+                player_id = next_player_id
+                next_player_id += 1
+                given = GIVEN_NAMES[player_id % len(GIVEN_NAMES)]
+                family = FAMILY_NAMES[(player_id // len(GIVEN_NAMES)) % len(FAMILY_NAMES)]
+                players.append({
+                    'id': player_id, 'player_id': player_id, 'name': f'{given[0]}. {family}',
+                    'display_name': f'{given} {family}', 'korean_name': None, 'team_id': team['team_id'],
+                    'team_name': team['name'], 'position': POSITIONS[n % len(POSITIONS)], 'number': n + 1,
+                    'age': 18 + (player_id % 17), 'nationality': NATIONALITIES[player_id % len(NATIONALITIES)],
+                    'nationality_ko': None, 'is_active': True, 'popularity_score': (player_id * 37) % 1000,
+                    'slug': None, 'seo_worthless': None,
+                    'photo_url': f'https://media.api-sports.io/football/players/{player_id}.png',
+                    'photo_cached_url': None, 'photo_variants': None, 'last_api_sync': None,
+                    'created_at': SEED_TIMESTAMP, 'updated_at': SEED_TIMESTAMP,
+                })
+    return {'football_teams': teams, 'football_players': players}
+
+
+def _split_top_level(text: str) -> list:
+    """'a.eq.1,and(b.gt.2,c.lt.3),d.in.(1,2)' → 괄호/따옴표 밖의 쉼표로 분리"""
+    parts, depth, quoted, current = [], 0, False, []
+    for ch in text:
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == '(':
+            depth += 1
+        elif not quoted and ch == ')':
+            depth -= 1
+        elif not quoted and depth == 0 and ch == ',':
+            parts.append(''.join(current))
+            current = []
+            continue
+        current.append(ch)
+    if current:
+        parts.append(''.join(current))
+    return parts
+
+
+def _unquote(value: str) -> str:
+    return value[1:-1] if len(value) >= 2 and value[0] == value[-1] == '"' else value
+
+
+def _coerce(value, literal: str):
+    """행 값의 타입에 맞춰 필터 리터럴 변환"""
+    if isinstance(value, bool):
+        return literal == 'true'
+    if isinstance(value, (int, float)):
+        try:
+            return float(literal)
+        except ValueError:
+            return literal
+    return literal
+
+
+def _like(pattern: str, flags=0):
+    regex = ''.join('.*' if ch in '*%' else re.escape(ch) for ch in pattern)
+    return re.compile(f'^{regex}$', flags | re.DOTALL)
+
+
+def _matches(row: dict, column: str, operator: str, literal: str) -> bool:
+    if operator.startswith('not.'):
+        return not _matches(row, column, operator[4:], literal)
+    if column not in row:
+        raise RequestError(400, '42703', f'column {column} does not exist')
+    value = row[column]
+    if operator == 'is':
+        return {'null': value is None, 'true': value is True, 'false': value is False,
+                'unknown': value is None}.get(literal, False)
+    if value is None:
+        return False
+    if operator == 'in':
+        options = [_unquote(item) for item in _split_top_level(literal.strip('()'))]
+        return any(value == _coerce(value, option) for option in options)
+    if operator in ('like', 'ilike'):
+        return bool(_like(literal, re.IGNORECASE if operator == 'ilike' else 0).match(str(value)))
+    target = _coerce(value, literal)
+    if isinstance(value, str) and not isinstance(target, str):
+        target = literal
+    try:
+        return {
+            'eq': value == target, 'neq': value != target,
+            'gt': value > target, 'gte': value >= target, 'lt': value < target, 'lte': value <= target,
+        }[operator]
+    except KeyError:
+        raise RequestError(400, 'PGRST100', f'unknown operator {operator}') from None
+    except TypeError:
+        return False
+
+
+def _parse_condition(expression: str):
+    """or=(...) 안의 항목 하나: 'col.op.value', 'not.and(...)', 'and(...)', 'or(...)'"""
+    negate = expression.startswith('not.')
+    if negate:
+        expression = expression[4:]
+    for logic in ('and', 'or'):
+        if expression.startswith(f'{logic}(') and expression.endswith(')'):
+            predicate = _logic_predicate(logic, expression[len(logic) + 1:-1])
+            return (lambda row: not predicate(row)) if negate else predicate
+    column, _, rest = expression.partition('.')
+    operator, _, literal = rest.partition('.')
+    if operator == 'not':
+        inner, _, literal = literal.partition('.')
+        operator = f'not.{inner}'
+    if negate:
+        operator = f'not.{operator}'
+    return lambda row: _matches(row, column, operator, _unquote(literal))
+
+
+def _logic_predicate(logic: str, body: str):
+    predicates = [_parse_condition(item) for item in _split_top_level(body)]
+    combine = any if logic == 'or' else all
+    return lambda row: combine(predicate(row) for predicate in predicates)
+
+
+def build_filter(params: list):
+    """쿼리 파라미터 [(키, 값)] → 행 predicate (모든 필터 AND)"""
+    predicates = []
+    for key, value in params:
+        if key in RESERVED_PARAMS:
+            continue
+        if key in ('or', 'and', 'not.or', 'not.and'):
+            predicates.append(_parse_condition(f'{key}{value}'))
+            continue
+        operator, _, literal = value.partition('.')
+        if operator == 'not':
+            inner, _, literal = literal.partition('.')
+            operator = f'not.{inner}'
+        predicates.append(lambda row, c=key, o=operator, v=literal: _matches(row, c, o, v))
+    return lambda row: all(predicate(row) for predicate in predicates)
+
+
+def sort_rows(rows: list, order: str) -> list:
+    """order=a,b.desc,c.asc.nullsfirst (PostgreSQL 기본: asc 는 nulls last, desc 는 nulls first)"""
+    for term in reversed([term for term in order.split(',') if term]):
+        column, *modifiers = term.split('.')
+        descending = 'desc' in modifiers
+        nulls_first = 'nullsfirst' in modifiers or (descending and 'nullslast' not in modifiers)
+        present = [row for row in rows if row.get(column) is not None]
+        missing = [row for row in rows if row.get(column) is None]
+        present.sort(key=lambda row: row[column], reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+class PostgrestStandin(StandinServer):
+    def __init__(self, address=('127.0.0.1', 0), tables: dict = None, max_rows: int = MAX_ROWS,
+                 latency_ms: float = 0, jitter_ms: float = 0, row_latency_us: float = 0,
+                 error_rate: float = 0.0, error_every: int = 0, error_status: int = 503, random_seed: int = None):
+        super().__init__(address, _Handler)
+        self.tables = tables if tables is not None else synthetic_tables()
+        self.max_rows = max_rows
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.row_latency_us = row_latency_us
+        self.error_rate = error_rate
+        self.error_every = error_every
+        self.error_status = error_status
+        self.random = random.Random(random_seed)
+        self.request_log = []  # (method, table, status, rows, ms)
+        self.lock = threading.Lock()
+        self._requests = 0
+
+    def inject_error(self) -> bool:
+        with self.lock:
+            self._requests += 1
+            if self.error_every and self._requests % self.error_every == 0:
+                return True
+            return bool(self.error_rate) and self.random.random() < self.error_rate
+
+    def delay(self, rows: int):
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        seconds = (self.latency_ms + jitter) / 1000 + rows * self.row_latency_us / 1e6
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def table(self, name: str) -> list:
+        if name not in self.tables:
+            raise RequestError(404, '42P01', f'relation "public.{name}" does not exist')
+        return self.tables[name]
+
+    def select(self, name: str, params: list, range_header: str = None) -> tuple:
+        """(행 목록, 시작 offset, 전체 수)"""
+        query = dict(params)
+        with self.lock:
+            rows = [row for row in self.table(name) if build_filter(params)(row)]
+        if 'order' in query:
+            rows = sort_rows(rows, query['order'])
+        total = len(rows)
+
+        offset = int(query.get('offset') or 0)
+        limit = int(query['limit']) if 'limit' in query else None
+        if range_header and '-' in range_header:
+            start, _, end = range_header.partition('-')
+            offset = int(start or 0)
+            if end:
+                limit = int(end) - offset + 1
+        limit = self.max_rows if limit is None else min(limit, self.max_rows)
+        rows = rows[offset:offset + limit]
+
+        columns = query.get('select', '*')
+        if columns.strip() != '*':
+            names = [column.strip() for column in columns.split(',') if column.strip()]
+            for column in names:
+                if rows and column not in rows[0]:
+                    raise RequestError(400, '42703', f'column {name}.{column} does not exist')
+            rows = [{column: row.get(column) for column in names} for row in rows]
+        else:
+            rows = [dict(row) for row in rows]
+        return rows, offset, total
+
+    def write(self, name: str, payload, on_conflict: str, resolution: str) -> list:
+        rows = payload if isinstance(payload, list) else [payload]
+        keys = {frozenset(row) for row in rows}
+        if len(keys) > 1:
+            raise RequestError(400, 'PGRST102', 'All object keys must match')
+        for row in rows:
+            for column in NOT_NULL.get(name, []):
+                if row.get(column) is None:
+                    raise RequestError(400, '23502', f'null value in column "{column}" of relation "{name}" '
+                                                     'violates not-null constraint')
+
+        conflict = [column.strip() for column in on_conflict.split(',')] if on_conflict else PRIMARY_KEYS.get(name, [])
+        written = []
+        with self.lock:
+            table = self.table(name)
+            index = {tuple(row.get(column) for column in conflict): row for row in table} if conflict else {}
+            for row in rows:
+                key = tuple(row.get(column) for column in conflict)
+                existing = index.get(key) if conflict else None
+                if existing is not None:
+                    if resolution == 'ignore-duplicates':
+                        continue
+                    if resolution != 'merge-duplicates':
+                        raise RequestError(409, '23505', f'duplicate key value violates unique constraint ({on_conflict})')
+                    existing.update(row)
+                    written.append(dict(existing))
+                else:
+                    created = dict(row)
+                    table.append(created)
+                    if conflict:
+                        index[key] = created
+                    written.append(dict(created))
+        return written
+
+    def update(self, name: str, params: list, values: dict) -> list:
+        predicate = build_filter(params)
+        with self.lock:
+            updated = [row for row in self.table(name) if predicate(row)]
+            for row in updated:
+                row.update(values)
+            return [dict(row) for row in updated]
+
+    def delete(self, name: str, params: list) -> list:
+        predicate = build_filter(params)
+        with self.lock:
+            table = self.table(name)
+            removed = [row for row in table if predicate(row)]
+            table[:] = [row for row in table if not predicate(row)]
+            return removed
+
+    def stats(self) -> dict:
+        """메서드별 요청 수 / 오류 수 / 행 수 / 평균 ms"""
+        summary = {}
+        for method, _, status, rows, ms in list(self.request_log):
+            entry = summary.setdefault(method, {'requests': 0, 'errors': 0, 'rows': 0, 'total_ms': 0.0})
+            entry['requests'] += 1
+            entry['errors'] += status >= 400
+            entry['rows'] += rows
+            entry['total_ms'] += ms
+        for entry in summary.values():
+            entry['avg_ms'] = round(entry['total_ms'] / entry['requests'], 3)
+            entry['total_ms'] = round(entry['total_ms'], 3)
+        return summary
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _table(self):
+        parts = urlsplit(self.path)
+        path = parts.path.strip('/').split('/')
+        if len(path) != 3 or path[:2] != ['rest', 'v1']:
+            raise RequestError(404, 'PGRST125', f'Invalid path: {parts.path}')
+        return path[2], parse_qsl(parts.query, keep_blank_values=True)
+
+    def _prefer(self) -> dict:
+        prefer = {}
+        for item in (self.headers.get('Prefer') or '').split(','):
+            key, _, value = item.strip().partition('=')
+            if key:
+                prefer[key] = value
+        return prefer
+
+    def _body(self):
+        raw = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        try:
+            return json.loads(raw or b'null')
+        except ValueError:
+            raise RequestError(400, 'PGRST102', 'Empty or invalid json') from None
+
+    def _send(self, status: int, payload=None, headers: dict = None, head: bool = False):
+        body = b'' if payload is None else json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(0 if head else len(body)))
+        self.end_headers()
+        if not head and body:
+            self.wfile.write(body)
+
+    def _handle(self, method: str):
+        server = self.server
+        started = time.perf_counter()
+        table, rows, status = '', 0, 500
+        try:
+            table, params = self._table()
+            body = self._body() if method in ('POST', 'PATCH') else None
+            rows = len(body) if isinstance(body, list) else int(body is not None)
+            if server.inject_error():
+                server.delay(0)
+                status = server.error_status
+                return self._send(status, {'code': 'PGRST000', 'message': 'Injected error (stand-in)'})
+
+            prefer = self._prefer()
+            representation = prefer.get('return') == 'representation'
+            if method in ('GET', 'HEAD'):
+                result, offset, total = server.select(table, params, (self.headers.get('Range') or '').strip())
+                rows = len(result)
+                server.delay(rows)
+                end = offset + len(result) - 1
+                content_range = f'{offset}-{end}' if result else '*'
+                content_range += f'/{total}' if prefer.get('count') == 'exact' else '/*'
+                status = 206 if result and len(result) < total and prefer.get('count') == 'exact' else 200
+                return self._send(status, result, {'Content-Range': content_range}, head=method == 'HEAD')
+
+            server.delay(rows)
+            query = dict(params)
+            if method == 'POST':
+                result = server.write(table, body, query.get('on_conflict'), prefer.get('resolution'))
+                status = 201
+            elif method == 'PATCH':
+                result = server.update(table, params, body or {})
+                status = 200 if representation else 204
+            else:
+                result = server.delete(table, params)
+                status = 200 if representation else 204
+            rows = max(rows, len(result))
+            return self._send(status, result if representation else None)
+        except RequestError as e:
+            status = e.status
+            return self._send(status, {'code': e.code, 'message': str(e), 'details': None, 'hint': None})
+        finally:
+            server.request_log.append((method, table, status, rows, (time.perf_counter() - started) * 1000))
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_HEAD(self):
+        self._handle('HEAD')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Supabase(PostgREST) stand-in 서버')
+    parser.add_argument('--port', type=int, default=8064)
+    parser.add_argument('--seed', default=None, help='{table: [행...]} 형식 JSON (없으면 가짜 데이터)')
+    parser.add_argument('--max-rows', type=int, default=MAX_ROWS, help='요청당 최대 행 수 (PostgREST db-max-rows)')
+    parser.add_argument('--latency-ms', type=float, default=0, help='요청마다 더하는 지연')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='0~jitter 무작위 지연 추가')
+    parser.add_argument('--row-latency-us', type=float, default=0, help='읽거나 쓴 행마다 더하는 지연')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='이 확률로 error-status 응답')
+    parser.add_argument('--error-every', type=int, default=0, help='N 번째 요청마다 error-status 응답')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--random-seed', type=int, default=None, help='지연/오류 무작위 시드 (재현용)')
+    args = parser.parse_args()
+
+    tables = None
+    if args.seed:
+        with open(args.seed, 'r', encoding='utf-8') as f:
+            tables = json.load(f)
+
+    server = PostgrestStandin(('127.0.0.1', args.port), tables=tables, max_rows=args.max_rows,
+                              latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                              row_latency_us=args.row_latency_us, error_rate=args.error_rate,
+                              error_every=args.error_every, error_status=args.error_status,
+                              random_seed=args.random_seed)
+    counts = ', '.join(f'{name}: {len(rows)}' for name, rows in server.tables.items())
+    print(f"PostgREST stand-in: {server.base_url} (SUPABASE_URL) — {counts}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+"""
+TTL + 인기도 우선 증분 선수 동기화
+
+리그 전체를 매번 다시 처리하는 대신, last_api_sync 가 TTL 보다 오래된 선수만 골라
+popularity_score 순 우선순위 큐에 넣고 실행당 API 예산 안에서 갱신한다.
+
+비용 모델: players/squads?team= 1회 호출로 그 팀의 모든 선수가 갱신된다. 큐에서 가장 인기 있는
+선수부터 꺼내며, 그 선수의 팀이 아직 계획에 없으면 예산 1을 써서 팀을 추가한다.
+→ 예산은 인기 선수가 있는 팀부터 채워지고, 같은 팀의 다른 stale 선수는 추가 비용 없이 함께 갱신된다.
+
+스쿼드 응답에 없는 선수(이적/방출/team_id 가 틀림)는 갱신하지 않았으므로 last_api_sync 를 찍지 않는다.
+stale 로 남아 다음 실행에서 팀을 다시 확인하고, 선수 id 는 출력에 남겨 소속을 따로 확인할 수 있게 한다.
+
+사용법:
+    python -m pipeline sync --ttl-hours 72 --budget 100 [--league saudi-pro-league]
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from .db import SupabaseRest, eq, in_, not_is, or_
+from .fetcher import ApiError, ApiFootballFetcher, QuotaExceeded
+from .http_client import HttpPool
+from .leagues import get_league
+
+CANDIDATE_COLUMNS = 'player_id,name,display_name,team_id,popularity_score,last_api_sync,photo_url'
+
+
+@dataclass
+class SyncPlan:
+    team_ids: list = field(default_factory=list)
+    players: dict = field(default_factory=dict)  # team_id → [row]
+    skipped: int = 0  # 예산 초과로 이번 실행에서 빠진 stale 선수 수
+
+
+@dataclass
+class SyncResult:
+    api_calls: int = 0
+    refreshed: int = 0
+    missing_from_squad: int = 0
+    missing_ids: list = field(default_factory=list)  # 스쿼드에 없던 선수 (last_api_sync 그대로)
+    skipped: int = 0
+    failed_teams: list = field(default_factory=list)
+
+
+def priority(row: dict) -> tuple:
+    """heapq 는 최소 힙 → 인기도 높은 순, 같으면 오래 동기화 안 된 순"""
+    return (-(row.get('popularity_score') or 0), row.get('last_api_sync') or '', row['player_id'])
+
+
+def stale_players(db: SupabaseRest, ttl: timedelta, now: datetime, team_ids: list = None):
+    cutoff = (now - ttl).isoformat()
+    # team_id 가 없는 선수는 스쿼드 요청을 만들 수 없어 후보에서 뺀다
+    filters = [eq('is_active', True), not_is('team_id', None), or_('last_api_sync.is.null', f'last_api_sync.lt.{cutoff}')]
+    if team_ids:
+        filters.append(in_('team_id', team_ids))
+    return db.select_all('football_players', CANDIDATE_COLUMNS, filters, order=['player_id'])
+
+
+def plan_sync(candidates, budget: int) -> SyncPlan:
+    """우선순위 큐에서 꺼내며 예산(팀 단위 호출 수)을 채움"""
+    heap = [(priority(row), row) for row in candidates]
+    heapq.heapify(heap)
+
+    by_team = {}
+    for _, row in heap:
+        by_team.setdefault(row['team_id'], []).append(row)
+
+    plan = SyncPlan()
+    while heap:
+        _, row = heapq.heappop(heap)
+        team_id = row['team_id']
+        if team_id in plan.players:
+            continue
+        if len(plan.team_ids) >= budget:
+            plan.skipped += 1
+            continue
+        plan.team_ids.append(team_id)
+        plan.players[team_id] = by_team[team_id]
+    return plan
+
+
+def refresh_rows(plan_rows: list, squad: dict, synced_at: str) -> tuple:
+    """스쿼드 응답으로 갱신할 행 목록과 스쿼드에 없는 선수 id 목록 (이 선수들은 행을 만들지 않는다)"""
+    api_players = {p['id']: p for p in squad.get('players') or []}
+    rows = []
+    missing = []
+    for row in plan_rows:
+        api = api_players.get(row['player_id'])
+        if api is None:
+            missing.append(row['player_id'])
+            continue
+        update = {
+            'player_id': row['player_id'],
+            'name': api.get('name') or row['name'],
+            'display_name': row['display_name'],
+            'team_id': row['team_id'],
+            'age': api.get('age'),
+            'number': api.get('number'),
+            'position': api.get('position'),
+            'photo_url': api.get('photo'),
+            'last_api_sync': synced_at,
+            'updated_at': synced_at,
+        }
+        if api.get('photo') != row.get('photo_url'):
+            # 원본 사진이 바뀌면 캐시 주소를 비워 photos 단계가 DB 만 보고 다시 받게 한다
+            update['photo_cached_url'] = None
+        rows.append(update)
+    return rows, missing
+
+
+def run_sync(db: SupabaseRest, fetcher: ApiFootballFetcher, ttl: timedelta, budget: int,
+             team_ids: list = None, now: datetime = None) -> SyncResult:
+    now = now or datetime.now(timezone.utc)
+    plan = plan_sync(stale_players(db, ttl, now, team_ids), budget)
+    result = SyncResult(skipped=plan.skipped)
+    synced_at = now.isoformat()
+
+    updates = []
+    for team_id in plan.team_ids:
+        try:
+            data = fetcher.get('players/squads', {'team': team_id})
+        except QuotaExceeded as e:
+            print(f"⚠ {e} — stopping early")
+            break
+        except ApiError as e:
+            # 팀 하나의 실패로 실행 전체를 멈추지 않는다. 이 팀 선수는 stale 로 남아 다음 실행에서 다시 시도
+            print(f"⚠ Team {team_id}: {e}")
+            result.failed_teams.append(team_id)
+            continue
+        result.api_calls += 1
+        squad = (data.get('response') or [{}])[0]
+        rows, missing = refresh_rows(plan.players[team_id], squad, synced_at)
+        updates.extend(rows)
+        result.missing_from_squad += len(missing)
+        result.missing_ids.extend(missing)
+
+    # PostgREST 는 한 요청의 행들이 같은 키 집합이어야 하므로 키 집합별로 나눠 upsert
+    # (갱신 / 사진 바뀜)
+    groups = {}
+    for row in updates:
+        groups.setdefault(frozenset(row), []).append(row)
+    for rows in groups.values():
+        db.upsert('football_players', rows, on_conflict='player_id')
+    result.refreshed = len(updates)
+    return result
+
+
+def league_team_ids(db: SupabaseRest, league_key: str) -> list:
+    league = get_league(league_key)
+    rows = db.select('football_teams', 'team_id', [eq('league_id', league['league_id'])])
+    return [row['team_id'] for row in rows]
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('sync', help='TTL 지난 선수를 인기도 순으로 API 예산만큼 갱신')
+    parser.add_argument('--ttl-hours', type=float, default=72)
+    parser.add_argument('--budget', type=int, required=True, help='이번 실행의 API 호출 수 (팀 스쿼드 단위)')
+    parser.add_argument('--league', action='append', default=[], help='리그 key 로 범위 제한 (여러 번 지정 가능)')
+    parser.add_argument('--base-url', default=None, help='API 주소 (로컬 stand-in 서버 테스트용)')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    with HttpPool() as pool:
+        db = SupabaseRest.from_env(pool=pool)
+        fetcher = ApiFootballFetcher(base_url=args.base_url, pool=pool, max_requests=args.budget)
+        team_ids = None
+        if args.league:
+            team_ids = []
+            for key in args.league:
+                league_ids = league_team_ids(db, key)
+                if not league_ids:
+                    # 빈 목록을 '전체 팀'으로 넓히면 요청 범위 밖에서 예산을 모두 쓴다
+                    raise SystemExit(f'No teams found for league {key} in football_teams — nothing to sync')
+                team_ids.extend(league_ids)
+        result = run_sync(db, fetcher, timedelta(hours=args.ttl_hours), args.budget, team_ids)
+
+    print(f"✓ API calls: {result.api_calls}/{args.budget} (304 Not Modified: {fetcher.stats.not_modified})")
+    print(f"✓ Refreshed players: {result.refreshed}")
+    if result.missing_from_squad:
+        print(f"⚠ Not in current squad (last_api_sync unchanged, team re-checked next run): "
+              f"{result.missing_from_squad} {result.missing_ids[:20]}")
+    if result.failed_teams:
+        print(f"⚠ Failed teams (retried next run): {result.failed_teams}")
+    if result.skipped:
+        print(f"  Deferred to next run: {result.skipped}")
@@ -0,0 +1,228 @@
+"""
+기존 게시글/크롤링 문서 오프라인 엔티티 태깅
+
+엔티티 링크와 관련 CTA 는 작성 시점에 처리된 글에만 있다. 오래된 게시글과 board_page.html /
+foreign_news.html 같은 크롤링 덤프를 스트리밍으로 읽어 마크업을 걷어내고, aliases 오토마톤
+(python -m pipeline aliases 산출물)으로 선수/팀을 찾는다. 본문에 이미 있는 내부 링크
+(/livescore/football/{team|player}/<id>)도 함께 모은다.
+
+- 매칭은 ProcessPoolExecutor 로 분산, 각 워커는 오토마톤을 한 번만 읽는다
+- 게시글 결과는 post_entity_tags 에 청크 단위 upsert (테이블: docs/post-entity-tags.sql)
+- HTML 문서 결과는 JSONL 로 저장 (.pipeline-cache/tags/html.jsonl)
+
+사용법:
+    python -m pipeline tag [--since 2024-01-01] [--workers 8]
+    python -m pipeline tag --html ../../board_page.html ../../foreign_news.html
+"""
+
+import html
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import config
+from .aliases import ALIASES_PATH, AliasAutomaton
+from .report import RunReport
+
+TAGS_TABLE = 'post_entity_tags'
+BATCH_SIZE = 2000
+DEFAULT_CHUNK_SIZE = 500
+
+ENTITY_HREF = re.compile(r'/livescore/football/(team|player)/(\d+)')
+HTML_ANCHOR = re.compile(r'<a\b[^>]*\bhref=(["\'])(.*?)\1[^>]*>([\s\S]*?)</a>', re.IGNORECASE)
+HTML_SKIP_BLOCKS = re.compile(r'<(script|style|noscript|template)\b[\s\S]*?</\1\s*>', re.IGNORECASE)
+HTML_TAG = re.compile(r'<[^>]+>')
+
+_automaton = None
+
+
+def strip_html(markup: str) -> str:
+    text = HTML_TAG.sub(' ', HTML_SKIP_BLOCKS.sub(' ', markup))
+    return ' '.join(html.unescape(text).split())
+
+
+def html_links(markup: str) -> list:
+    """extractInternalEntityLinksFromContent 처럼 a 태그 href 의 내부 엔티티 링크"""
+    links = []
+    for match in HTML_ANCHOR.finditer(markup):
+        found = ENTITY_HREF.search(html.unescape(match.group(2)))
+        if found:
+            links.append((found.group(1), int(found.group(2)), strip_html(match.group(3))))
+    return links
+
+
+def tiptap_text(node, parts: list, links: list):
+    """TipTap JSON → 텍스트 조각 + link 마크/HTML a 태그의 내부 엔티티 링크"""
+    if isinstance(node, list):
+        for child in node:
+            tiptap_text(child, parts, links)
+        return
+    if not isinstance(node, dict):
+        return
+    if node.get('type') == 'text':
+        text = node.get('text') or ''
+        parts.append(text)
+        for mark in node.get('marks') or []:
+            found = ENTITY_HREF.search(str((mark.get('attrs') or {}).get('href') or ''))
+            if mark.get('type') == 'link' and found:
+                links.append((found.group(1), int(found.group(2)), text))
+        return
+    # RSS 카드 등 HTML 문자열 필드 (extractInternalEntityLinksFromContent 의 walkNode 와 같은 필드)
+    for key in ('description', 'content'):
+        if isinstance(node.get(key), str):
+            parts.append(strip_html(node[key]))
+            links.extend(html_links(node[key]))
+    tiptap_text(node.get('content'), parts, links)
+
+
+def document_text(content) -> tuple:
+    """게시글 content (TipTap JSON, JSON 문자열, HTML 문자열) → (텍스트, 내부 링크)"""
+    if isinstance(content, str) and content.strip().startswith('{'):
+        try:
+            content = json.loads(content)
+        except ValueError:
+            pass
+    if isinstance(content, str):
+        return strip_html(content), html_links(content)
+    parts, links = [], []
+    tiptap_text(content, parts, links)
+    return ' '.join(parts), links
+
+
+def _init_worker(path: str):
+    global _automaton
+    _automaton = AliasAutomaton.load(path)
+
+
+def _tag_job(document):
+    """(doc_id, 제목, content) → (doc_id, [(type, id, 찾은 글자, source)])"""
+    doc_id, title, content = document
+    text, links = document_text(content)
+    text = f'{title}\n{text}' if title else text
+
+    tags, seen = [], set()
+    for kind, entity_id, label in links:
+        if (kind, entity_id) not in seen:
+            seen.add((kind, entity_id))
+            tags.append((kind, entity_id, label, 'link'))
+    for match in _automaton.find_entities(text, max_links=None):
+        key = (match.record.type, match.record.id)
+        if key not in seen:
+            seen.add(key)
+            tags.append((*key, text[match.start:match.end], 'alias'))
+    return doc_id, tags
+
+
+def tag_documents(documents, automaton_path: Path = ALIASES_PATH, workers: int = None):
+    """(doc_id, tags) 를 입력 순서대로 돌려준다. 입력은 BATCH_SIZE 단위로 끊어 메모리를 일정하게 유지"""
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker,
+                             initargs=(str(automaton_path),)) as executor:
+        batch = []
+        for document in documents:
+            batch.append(document)
+            if len(batch) >= BATCH_SIZE:
+                yield from executor.map(_tag_job, batch, chunksize=64)
+                batch = []
+        if batch:
+            yield from executor.map(_tag_job, batch, chunksize=64)
+
+
+def post_documents(db, since: str = None, limit: int = None):
+    """본문은 posts_content 에 따로 저장되므로 posts 를 inner join 해 제목과 삭제 여부를 함께 읽는다"""
+    from .db import eq, gte
+
+    filters = [eq('posts.is_deleted', False)]
+    if since:
+        filters.append(gte('created_at', since))
+    rows = db.select_all('posts_content', 'post_id,content,posts!inner(title,is_deleted)', filters,
+                         order=['created_at', 'post_id'])
+    for count, row in enumerate(rows):
+        if limit is not None and count >= limit:
+            return
+        yield row['post_id'], (row.get('posts') or {}).get('title') or '', row.get('content')
+
+
+def html_documents(paths: list):
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob('*.html')) if path.is_dir() else [path]
+        for file in files:
+            yield str(file), '', file.read_text(encoding='utf-8', errors='replace')
+
+
+class TagWriter:
+    """태그 행을 모아 chunk_size 마다 upsert"""
+
+    def __init__(self, db, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.rows = []
+        self.written = 0
+        self.tagged_at = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+    def add(self, post_id, tags: list):
+        for kind, entity_id, matched_text, source in tags:
+            self.rows.append({'post_id': post_id, 'entity_type': kind, 'entity_id': entity_id,
+                              'matched_text': matched_text[:200], 'source': source, 'tagged_at': self.tagged_at})
+        if len(self.rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.rows:
+            self.written += self.db.upsert(TAGS_TABLE, self.rows, on_conflict='post_id,entity_type,entity_id',
+                                           chunk_size=self.chunk_size)
+            self.rows = []
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('tag', help='기존 게시글/HTML 덤프의 선수·팀 엔티티 오프라인 태깅')
+    parser.add_argument('--html', nargs='+', type=Path, default=None, help='게시글 대신 HTML 파일/디렉터리 태깅')
+    parser.add_argument('--since', default=None, help='이 시각 이후 작성된 게시글만 (created_at, ISO)')
+    parser.add_argument('--limit', type=int, default=None)
+    parser.add_argument('--aliases', type=Path, default=ALIASES_PATH, help='python -m pipeline aliases 산출물')
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='upsert 청크 크기')
+    parser.add_argument('--out', type=Path, default=config.CACHE_DIR / 'tags' / 'html.jsonl', help='--html 결과 파일')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    if not args.aliases.exists():
+        raise SystemExit(f'{args.aliases} not found. Run `python -m pipeline aliases` first.')
+    report = RunReport('tag')
+    started = time.perf_counter()
+    documents = tagged = entities = 0
+
+    if args.html:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        with args.out.open('w', encoding='utf-8') as out:
+            for doc_id, tags in tag_documents(html_documents(args.html), args.aliases, args.workers):
+                documents += 1
+                tagged += bool(tags)
+                entities += len(tags)
+                out.write(json.dumps({'document': doc_id, 'entities': [
+                    {'type': kind, 'id': entity_id, 'text': text, 'source': source}
+                    for kind, entity_id, text, source in tags
+                ]}, ensure_ascii=False) + '\n')
+        print(f"✓ {args.out}")
+    else:
+        from .db import SupabaseRest
+
+        db = SupabaseRest.from_env()
+        writer = TagWriter(db, args.chunk_size)
+        for post_id, tags in tag_documents(post_documents(db, args.since, args.limit), args.aliases, args.workers):
+            documents += 1
+            tagged += bool(tags)
+            entities += len(tags)
+            writer.add(post_id, tags)
+        writer.flush()
+        report.add('tag', 'rows_written', writer.written)
+
+    elapsed = time.perf_counter() - started
+    report.section('tag').update({'documents': documents, 'tagged': tagged, 'entities': entities,
+                                  'docs_per_second': round(documents / elapsed, 1) if elapsed else 0.0})
+    print(f"✓ Tagged {tagged}/{documents} documents, {entities} entities ({elapsed:.2f}s)")
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,264 @@
+"""
+캐시된 선수 사진 → 고정 크기 정사각형 WebP/AVIF 썸네일 변환
+
+사진 캐싱(photos) 다음 단계. 원본 목록은 DB 의 football_players.photo_cached_url 에서 얻는다
+(주소 끝의 콘텐츠 해시 키 players/<2>/<sha256>.<ext> → 새 머신/CI 에서도 같은 목록).
+- 이미 변환한 원본은 건너뛴다: DB 의 photo_variants 에 모든 크기/형식이 있거나, 로컬 manifest 에
+  (원본 해시, 변환 설정) 이 기록돼 있으면
+- 이미지 디코딩/인코딩은 CPU 작업이라 ProcessPoolExecutor 로 모든 코어에 분산한다
+- 변환 결과 주소를 football_players.photo_variants ({"96.webp": url, ...}) 에 청크 upsert →
+  페이지는 playerPhotoUrl (src/domains/livescore/utils/playerPhoto.ts) 로 필요한 크기의 썸네일을 쓴다
+  (컬럼: docs/player-photo-variants.sql)
+
+Pillow 필요 (pip install Pillow). AVIF 는 Pillow 가 AVIF 지원으로 빌드된 경우에만 생성.
+
+사용법:
+    python -m pipeline transcode --store local:./public-cache --public-base-url https://cdn.example.com/players \
+        [--sizes 48,96,192] [--formats webp,avif]
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import config
+from .db import SupabaseRest, not_is
+from .http_client import HttpPool
+from .object_store import open_store
+from .report import RunReport
+
+DEFAULT_SIZES = (48, 96, 192)
+DEFAULT_FORMATS = ('webp', 'avif')
+QUALITY = {'webp': 80, 'avif': 60}
+CONTENT_TYPES = {'webp': 'image/webp', 'avif': 'image/avif'}
+WINDOW_PER_WORKER = 2  # 동시에 메모리에 올려 두는 원본 이미지 수 = 프로세스 수 × 2
+VARIANT_COLUMNS = 'player_id,name,display_name,team_id,photo_cached_url,photo_variants'
+SOURCE_KEY = re.compile(r'players/[0-9a-f]{2}/[0-9a-f]{64}\.[a-z]+$')  # photos.object_key
+
+
+def _require_pillow():
+    try:
+        from PIL import Image, features
+    except ImportError as e:
+        raise RuntimeError('Pillow is required for transcoding: pip install Pillow') from e
+    return Image, features
+
+
+def supported_formats(formats) -> list:
+    _, features = _require_pillow()
+    available = []
+    for fmt in formats:
+        if fmt == 'avif' and not features.check('avif'):
+            print("⚠ Pillow was built without AVIF support — skipping avif variants")
+            continue
+        available.append(fmt)
+    return available
+
+
+def settings_digest(sizes, formats) -> str:
+    """변환 설정이 바뀌면 manifest 항목을 무효화하기 위한 해시"""
+    payload = json.dumps({'sizes': list(sizes), 'formats': list(formats), 'quality': QUALITY}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def variant_key(source_key: str, size: int, fmt: str) -> str:
+    digest = Path(source_key).stem
+    return f'players/variants/{digest[:2]}/{digest}-{size}.{fmt}'
+
+
+def variant_name(size: int, fmt: str) -> str:
+    return f'{size}.{fmt}'
+
+
+def transcode_image(data: bytes, sizes, formats) -> list:
+    """(worker) 정사각형 썸네일로 변환 (가운데를 기준으로 잘라 size×size). [(size, fmt, bytes)] 반환"""
+    Image, _ = _require_pillow()
+    from PIL import ImageOps
+
+    with Image.open(io.BytesIO(data)) as source:
+        image = source.convert('RGBA') if source.mode in ('P', 'LA', 'RGBA') else source.convert('RGB')
+
+    variants = []
+    for size in sizes:
+        thumb = ImageOps.fit(image, (size, size), Image.LANCZOS)
+        for fmt in formats:
+            buffer = io.BytesIO()
+            thumb.save(buffer, format=fmt.upper(), quality=QUALITY[fmt])
+            variants.append((size, fmt, buffer.getvalue()))
+    return variants
+
+
+def _transcode_job(job):
+    source_key, data, sizes, formats = job
+    try:
+        return source_key, len(data), transcode_image(data, sizes, formats), None
+    except Exception as e:  # 손상된 이미지 한 장 때문에 전체를 멈추지 않음
+        return source_key, len(data), [], str(e)
+
+
+class VariantManifest:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries = json.loads(self.path.read_text(encoding='utf-8')) if self.path.exists() else {}
+
+    def done(self, source_key: str, settings: str) -> bool:
+        entry = self.entries.get(source_key)
+        return entry is not None and entry['settings'] == settings
+
+    def record(self, source_key: str, settings: str, variants: dict):
+        self.entries[source_key] = {'settings': settings, 'variants': variants}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.entries, indent=1), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+def source_key(photo_cached_url: str):
+    """photo_cached_url → 저장소의 원본 키 (photos 가 쓴 주소가 아니면 None)"""
+    match = SOURCE_KEY.search(photo_cached_url or '')
+    return match.group(0) if match else None
+
+
+def source_rows(db: SupabaseRest) -> dict:
+    """{원본 키: [선수 행]} — photo_cached_url 이 있는 선수 (같은 사진을 여러 선수가 공유할 수 있음)"""
+    by_key = {}
+    for row in db.select_all('football_players', VARIANT_COLUMNS, [not_is('photo_cached_url', None)],
+                             order=['player_id']):
+        key = source_key(row['photo_cached_url'])
+        if key is not None:
+            by_key.setdefault(key, []).append(row)
+    return by_key
+
+
+def complete_variants(rows: list, names: set):
+    """DB 행 중 필요한 크기/형식을 모두 가진 photo_variants (없으면 None)"""
+    for row in rows:
+        variants = row.get('photo_variants') or {}
+        if names <= set(variants):
+            return {name: variants[name] for name in sorted(names)}
+    return None
+
+
+def variant_updates(by_key: dict, urls: dict) -> list:
+    """photo_variants 가 바뀌는 선수만 upsert 행으로. urls: {원본 키: {이름: 주소}}"""
+    updates = []
+    for key, rows in by_key.items():
+        if key not in urls:
+            continue
+        for row in rows:
+            if row.get('photo_variants') != urls[key]:
+                updates.append({'player_id': row['player_id'], 'name': row['name'], 'display_name': row['display_name'],
+                                'team_id': row['team_id'], 'photo_variants': urls[key]})
+    return updates
+
+
+def run_transcode(store, keys: list, manifest: VariantManifest, sizes, formats, report: RunReport,
+                  workers: int = None, done: set = frozenset()) -> int:
+    """done: DB 에서 이미 변환된 것으로 확인된 원본 키"""
+    settings = settings_digest(sizes, formats)
+    pending = [key for key in keys if key not in done and not manifest.done(key, settings)]
+    report.section('transcode').update({'sources': len(keys), 'skipped': len(keys) - len(pending)})
+
+    savings = report.section('variants')
+    workers = workers or os.cpu_count()
+    transcoded = 0
+
+    def results(executor):
+        # executor.map 은 입력을 제출 시점에 전부 소비한다 (원본 이미지를 모두 메모리에 읽음).
+        # 최대 workers × WINDOW_PER_WORKER 개만 읽어 제출하고, 끝난 순서가 아니라 제출 순서대로 꺼낸다
+        window = deque()
+        for key in pending:
+            window.append(executor.submit(_transcode_job, (key, store.get(key), tuple(sizes), tuple(formats))))
+            if len(window) >= workers * WINDOW_PER_WORKER:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for source_key, source_bytes, variants, error in results(executor):
+            if error:
+                print(f"⚠ {source_key}: {error}")
+                report.add('transcode', 'failed')
+                continue
+            recorded = {}
+            for size, fmt, data in variants:
+                key = variant_key(source_key, size, fmt)
+                store.put(key, data, CONTENT_TYPES[fmt])
+                recorded[variant_name(size, fmt)] = {'key': key, 'bytes': len(data)}
+
+                stats = savings.setdefault(variant_name(size, fmt), {'count': 0, 'source_bytes': 0, 'variant_bytes': 0})
+                stats['count'] += 1
+                stats['source_bytes'] += source_bytes
+                stats['variant_bytes'] += len(data)
+            manifest.record(source_key, settings, recorded)
+            transcoded += 1
+            if transcoded % 500 == 0:
+                manifest.save()
+
+    for stats in savings.values():
+        stats['saved_bytes'] = stats['source_bytes'] - stats['variant_bytes']
+    manifest.save()
+    report.section('transcode')['transcoded'] = transcoded
+    return transcoded
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('transcode', help='캐시된 선수 사진을 크기별 WebP/AVIF 썸네일로 변환')
+    parser.add_argument('--store', required=True, help='local:<dir> 또는 s3:<endpoint>/<bucket> (photos 와 동일)')
+    parser.add_argument('--public-base-url', default=None,
+                        help='photo_variants 에 쓸 공개 http(s) 주소 (photos 와 동일, local 저장소는 필수)')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)))
+    parser.add_argument('--formats', default=','.join(DEFAULT_FORMATS))
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--chunk-size', type=int, default=500, help='photo_variants upsert 청크 크기')
+    parser.add_argument('--manifest', type=Path, default=config.CACHE_DIR / 'photos' / 'variants.json')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    formats = supported_formats([f for f in args.formats.split(',') if f])
+    report = RunReport('transcode')
+
+    names = {variant_name(size, fmt) for size in sizes for fmt in formats}
+
+    with HttpPool() as pool:
+        db = SupabaseRest.from_env(pool=pool)
+        store = open_store(args.store, args.public_base_url, pool=pool)
+        if not store.public_url('').startswith(('http://', 'https://')):
+            raise SystemExit(f"photo_variants would point at {store.public_url('')}… — pass an http(s) --public-base-url "
+                             f"(required for local stores)")
+        by_key = source_rows(db)
+        if not by_key:
+            raise SystemExit('No football_players.photo_cached_url to transcode — run python -m pipeline photos first')
+
+        urls = {}
+        for key, rows in by_key.items():
+            variants = complete_variants(rows, names)
+            if variants is not None:
+                urls[key] = variants
+        manifest = VariantManifest(args.manifest)
+        transcoded = run_transcode(store, sorted(by_key), manifest, sizes, formats, report, args.workers, done=set(urls))
+
+        settings = settings_digest(sizes, formats)
+        for key in by_key:
+            if key not in urls and manifest.done(key, settings):
+                recorded = manifest.entries[key]['variants']
+                urls[key] = {name: store.public_url(recorded[name]['key']) for name in sorted(names) if name in recorded}
+        updates = variant_updates(by_key, urls)
+        if updates:
+            db.upsert('football_players', updates, on_conflict='player_id', chunk_size=args.chunk_size)
+
+    report.section('transcode')['players_updated'] = len(updates)
+    print(f"✓ Transcoded: {transcoded} (skipped: {report.sections['transcode']['skipped']})")
+    for name, stats in sorted(report.sections.get('variants', {}).items()):
+        print(f"  {name}: {stats['count']} files, saved {stats['saved_bytes']:,} bytes")
+    print(f"✓ photo_variants updated: {len(updates)} players")
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,59 @@
+"""
+선수 이름 한글 번역 (tier 체인)
+
+    from pipeline.translate import get_resolver
+    get_resolver('saudi-pro-league').translate('Salem Al-Dawsari')
+
+사용법 (CLI):
+    python -m pipeline translate --league j1-league "Fujita Kazuki" "Kim Jin-Hyeon"
+    python -m pipeline translate --league saudi-pro-league --names-file names.txt --tiers fuzzy,rules --workers 8
+"""
+
+from pathlib import Path
+
+from ..report import RunReport
+from .profiles import LEAGUE_PROFILES, build_resolver, get_resolver
+from .resolver import Resolution, Resolver
+
+__all__ = ['LEAGUE_PROFILES', 'Resolution', 'Resolver', 'build_resolver', 'get_resolver', 'register']
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('translate', help='선수 이름을 리그 프로필의 tier 순서로 번역')
+    parser.add_argument('--league', required=True, choices=sorted(LEAGUE_PROFILES))
+    parser.add_argument('--tiers', default=None, help='tier 순서 덮어쓰기 (예: lexicon,fuzzy,rules)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='fuzzy/rules tier 프로세스 수 (기본: PIPELINE_TRANSLATE_WORKERS 또는 1)')
+    parser.add_argument('--names-file', type=Path, default=None, help='한 줄에 한 이름인 파일 (대량 번역)')
+    parser.add_argument('names', nargs='*')
+    parser.set_defaults(handler=_run)
+
+
+def _run(args):
+    names = list(args.names)
+    if args.names_file:
+        names += [line.strip() for line in args.names_file.read_text(encoding='utf-8').splitlines() if line.strip()]
+    if not names:
+        raise SystemExit('No names given')
+    resolver = build_resolver(args.league, args.tiers.split(',') if args.tiers else None, args.workers)
+    results = resolver.resolve_many(names)
+    shown = results if len(results) <= 50 else dict(list(results.items())[:50])
+    for name, resolution in shown.items():
+        if resolution is None:
+            print(f"  {name} -> (no translation)")
+        else:
+            flag = '  ⚠ review' if resolution.needs_review else ''
+            print(f"  {name} -> {resolution.korean}  [{resolution.tier}: {resolution.reason} {resolution.confidence:.2f}]{flag}")
+    if len(results) > len(shown):
+        translated = sum(1 for resolution in results.values() if resolution is not None)
+        print(f"  ... {len(results) - len(shown)} more ({translated} of {len(results)} translated)")
+    print()
+    print(resolver.format_metrics())
+
+    report = RunReport('translate')
+    resolver.record(report)
+    usage = report.sections.get('llm_usage')
+    if usage and usage['requests']:
+        print(f"\nLLM: {usage['requests']} requests, input {usage['input_tokens']:,} tokens "
+              f"(cache read {usage['cache_read_input_tokens']:,}, cache write {usage['cache_creation_input_tokens']:,})")
+    print(f"✓ Report: {report.write()}")
@@ -0,0 +1,306 @@
+"""
+Message Batches API 대량 번역 (오프라인 일괄 작업)
+
+"korean_name 이 비어 있는 선수 전부 다시 번역" 같은 일회성 작업용.
+1. DB 에서 리그의 korean_name IS NULL 선수를 읽는다
+2. 싼 tier(사전/캐시/유사 이름/규칙)로 먼저 풀고, 남은 이름만 LLM 요청으로 묶는다
+   (요청당 NAMES_PER_REQUEST 명, system prefix 는 대화형 LLM tier 와 같은 캐시 가능 블록)
+3. 전체를 배치 하나로 제출하고 끝날 때까지 polling
+4. 결과(JSONL)를 한 줄씩 읽어 번역 캐시(sqlite)와 football_players 에 청크 단위로 기록
+5. 바뀐 korean_name 으로 SEO 품질 플래그(seo_worthless)를 다시 계산 (pipeline.seo_flags)
+
+배치 ID 와 요청별 이름 목록은 .pipeline-cache/batches/<batch_id>.json 에 저장하므로
+중단되어도 --resume <batch_id> 로 polling/결과 반영부터 다시 할 수 있다.
+
+사용법:
+    python -m pipeline batch-translate --league eredivisie
+    python -m pipeline batch-translate --league eredivisie --resume msgbatch_...
+
+    # 로컬 가짜 배치 서버
+    python -m pipeline.standins.anthropic_batches --port 8063
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8063 python -m pipeline batch-translate --league eredivisie
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .. import config
+from ..db import SupabaseRest, in_, is_
+from ..fetcher import _atomic_write
+from ..http_client import HttpPool
+from ..report import RunReport
+from .confidence import Candidate, assess
+from .llm import (DEFAULT_MODEL, NAMES_PER_REQUEST, LlmTier, LlmUsage, chunked, message_params,
+                  profile_system_blocks, translations_for)
+from .profiles import LEAGUE_PROFILES, get_resolver, profile_examples
+from .resolver import Resolution
+
+BATCH_DIR = config.CACHE_DIR / 'batches'
+SINK_CHUNK_SIZE = 500
+PLAYER_COLUMNS = 'player_id,name,display_name,team_id'
+
+
+class BatchError(RuntimeError):
+    pass
+
+
+class BatchApi:
+    """/v1/messages/batches 최소 클라이언트 (anthropic 패키지 없이 HttpPool 로 호출)"""
+
+    def __init__(self, base_url: str = None, api_key: str = None, pool: HttpPool = None):
+        self.base_url = (base_url or config.ANTHROPIC_BASE_URL).rstrip('/')
+        self.api_key = api_key if api_key is not None else os.environ.get('ANTHROPIC_API_KEY', '')
+        self.pool = pool or HttpPool()
+
+    def _request(self, method: str, url: str, body=None):
+        headers = {
+            'x-api-key': self.api_key,
+            'anthropic-version': config.ANTHROPIC_VERSION,
+            'content-type': 'application/json',
+        }
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8') if body is not None else None
+        response = self.pool.request(method, url, headers=headers, body=data)
+        if response.status >= 400:
+            raise BatchError(f'{method} {url} failed ({response.status}): {response.body[:500].decode("utf-8", "replace")}')
+        return response
+
+    def create(self, requests: list) -> dict:
+        return json.loads(self._request('POST', f'{self.base_url}/v1/messages/batches', {'requests': requests}).body)
+
+    def retrieve(self, batch_id: str) -> dict:
+        return json.loads(self._request('GET', f'{self.base_url}/v1/messages/batches/{batch_id}').body)
+
+    def results(self, batch: dict):
+        """결과 JSONL 을 한 줄씩 (generator)"""
+        response = self._request('GET', batch['results_url'])
+        for line in response.body.splitlines():
+            if line.strip():
+                yield json.loads(line)
+
+
+@dataclass
+class BatchResult:
+    succeeded: int = 0
+    errored: int = 0
+    canceled: int = 0
+    expired: int = 0
+    translated: int = 0
+    missing: int = 0  # 성공 응답인데 번역이 빠진 이름
+
+
+class TranslationSink:
+    """번역 결과를 캐시 tier 와 DB 에 청크 단위로 기록
+
+    값이 Candidate 이고 신뢰도가 min_confidence 미만이면 DB 에 쓰지 않고 검수 큐로 보낸다.
+    캐시에는 source(llm-batch) 결과만 기록한다 — 싼 tier 로 푼 이름은 write_rows 로 DB 행만 쓴다.
+    """
+
+    def __init__(self, cache_tier=None, db: SupabaseRest = None, rows_by_name: dict = None, source: str = 'llm-batch',
+                 min_confidence: float = 0.0, review_queue=None, profile: str = None):
+        self.cache_tier = cache_tier
+        self.db = db
+        self.rows_by_name = rows_by_name or {}
+        self.source = source
+        self.min_confidence = min_confidence
+        self.review_queue = review_queue
+        self.profile = profile
+        self.pending = {}
+        self.written_players = 0
+        self.queued_for_review = 0
+
+    def add(self, found: dict):
+        self.pending.update(found)
+        if len(self.pending) >= SINK_CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        if self.cache_tier is not None:
+            self.cache_tier.store_many(self.pending, self.source)
+
+        accepted = {}
+        review = {}
+        for name, value in self.pending.items():
+            if isinstance(value, Candidate) and value.confidence < self.min_confidence:
+                review[name] = Resolution(value.korean, self.source, value.confidence, value.reason, needs_review=True)
+            else:
+                accepted[name] = value.korean if isinstance(value, Candidate) else value
+        if review and self.review_queue is not None:
+            self.review_queue.add_many(self.profile, review)
+        self.queued_for_review += len(review)
+
+        self.write_rows(accepted)
+        self.pending = {}
+
+    def write_rows(self, translations: dict):
+        """{name: 한글} 을 football_players 에만 기록 (캐시/검수 큐는 건드리지 않음)"""
+        if self.db is None:
+            return
+        rows = [
+            {**row, 'korean_name': korean}
+            for name, korean in translations.items()
+            for row in self.rows_by_name.get(name, [])
+        ]
+        if rows:
+            self.db.upsert('football_players', rows, on_conflict='player_id')
+        self.written_players += len(rows)
+
+
+def state_path(batch_id: str) -> Path:
+    return BATCH_DIR / f'{batch_id}.json'
+
+
+def save_state(state: dict):
+    BATCH_DIR.mkdir(parents=True, exist_ok=True)
+    _atomic_write(state_path(state['batch_id']), json.dumps(state, ensure_ascii=False, indent=2).encode('utf-8'))
+
+
+def load_state(batch_id: str) -> dict:
+    path = state_path(batch_id)
+    if not path.exists():
+        raise BatchError(f'No saved state for batch {batch_id} ({path})')
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def submit_batch(api: BatchApi, league: str, names: list, model: str = DEFAULT_MODEL,
+                 names_per_request: int = NAMES_PER_REQUEST) -> dict:
+    """이름 목록을 요청 단위로 묶어 배치 제출. 재개용 상태(요청 ID → 이름)를 저장하고 반환"""
+    profile = LEAGUE_PROFILES[league]
+    system = profile_system_blocks(profile, profile_examples(profile))
+    chunks = {f'{league}-{i:05d}': chunk for i, chunk in enumerate(chunked(names, names_per_request))}
+    requests = [{'custom_id': custom_id, 'params': message_params(chunk, system, model)} for custom_id, chunk in chunks.items()]
+
+    batch = api.create(requests)
+    state = {
+        'batch_id': batch['id'],
+        'league': league,
+        'model': model,
+        'submitted_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'chunks': chunks,
+        'imported': False,
+    }
+    save_state(state)
+    return state
+
+
+def wait_for_batch(api: BatchApi, batch_id: str, poll_interval: float = 30, timeout: float = None) -> dict:
+    started = time.monotonic()
+    while True:
+        batch = api.retrieve(batch_id)
+        if batch['processing_status'] == 'ended':
+            return batch
+        if timeout is not None and time.monotonic() - started > timeout:
+            raise BatchError(f'Batch {batch_id} still {batch["processing_status"]} after {timeout:.0f}s (resume later)')
+        counts = batch.get('request_counts', {})
+        print(f"  {batch_id}: {batch['processing_status']} (processing {counts.get('processing', '?')}, "
+              f"succeeded {counts.get('succeeded', 0)}, errored {counts.get('errored', 0)})")
+        time.sleep(poll_interval)
+
+
+def import_results(api: BatchApi, batch: dict, state: dict, sink: TranslationSink, usage: LlmUsage) -> BatchResult:
+    result = BatchResult()
+    for line in api.results(batch):
+        outcome = line['result']
+        kind = outcome['type']
+        if kind != 'succeeded':
+            setattr(result, kind, getattr(result, kind) + 1)
+            continue
+
+        result.succeeded += 1
+        chunk = state['chunks'].get(line['custom_id'], [])
+        message = outcome['message']
+        usage.add(message.get('usage') or {})
+        usage.names += len(chunk)
+        try:
+            found = translations_for(chunk, message['content'][0]['text'])
+        except (ValueError, KeyError, IndexError):
+            result.errored += 1
+            continue
+        result.translated += len(found)
+        result.missing += len(chunk) - len(found)
+        sink.add({name: assess(name, Candidate(korean, LlmTier.confidence, 'llm-batch')) for name, korean in found.items()})
+    sink.flush()
+    return result
+
+
+def untranslated_rows(db: SupabaseRest, team_ids: list) -> dict:
+    """{name: [row]} — korean_name 이 비어 있는 선수 (같은 이름 여러 명 가능)"""
+    rows_by_name = {}
+    for row in db.select_all('football_players', PLAYER_COLUMNS, [is_('korean_name', 'null'), in_('team_id', team_ids)]):
+        rows_by_name.setdefault(row['name'], []).append(row)
+    return rows_by_name
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('batch-translate', help='korean_name 이 빈 선수를 Message Batches API 로 일괄 번역')
+    parser.add_argument('--league', required=True, choices=sorted(LEAGUE_PROFILES))
+    parser.add_argument('--resume', metavar='BATCH_ID', default=None, help='제출된 배치의 polling/결과 반영부터 재개')
+    parser.add_argument('--poll-interval', type=float, default=30)
+    parser.add_argument('--timeout', type=float, default=None, help='polling 최대 시간(초), 넘으면 나중에 --resume')
+    parser.add_argument('--base-url', default=None, help='Anthropic API 주소 (로컬 stand-in 테스트용)')
+    parser.add_argument('--model', default=DEFAULT_MODEL)
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    from ..seo_flags import refresh_flags
+    from ..sync import league_team_ids
+
+    report = RunReport('batch-translate')
+    resolver = get_resolver(args.league)
+    usage = LlmUsage()
+
+    with HttpPool() as pool:
+        db = SupabaseRest.from_env(pool=pool)
+        api = BatchApi(args.base_url, pool=pool)
+        rows_by_name = untranslated_rows(db, league_team_ids(db, args.league))
+        sink = TranslationSink(resolver.cache_tier, db, rows_by_name, min_confidence=resolver.min_confidence,
+                               review_queue=resolver.review_queue, profile=args.league)
+
+        if args.resume:
+            state = load_state(args.resume)
+            if state['imported']:
+                print(f"✓ Batch {args.resume} was already imported")
+                return
+        else:
+            names = list(rows_by_name)
+            resolved = resolver.resolve_many(names, skip=('llm',))
+            # 신뢰도 기준 미만(needs_review) 결과는 배치로 다시 번역. 싼 tier 결과는 캐시에 llm-batch 로
+            # 남기지 않고 (resolver 가 캐시할 tier 는 이미 캐시함) DB 행만 쓴다
+            cheap = {name: resolution.korean for name, resolution in resolved.items()
+                     if resolution is not None and not resolution.needs_review}
+            sink.write_rows(cheap)
+            pending = [name for name in names if name not in cheap]
+            report.add('batch', 'untranslated_names', len(names))
+            report.add('batch', 'resolved_without_llm', len(cheap))
+            print(f"✓ {len(names)} untranslated names: {len(cheap)} resolved by cheaper tiers, {len(pending)} to batch")
+            if not pending:
+                refresh_flags(db, report=report)
+                print(f"✓ Report: {report.write()}")
+                return
+            state = submit_batch(api, args.league, pending, args.model)
+            print(f"✓ Submitted batch {state['batch_id']} ({len(state['chunks'])} requests)")
+
+        batch = wait_for_batch(api, state['batch_id'], args.poll_interval, args.timeout)
+        result = import_results(api, batch, state, sink, usage)
+        state['imported'] = True
+        save_state(state)
+        refresh_flags(db, report=report)
+
+    for key, value in asdict(result).items():
+        report.add('batch', key, value)
+    report.add('batch', 'players_written', sink.written_players)
+    report.add('batch', 'queued_for_review', sink.queued_for_review)
+    for key, value in asdict(usage).items():
+        report.add('llm_usage', key, value)
+
+    print(f"✓ Batch {state['batch_id']}: {result.succeeded} succeeded, {result.errored} errored, "
+          f"{result.expired} expired, {result.canceled} canceled")
+    print(f"✓ Translated: {result.translated} names ({result.missing} missing), players updated: {sink.written_players}, "
+          f"queued for review: {sink.queued_for_review}")
+    print(f"  input {usage.input_tokens:,} tokens (cache read {usage.cache_read_input_tokens:,}), output {usage.output_tokens:,}")
+    print(f"✓ Report: {report.write()}")
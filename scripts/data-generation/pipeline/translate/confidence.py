@@ -0,0 +1,56 @@
+"""
+번역 결과 신뢰도
+
+모든 tier 는 결과를 Candidate(한글, 신뢰도 0~1, 이유) 로 돌려준다.
+tier 가 매긴 점수에 더해 resolver 가 출력 자체를 한 번 더 검사한다 (assess):
+- untranslated:     출력이 원래 이름과 같거나 한글이 전혀 없음 → 0
+- partial-coverage: 일부 토큰이 라틴 문자 그대로 ('후지타 Kazuki')
+- latin-left:       한 토큰 안에 한글과 라틴 문자가 섞임
+사전에 정확히 있는 결과(exact)는 검수된 표기이므로 라틴 문자 검사를 하지 않는다
+('FC 도쿄', '요코하마 F. 마리노스' 처럼 약어/이니셜을 원문대로 두는 팀 이름)
+
+이유(reason) 값:
+    exact, cache:<source>, accent-fold, initial-match, token-composition,
+    rule:<규칙명>, rule-ambiguity, llm, 그리고 위 세 가지 출력 검사
+"""
+
+import re
+from dataclasses import dataclass, replace
+
+HANGUL = re.compile(r'[가-힣]')
+LATIN = re.compile(r'[A-Za-zÀ-ɏ]')
+
+
+@dataclass(frozen=True)
+class Candidate:
+    korean: str
+    confidence: float
+    reason: str
+    # 캐시된 LLM 결과처럼 더 비싼 tier 로 다시 보내도 나아질 게 없는 결과
+    terminal: bool = False
+
+
+def hangul_coverage(korean: str) -> float:
+    """라틴 문자가 없는 토큰 비율 (이니셜 'K.' 도 라틴 토큰으로 센다)"""
+    tokens = korean.split()
+    if not tokens:
+        return 0.0
+    return sum(1 for token in tokens if not LATIN.search(token)) / len(tokens)
+
+
+def assess(name: str, candidate: Candidate) -> Candidate:
+    """출력 검사로 신뢰도를 깎는다 (올리지는 않음)"""
+    korean = candidate.korean
+    if korean.strip() == name.strip() or not HANGUL.search(korean):
+        return replace(candidate, confidence=0.0, reason='untranslated')
+    if candidate.reason == 'exact':
+        return candidate
+
+    mixed = any(HANGUL.search(token) and LATIN.search(token) for token in korean.split())
+    if mixed:
+        return replace(candidate, confidence=min(candidate.confidence, 0.3), reason='latin-left')
+
+    coverage = hangul_coverage(korean)
+    if coverage < 1.0:
+        return replace(candidate, confidence=min(candidate.confidence, round(0.5 * coverage, 3)), reason='partial-coverage')
+    return candidate
@@ -0,0 +1,253 @@
+"""
+번역 tier 정확도 vs 지연/비용 평가
+
+리그 스크립트의 사전(translate_eredivisie_*.PLAYER_TRANSLATIONS, KNOWN_PLAYERS, J1 KOREAN_PLAYERS, 사우디 KNOWN_PLAYERS)은
+사람이 검수한 정답 집합이다. 이름 해시로 일부(기본 20%)를 떼어 두고(held-out), 나머지로만 tier 를 만든 뒤
+떼어 둔 이름을 tier 하나하나와 tier 조합마다 resolver 로 번역해 본다.
+
+- tier: lexicon(리그 사전), fuzzy(전체 사전의 유사 이름 재사용), rules(리그 규칙), llm(--llm 일 때만, 비용 발생)
+  held-out 이름은 모든 사전에서 빠지므로 lexicon/fuzzy/LLM few-shot 예시로 새지 않는다. 캐시 tier 는 이전
+  실행 결과라 평가에서 제외
+- 조합: 위 순서를 유지한 모든 부분 집합 (--combos 로 지정 가능). resolver 신뢰도 기준은 리그 프로필 값
+  (--min-confidence 로 덮어쓰기)
+- 정확도: coverage(답한 비율), exact(정답과 같음, 전체 대비), precision(답한 것 중 정답), CER(답한 것의
+  글자 편집 거리 / 정답 길이 평균), 검수 필요 수. 확정(검수 불필요) 결과만의 coverage/precision 도 같이
+- 신뢰도 기준별(THRESHOLDS) coverage/precision → 리그 min_confidence 조정용
+- 지연: 이름 하나씩 번역한 µs (p50/p95/평균). LLM 이 들어간 조합은 배치 한 번의 평균만
+- 비용: LLM 토큰 사용량과 PIPELINE_LLM_PRICE ("입력,출력" 백만 토큰당 USD, 기본 3,15) 기준 추정액
+
+사용법:
+    python -m pipeline translate-eval [--league j1-league] [--holdout 20] [--llm] [--errors 5]
+"""
+
+import hashlib
+import os
+import time
+import unicodedata
+from itertools import combinations
+
+from ..report import RunReport
+from .lexicons import LEXICON_SOURCES, load_lexicon
+from .llm import LlmTier, few_shot_examples
+from .profiles import LEAGUE_PROFILES
+from .resolver import Resolver
+from .rules import build_rules
+from .tiers import FuzzyTier, LexiconTier, RuleTier
+
+EVAL_TIERS = ['lexicon', 'fuzzy', 'rules', 'llm']
+THRESHOLDS = [0.5, 0.6, 0.7, 0.8, 0.9]
+DEFAULT_HOLDOUT = 20
+
+
+def held_out(name: str, percent: int, salt: str = '') -> bool:
+    """이름 해시로 고정된 분할 (실행마다, 사전이 늘어나도 같은 이름은 같은 쪽)"""
+    digest = hashlib.blake2b(f'{salt}{name}'.encode('utf-8'), digest_size=4).digest()
+    return int.from_bytes(digest, 'big') % 100 < percent
+
+
+def normalize(korean) -> str:
+    return ' '.join(unicodedata.normalize('NFC', str(korean or '')).split())
+
+
+def edit_distance(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def percentile(values: list, q: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def golden_split(percent: int, salt: str = '') -> tuple:
+    """({그룹: {이름: 한글}} 학습용, {그룹: {이름: 한글}} held-out)"""
+    train, test = {}, {}
+    for group in LEXICON_SOURCES:
+        entries = load_lexicon(group)
+        train[group] = {name: korean for name, korean in entries.items() if not held_out(name, percent, salt)}
+        test[group] = {name: korean for name, korean in entries.items() if held_out(name, percent, salt)}
+    return train, test
+
+
+def eval_tiers(league: str, train: dict, use_llm: bool) -> dict:
+    """held-out 이름을 뺀 사전으로 만든 tier {이름: tier} (쓸 수 없는 tier 는 빠짐)"""
+    profile = LEAGUE_PROFILES[league]
+    league_entries = {}
+    for group in profile['lexicons']:
+        league_entries.update(train.get(group, {}))
+    all_entries = {}
+    for entries in train.values():
+        all_entries.update(entries)
+
+    tiers = {'lexicon': LexiconTier(league_entries), 'fuzzy': FuzzyTier(all_entries)}
+    if profile['rules']:
+        tiers['rules'] = RuleTier(build_rules(profile['rules']))
+    if use_llm:
+        llm = LlmTier(language_hint=profile.get('language'), instruction=profile.get('instruction'),
+                     rules=profile.get('prompt_rules'), examples=few_shot_examples(league_entries or all_entries))
+        if llm.available:
+            tiers['llm'] = llm
+        else:
+            print('⚠ LLM tier unavailable (ANTHROPIC_API_KEY / anthropic package), skipping')
+    return tiers
+
+
+def tier_combos(names: list) -> list:
+    """EVAL_TIERS 순서를 유지한 모든 부분 집합 (짧은 것부터)"""
+    ordered = [name for name in EVAL_TIERS if name in names]
+    return [list(combo) for size in range(1, len(ordered) + 1) for combo in combinations(ordered, size)]
+
+
+def llm_cost(usage) -> float:
+    """백만 토큰당 (입력, 출력) USD. 캐시 읽기 0.1배, 캐시 쓰기 1.25배"""
+    price_in, price_out = (float(value) for value in os.environ.get('PIPELINE_LLM_PRICE', '3,15').split(','))
+    tokens_in = usage.input_tokens + usage.cache_read_input_tokens * 0.1 + usage.cache_creation_input_tokens * 1.25
+    return (tokens_in * price_in + usage.output_tokens * price_out) / 1_000_000
+
+
+def evaluate_combo(tiers: list, golden: dict, min_confidence: float) -> dict:
+    """held-out 이름을 조합으로 번역해 정확도/지연 지표와 오답 목록"""
+    resolver = Resolver(tiers, min_confidence=min_confidence)
+    names = list(golden)
+    llm = next((tier for tier in tiers if tier.name == 'llm'), None)
+    latencies = []
+    if llm is None:
+        results = {}
+        for name in names:
+            started = time.perf_counter()
+            results.update(resolver.resolve_many([name]))
+            latencies.append((time.perf_counter() - started) * 1e6)
+        mean_us = sum(latencies) / len(latencies) if latencies else 0.0
+    else:
+        requests_before = llm.usage.requests
+        started = time.perf_counter()
+        results = resolver.resolve_many(names)
+        mean_us = (time.perf_counter() - started) * 1e6 / max(1, len(names))
+        if llm.usage.requests == requests_before:
+            mean_us = 0.0
+
+    answered = exact = confident = confident_exact = 0
+    distance = 0.0
+    review = 0
+    errors = []
+    by_threshold = {threshold: [0, 0] for threshold in THRESHOLDS}  # [답한 수, 정답 수]
+    for name in names:
+        resolution = results.get(name)
+        if resolution is None:
+            continue
+        answered += 1
+        gold, got = normalize(golden[name]), normalize(resolution.korean)
+        correct = got == gold
+        exact += correct
+        distance += edit_distance(got, gold) / max(1, len(gold))
+        review += resolution.needs_review
+        if not resolution.needs_review:
+            confident += 1
+            confident_exact += correct
+        for threshold in THRESHOLDS:
+            if resolution.confidence >= threshold:
+                by_threshold[threshold][0] += 1
+                by_threshold[threshold][1] += correct
+        if not correct:
+            errors.append((name, golden[name], resolution.korean, resolution.tier, resolution.confidence))
+
+    total = max(1, len(names))
+    metrics = {
+        'names': len(names),
+        'coverage': round(answered / total, 4),
+        'exact': round(exact / total, 4),
+        'precision': round(exact / answered, 4) if answered else None,
+        'cer': round(distance / answered, 4) if answered else None,
+        'needs_review': review,
+        'confident_coverage': round(confident / total, 4),
+        'confident_precision': round(confident_exact / confident, 4) if confident else None,
+        'p50_us': round(percentile(latencies, 0.5), 2) if latencies else None,
+        'p95_us': round(percentile(latencies, 0.95), 2) if latencies else None,
+        'mean_us': round(mean_us, 2),
+        'thresholds': {
+            str(threshold): {'coverage': round(count / total, 4),
+                             'precision': round(correct / count, 4) if count else None}
+            for threshold, (count, correct) in by_threshold.items()
+        },
+    }
+    return {'metrics': metrics, 'errors': errors}
+
+
+def _fmt(value, percent: bool = True) -> str:
+    if value is None:
+        return '-'
+    return f'{value * 100:.1f}%' if percent else f'{value:.1f}'
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('translate-eval', help='검수된 사전 held-out 으로 tier/조합별 정확도와 지연/비용 평가')
+    parser.add_argument('--league', action='append', default=None, choices=sorted(LEAGUE_PROFILES),
+                        help='평가할 리그 (여러 번 지정 가능, 기본: 사전이 있는 리그 전부)')
+    parser.add_argument('--holdout', type=int, default=DEFAULT_HOLDOUT, help='떼어 둘 정답 비율 (%%)')
+    parser.add_argument('--salt', default='', help='분할을 바꿔 보고 싶을 때 해시 salt')
+    parser.add_argument('--combos', default=None, help="조합 지정 (예: 'fuzzy;fuzzy,rules;lexicon,fuzzy,rules')")
+    parser.add_argument('--min-confidence', type=float, default=None, help='resolver 신뢰도 기준 (기본: 리그 프로필)')
+    parser.add_argument('--llm', action='store_true', help='LLM tier 포함 (API 호출, 비용 발생)')
+    parser.add_argument('--errors', type=int, default=0, help='조합마다 오답 예시를 N 개 출력')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    train, test = golden_split(args.holdout, args.salt)
+    leagues = args.league or [key for key, profile in LEAGUE_PROFILES.items()
+                              if profile['lexicons'] and all(group in LEXICON_SOURCES for group in profile['lexicons'])]
+    report = RunReport('translate-eval')
+    report.section('split').update({'holdout_percent': args.holdout, 'salt': args.salt,
+                                    **{f'{group}_train': len(train[group]) for group in train},
+                                    **{f'{group}_test': len(test[group]) for group in test}})
+
+    for league in leagues:
+        profile = LEAGUE_PROFILES[league]
+        golden = {}
+        for group in profile['lexicons']:
+            golden.update(test.get(group, {}))
+        if not golden:
+            print(f"⚠ {league}: no held-out names (no golden dictionary)")
+            continue
+        tiers = eval_tiers(league, train, args.llm)
+        combos = ([combo.split(',') for combo in args.combos.split(';')] if args.combos
+                  else tier_combos(list(tiers)))
+        min_confidence = profile.get('min_confidence', 0.0) if args.min_confidence is None else args.min_confidence
+
+        print(f"\n{league}: {len(golden)} held-out names, min_confidence {min_confidence}")
+        print(f"  {'tiers':<26} {'cover':>7} {'exact':>7} {'prec':>7} {'CER':>7} {'conf.prec':>9} "
+              f"{'review':>6} {'p50 µs':>8} {'p95 µs':>8} {'cost $':>8}")
+        for combo in combos:
+            missing = [name for name in combo if name not in tiers]
+            if missing:
+                print(f"  {','.join(combo):<26} skipped (unavailable: {', '.join(missing)})")
+                continue
+            llm = tiers.get('llm')
+            cost_before = llm_cost(llm.usage) if llm else 0.0
+            result = evaluate_combo([tiers[name] for name in combo], golden, min_confidence)
+            metrics = result['metrics']
+            metrics['cost_usd'] = round(llm_cost(llm.usage) - cost_before, 6) if llm and 'llm' in combo else 0.0
+            latency = (f"{_fmt(metrics['p50_us'], False):>8} {_fmt(metrics['p95_us'], False):>8}"
+                       if metrics['p50_us'] is not None else f"{'-':>8} {_fmt(metrics['mean_us'], False):>8}")
+            print(f"  {','.join(combo):<26} {_fmt(metrics['coverage']):>7} {_fmt(metrics['exact']):>7} "
+                  f"{_fmt(metrics['precision']):>7} {_fmt(metrics['cer']):>7} {_fmt(metrics['confident_precision']):>9} "
+                  f"{metrics['needs_review']:>6} {latency} {metrics['cost_usd']:>8.4f}")
+            for name, gold, got, tier, confidence in result['errors'][:args.errors]:
+                print(f"      ✗ {name}: {got} (expected {gold}) [{tier} {confidence:.2f}]")
+            report.section(f"eval:{league}:{','.join(combo)}").update(metrics)
+
+        full = [name for name in EVAL_TIERS if name in tiers]
+        sweep = report.sections.get(f"eval:{league}:{','.join(full)}")
+        if sweep:
+            cells = ', '.join(f"≥{threshold}: {_fmt(values['coverage'])} @ {_fmt(values['precision'])}"
+                              for threshold, values in sweep['thresholds'].items())
+            print(f"  confidence sweep ({','.join(full)}) coverage @ precision — {cells}")
+
+    print(f"\n✓ Report: {report.write()}")
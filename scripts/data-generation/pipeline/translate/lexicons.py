@@ -0,0 +1,78 @@
+"""
+리그 스크립트에 흩어진 번역 사전 로더
+
+사전은 사람이 검수한 원본이므로 각 스크립트(build_saudi_file.py 등)에 그대로 둔다.
+스크립트를 import 하면 Supabase 연결 같은 부수 효과가 생길 수 있어, 소스를 ast 로 읽고
+모듈 최상위의 딕셔너리 리터럴만 꺼낸다.
+"""
+
+import ast
+import unicodedata
+from functools import lru_cache
+
+from .. import config
+
+# 리그별 이름 사전 (파일, 변수명). 뒤에 오는 사전이 같은 키를 덮어쓴다.
+LEXICON_SOURCES = {
+    'saudi': [
+        ('generate_saudi_players_final.py', 'KNOWN_PLAYERS'),
+        ('build_saudi_file.py', 'KNOWN_PLAYERS'),
+    ],
+    'j1': [
+        ('generate_j1_players.py', 'KOREAN_PLAYERS'),
+    ],
+    'eredivisie': [
+        ('translate_eredivisie_full.py', 'PLAYER_TRANSLATIONS'),
+        ('translate_eredivisie_full.py', 'KNOWN_PLAYERS'),
+        ('translate_eredivisie_players.py', 'PLAYER_TRANSLATIONS'),
+    ],
+}
+
+# python -m pipeline registry 가 만드는 team_registry.json 에서 읽는 사전 (팀 이름, 국적).
+# 선수 이름이 아니므로 load_all_lexicons(유사 이름 재사용, few-shot 예시)에는 넣지 않는다.
+REGISTRY_LEXICONS = ('teams', 'nationalities')
+
+# 규칙 엔진이 쓰는 부분 이름 사전
+RULE_DATA_SOURCES = {
+    'abdul-names': ('build_saudi_file.py', 'ABDUL_NAMES'),
+    'arabic-first-names': ('build_saudi_file.py', 'ARABIC_FIRST_NAMES'),
+    'arabic-name-parts': ('generate_saudi_players_final.py', 'ARABIC_NAME_PARTS'),
+    'japanese-surnames': ('generate_j1_players.py', 'JAPANESE_SURNAMES'),
+}
+
+
+@lru_cache(maxsize=None)
+def load_dict(filename: str, variable: str) -> dict:
+    """스크립트 최상위 `variable = {...}` 리터럴을 읽어 반환 (키는 NFC 정규화)"""
+    path = config.DATA_GENERATION_DIR / filename
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == variable for target in node.targets
+        ):
+            value = ast.literal_eval(node.value)
+            return {unicodedata.normalize('NFC', k): v for k, v in value.items()}
+    raise KeyError(f'{variable} not found in {filename}')
+
+
+def load_lexicon(group: str) -> dict:
+    if group in REGISTRY_LEXICONS:
+        from ..registry import load_registry
+
+        return load_registry().lexicon(group)
+    merged = {}
+    for filename, variable in LEXICON_SOURCES[group]:
+        merged.update(load_dict(filename, variable))
+    return merged
+
+
+def load_all_lexicons() -> dict:
+    """모든 리그 사전을 합친 것 (유사 이름 재사용 tier 의 원천)"""
+    merged = {}
+    for group in LEXICON_SOURCES:
+        merged.update(load_lexicon(group))
+    return merged
+
+
+def load_rule_data(name: str) -> dict:
+    return load_dict(*RULE_DATA_SOURCES[name])
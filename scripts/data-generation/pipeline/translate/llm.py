@@ -0,0 +1,207 @@
+"""
+LLM tier (Anthropic Messages API)
+
+다른 tier 가 모두 실패한 이름만 모아 한 번에 여러 명씩 번역을 요청한다.
+ANTHROPIC_API_KEY 가 없거나 anthropic 패키지가 없으면 비활성화(available=False)되어 resolver 가 건너뛴다.
+
+프롬프트 캐싱: 번역 규칙(프로필의 prompt_rules) + 사전에서 뽑은 예시(few-shot)는 리그마다 항상 같은
+system 블록으로 보낸다. 요청마다 바뀌는 것은 user 메시지의 이름 목록뿐이라, 두 번째 요청부터 공통 prefix 는
+캐시에서 읽힌다 (usage.cache_read_input_tokens). 캐시는 prefix 가 최소 길이(Sonnet 기준 1024 토큰) 이상일 때만
+동작하므로, 추정 토큰 수가 그보다 짧은 prefix(예시가 적은 teams/nationalities 등)에는 cache_control 을 붙이지 않는다.
+선수 이름 프로필은 리그 사전이 작으면 전체 사전 예시로 채워 최소 길이를 넘긴다 (profiles.profile_examples).
+"""
+
+import json
+import os
+from dataclasses import dataclass
+
+from .tiers import Tier
+
+DEFAULT_MODEL = os.environ.get('PIPELINE_LLM_MODEL', 'claude-3-5-sonnet-20241022')
+NAMES_PER_REQUEST = 40
+FEW_SHOT_EXAMPLES = 80
+MIN_CACHEABLE_TOKENS = 1024
+
+# 프로필에 prompt_rules 가 없을 때 (리그 언어를 특정할 수 없는 mls 등)
+DEFAULT_PROMPT_RULES = ['선수의 출신 언어 발음 기준 (예: 스페인 이름 → 스페인어 발음 "Ángel" → "앙헬")']
+
+
+@dataclass
+class LlmUsage:
+    requests: int = 0
+    names: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    failed_requests: int = 0  # API 오류 또는 JSON 이 아닌 응답 (그 요청의 이름은 검수 큐로)
+
+    def add(self, usage):
+        """usage: SDK 응답 객체의 usage 또는 Batches 결과 JSON 의 usage dict"""
+        self.requests += 1
+        for key in ('input_tokens', 'output_tokens', 'cache_creation_input_tokens', 'cache_read_input_tokens'):
+            value = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, 0)
+            setattr(self, key, getattr(self, key) + (value or 0))
+
+
+def parse_json_response(text: str) -> dict:
+    """```json 코드 블록으로 감싸진 응답도 허용"""
+    text = text.strip()
+    if text.startswith('```json'):
+        text = text[7:]
+    if text.startswith('```'):
+        text = text[3:]
+    if text.endswith('```'):
+        text = text[:-3]
+    return json.loads(text.strip())
+
+
+def few_shot_examples(entries: dict, limit: int = FEW_SHOT_EXAMPLES) -> list:
+    """사전에서 고르게 뽑은 (영문, 한글) 예시. 사전이 같으면 항상 같은 목록 (캐시 prefix 가 안 바뀜)"""
+    items = sorted(entries.items())
+    if len(items) <= limit:
+        return items
+    step = len(items) / limit
+    return [items[int(i * step)] for i in range(limit)]
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 보수적으로 추정 (한글 음절 1토큰, 그 밖은 4자당 1토큰) — 캐시 최소 길이 판단용"""
+    hangul = sum(1 for char in text if '가' <= char <= '힣')
+    return hangul + (len(text) - hangul) // 4
+
+
+def format_rules(rules: list) -> str:
+    return '\n'.join(['**번역 규칙:**'] + [f'{i + 1}. {rule}' for i, rule in enumerate(rules)])
+
+
+def build_system_prefix(language_hint: str = None, examples: list = (), instruction: str = None,
+                        rules: list = None) -> str:
+    """요청마다 동일한 prefix (규칙 + 예시 + 응답 형식). instruction 이 있으면 선수 이름 규칙 대신 사용 (팀/국적)"""
+    hint = f' {language_hint} 발음 기준으로' if language_hint else ' 원어 발음 기준으로'
+    parts = [instruction] if instruction else [f'축구 선수 이름을{hint} 한국어로 번역합니다.', '',
+                                               format_rules(rules or DEFAULT_PROMPT_RULES)]
+    if examples:
+        parts += ['', '**검수된 번역 예시:**']
+        parts += [f'- "{english}" → "{korean}"' for english, korean in examples]
+    parts += [
+        '',
+        '**응답 형식 (JSON):**',
+        '{"원래 이름": "한글 이름", ...}',
+        '',
+        '중요: 반드시 JSON 형식으로만 응답하고, 다른 설명은 포함하지 마세요.',
+    ]
+    return '\n'.join(parts)
+
+
+def build_prompt(names: list) -> str:
+    """요청마다 바뀌는 부분 (이름 목록만)"""
+    numbered = '\n'.join(f'{i + 1}. {name}' for i, name in enumerate(names))
+    return f'**선수 목록:**\n{numbered}'
+
+
+def system_blocks(language_hint: str = None, examples: list = (), instruction: str = None, rules: list = None) -> list:
+    """prefix 가 캐시 최소 길이 이상일 때만 cache_control (짧은 prefix 는 API 가 캐시하지 않는다)"""
+    text = build_system_prefix(language_hint, examples, instruction, rules)
+    block = {'type': 'text', 'text': text}
+    if estimate_tokens(text) >= MIN_CACHEABLE_TOKENS:
+        block['cache_control'] = {'type': 'ephemeral'}
+    return [block]
+
+
+def profile_system_blocks(profile: dict, examples: list = ()) -> list:
+    return system_blocks(profile.get('language'), examples, profile.get('instruction'), profile.get('prompt_rules'))
+
+
+def message_params(names: list, system: list, model: str = DEFAULT_MODEL) -> dict:
+    """messages.create 인자 (대화형 요청과 Batches API 요청이 같은 형태를 쓴다)"""
+    return {
+        'model': model,
+        'max_tokens': 4000,
+        'system': system,
+        'messages': [{'role': 'user', 'content': build_prompt(names)}],
+    }
+
+
+def chunked(names: list, size: int = NAMES_PER_REQUEST):
+    for start in range(0, len(names), size):
+        yield names[start:start + size]
+
+
+def translations_for(chunk: list, text: str) -> dict:
+    """응답 텍스트에서 요청한 이름의 번역만 꺼냄 (문자열이 아닌 값은 버림)"""
+    translations = parse_json_response(text)
+    if not isinstance(translations, dict):
+        raise ValueError(f'expected a JSON object, got {type(translations).__name__}')
+    return {name: translations[name].strip() for name in chunk
+            if isinstance(translations.get(name), str) and translations[name].strip()}
+
+
+class LlmTier(Tier):
+    name = 'llm'
+    persist = True
+    confidence = 0.9
+    reason = 'llm'
+
+    def __init__(self, client=None, model: str = DEFAULT_MODEL, language_hint: str = None,
+                 names_per_request: int = NAMES_PER_REQUEST, examples: list = (), instruction: str = None,
+                 rules: list = None):
+        self.model = model
+        self.language_hint = language_hint
+        self.instruction = instruction
+        self.rules = rules
+        self.names_per_request = names_per_request
+        self.examples = list(examples)
+        self.usage = LlmUsage()
+        self.client = client if client is not None else _default_client()
+        self.available = self.client is not None
+
+    @property
+    def system(self) -> list:
+        return system_blocks(self.language_hint, self.examples, self.instruction, self.rules)
+
+    def lookup(self, name: str):
+        return self.lookup_many([name]).get(name)
+
+    def lookup_many(self, names: list) -> dict:
+        """요청 단위로 실패를 격리: 한 요청이 실패해도 앞선 요청의 결과는 돌려주고(→ 캐시), 실패한 요청의 이름은
+        찾지 못한 것으로 남아 검수 큐로 간다"""
+        found = {}
+        system = self.system
+        errors = _api_errors() + (ValueError, KeyError, IndexError, AttributeError)
+        for chunk in chunked(names, self.names_per_request):
+            try:
+                message = self.client.messages.create(**message_params(chunk, system, self.model))
+            except errors as e:
+                self.usage.failed_requests += 1
+                print(f"⚠ LLM request failed for {len(chunk)} name(s): {e}")
+                continue
+            self.usage.add(getattr(message, 'usage', None))
+            self.usage.names += len(chunk)
+            try:
+                translations = translations_for(chunk, message.content[0].text)
+            except errors as e:
+                self.usage.failed_requests += 1
+                print(f"⚠ Unusable LLM response for {len(chunk)} name(s): {e}")
+                continue
+            found.update((name, self.candidate(korean)) for name, korean in translations.items())
+        return found
+
+
+def _api_errors() -> tuple:
+    """anthropic SDK 의 API 오류 (패키지가 없으면 연결 오류만)"""
+    try:
+        import anthropic
+    except ImportError:
+        return (OSError,)
+    return (anthropic.APIError, OSError)
+
+
+def _default_client():
+    if not os.environ.get('ANTHROPIC_API_KEY'):
+        return None
+    try:
+        import anthropic
+    except ImportError:
+        return None
+    return anthropic.Anthropic(api_key=os.environ['ANTHROPIC_API_KEY'])
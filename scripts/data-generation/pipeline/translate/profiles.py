@@ -0,0 +1,184 @@
+"""
+리그별 번역 프로필
+
+각 리그는 사용할 사전, 규칙, tier 순서, 신뢰도 기준, LLM 프롬프트 규칙(prompt_rules)만 선언한다.
+tier 구현은 TIER_FACTORIES 에 등록.
+min_confidence 미만 결과는 다음 tier(결국 LLM)로 넘어가고, LLM 이 없거나 LLM 결과도 미만이면 검수 큐로 간다.
+
+teams / nationalities 는 리그가 아니라 팀 이름·국적용 프로필 (python -m pipeline registry).
+사전은 team_registry.json, 영구 캐시는 선수 이름과 섞이지 않게 별도 sqlite 파일을 쓴다.
+"""
+
+from .. import config
+from .lexicons import load_all_lexicons, load_lexicon
+from .llm import FEW_SHOT_EXAMPLES, LlmTier, few_shot_examples
+from .resolver import Resolver
+from .review import ReviewQueue
+from .rules import build_rules
+from .shard import default_workers, shard_tiers
+from .tiers import CacheTier, FuzzyTier, LexiconTier, RuleTier
+
+DEFAULT_TIERS = ['lexicon', 'cache', 'fuzzy', 'rules', 'llm']
+
+LEAGUE_PROFILES = {
+    'saudi-pro-league': {
+        'lexicons': ['saudi'],
+        'rules': ['al-prefix', 'abdul', 'arabic-first-name', 'arabic-tokens'],
+        'tiers': DEFAULT_TIERS,
+        'language': '아랍어',
+        'min_confidence': 0.7,
+        'prompt_rules': [
+            '아랍 이름 → 아랍어 발음, 관사 "Al-" 는 "알 " 로 띄어 씀 (예: "Al-Dawsari" → "알 다우사리")',
+            '"Abdul" 계열은 붙여 씀 (예: "Abdulrahman" → "압둘라흐만", "Abdullah" → "압둘라")',
+            '외국인 선수 → 출신 언어 발음 (예: 브라질 "Roberto Firmino" → "호베르투 피르미누")',
+        ],
+    },
+    'j1-league': {
+        'lexicons': ['j1'],
+        'rules': ['japanese-surname'],
+        'tiers': DEFAULT_TIERS,
+        'language': '일본어',
+        'min_confidence': 0.7,
+        'prompt_rules': [
+            '일본 이름 → 일본어 발음, 장음은 표기하지 않음 (예: "Yuki Ohashi" → "유키 오하시", "Kota" → "고타")',
+            '어두의 k/t 는 예사소리 (예: "Kawasaki" → "가와사키", "Takahashi" → "다카하시")',
+            '한국 선수 → 한국 이름 (예: "Kim Jin-Hyeon" → "김진현"), 기타 외국인 → 출신 언어 발음',
+        ],
+    },
+    'eredivisie': {
+        'lexicons': ['eredivisie'],
+        'rules': [],
+        'tiers': ['lexicon', 'cache', 'fuzzy', 'llm'],
+        'language': '네덜란드어',
+        'min_confidence': 0.8,
+        'prompt_rules': [
+            '네덜란드 이름 → 네덜란드어 발음, "van"/"de" 같은 접두사도 음역 (예: "Virgil van Dijk" → "버질 판데이크")',
+            '"ij" → "에이", "g" → "ㅎ" 발음 (예: "Gakpo" → "학포")',
+            '수리남/벨기에/기타 외국인 → 출신 언어 발음',
+        ],
+    },
+    'primeira-liga': {
+        'lexicons': [],
+        'rules': [],
+        'tiers': ['lexicon', 'cache', 'fuzzy', 'llm'],
+        'language': '포르투갈어',
+        'min_confidence': 0.8,
+        'prompt_rules': [
+            '포르투갈 이름 → 포르투갈어 발음 (예: "João" → "조앙", "Gonçalo" → "곤살루", "ç" → "ㅅ" 발음)',
+            '브라질 선수 → 포르투갈어 발음 (예: "Pepê" → "페페")',
+            '스페인 이름 → 스페인어 발음 (예: "Ángel" → "앙헬")',
+            '기타 외국인 → 해당 언어 발음',
+        ],
+    },
+    'mls': {
+        'lexicons': [],
+        'rules': [],
+        'tiers': ['lexicon', 'cache', 'fuzzy', 'llm'],
+        'language': None,
+        'min_confidence': 0.8,
+    },
+    'teams': {
+        'lexicons': ['teams'],
+        'rules': [],
+        'tiers': ['lexicon', 'cache', 'llm'],
+        'language': None,
+        'min_confidence': 0.8,
+        'cache': 'registry.sqlite',
+        'instruction': '축구 팀 이름을 한국 언론에서 통용되는 표기로 번역합니다. '
+                       '구단 고유명은 원어 발음 기준, FC/SC 같은 약어는 그대로 둡니다. (예: "Al-Hilal" → "알 힐랄")',
+    },
+    'nationalities': {
+        'lexicons': ['nationalities'],
+        'rules': [],
+        'tiers': ['lexicon', 'cache', 'llm'],
+        'language': None,
+        'min_confidence': 0.8,
+        'cache': 'registry.sqlite',
+        'instruction': '축구 선수 국적(국가 이름)을 한국에서 통용되는 국가명으로 번역합니다. '
+                       '(예: "Japan" → "일본", "Korea Republic" → "대한민국", "Ivory Coast" → "코트디부아르")',
+    },
+}
+
+_shared = {}
+
+
+def _shared_instance(key, factory):
+    # 영구 캐시와 전체 사전 인덱스는 프로필끼리 공유
+    if key not in _shared:
+        _shared[key] = factory()
+    return _shared[key]
+
+
+def _profile_entries(profile) -> dict:
+    entries = {}
+    for group in profile['lexicons']:
+        entries.update(load_lexicon(group))
+    return entries
+
+
+def _lexicon_tier(profile):
+    return LexiconTier(_profile_entries(profile))
+
+
+def profile_examples(profile) -> list:
+    # 캐시 prefix 용 예시: 리그 사전 전부, 모자라면 전체 사전에서 채움 → prefix 가 캐시 최소 길이를 넘김
+    # (팀/국적 프로필은 선수 이름을 섞지 않으므로 사전이 작으면 prefix 가 짧고 캐시하지 않는다)
+    entries = _profile_entries(profile)
+    examples = few_shot_examples(entries)
+    if profile.get('instruction') or len(examples) >= FEW_SHOT_EXAMPLES:
+        return examples
+    others = {english: korean for english, korean in load_all_lexicons().items() if english not in entries}
+    return examples + few_shot_examples(others, FEW_SHOT_EXAMPLES - len(examples))
+
+
+def _llm_tier(profile):
+    tier = LlmTier(language_hint=profile.get('language'), instruction=profile.get('instruction'),
+                   rules=profile.get('prompt_rules'))
+    if tier.available:
+        tier.examples = profile_examples(profile)
+    return tier
+
+
+def _cache_tier(filename: str):
+    return _shared_instance(('cache', filename), lambda: CacheTier(config.CACHE_DIR / filename))
+
+
+TIER_FACTORIES = {
+    'lexicon': _lexicon_tier,
+    'cache': lambda profile: _cache_tier(profile.get('cache', 'translations.sqlite')),
+    'fuzzy': lambda profile: _shared_instance('fuzzy', lambda: FuzzyTier(load_all_lexicons())),
+    'rules': lambda profile: RuleTier(build_rules(profile['rules'])),
+    'llm': _llm_tier,
+}
+
+
+def build_resolver(league: str, tiers: list = None, workers: int = None, dry_run: bool = False) -> Resolver:
+    """프로필대로 resolver 생성. tiers 로 순서를 덮어쓸 수 있다 (평가/실험용)
+
+    workers > 1 (기본: PIPELINE_TRANSLATE_WORKERS) 이면 fuzzy/rules tier 를 프로세스 풀로 샤딩 (shard.py)
+    dry_run 이면 부작용 없는 resolver: LLM tier(유료 호출)와 검수 큐(review.sqlite) 없이, 영구 캐시는 이미 있을 때만 읽는다
+    """
+    profile = LEAGUE_PROFILES[league]
+    names = tiers or profile['tiers']
+    if dry_run:
+        cache_path = config.CACHE_DIR / profile.get('cache', 'translations.sqlite')
+        names = [name for name in names if name != 'llm' and (name != 'cache' or cache_path.exists())]
+    built = [TIER_FACTORIES[name](profile) for name in names]
+    workers = default_workers() if workers is None else workers
+    return Resolver(
+        shard_tiers(league, built, profile['rules'], workers),
+        profile=league,
+        min_confidence=profile.get('min_confidence', 0.0),
+        review_queue=None if dry_run else _shared_instance('review', ReviewQueue),
+    )
+
+
+_resolvers = {}
+
+
+def get_resolver(league: str, dry_run: bool = False) -> Resolver:
+    """프로세스 안에서 리그별로 하나만 만들어 재사용 (메모이즈/지표 공유). dry_run 은 build_resolver 참고"""
+    key = (league, dry_run)
+    if key not in _resolvers:
+        _resolvers[key] = build_resolver(league, dry_run=dry_run)
+    return _resolvers[key]
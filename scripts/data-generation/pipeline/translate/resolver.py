@@ -0,0 +1,176 @@
+"""
+tier 체인 resolver
+
+프로필이 선언한 순서대로 tier 를 시도한다 (가장 싼 tier 가 먼저).
+- tier 결과의 신뢰도가 리그 기준(min_confidence) 이상이면 확정, 미만이면 가장 나은 후보로 보관하고
+  다음 tier 로 넘긴다 → 비싼 tier(LLM)에는 불확실한 이름만 간다
+- 마지막까지 기준 미만이면 가장 나은 후보를 쓰되 needs_review 로 표시하고 검수 큐에 넣는다
+- 이름별 결과(실패 포함)를 메모이즈
+- tier 는 서로를 호출하지 않으므로 fallthrough 에 순환이 없다
+- tier 별 호출 수 / 적중 수 / 기준 미만 수 / 소요 시간 집계
+- persist 가 켜진 tier(LLM)의 결과는 영구 캐시 tier 에 기록
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+
+from .confidence import assess
+from .tiers import CacheTier
+
+
+@dataclass(frozen=True)
+class Resolution:
+    korean: str
+    tier: str
+    confidence: float = 1.0
+    reason: str = 'exact'
+    needs_review: bool = False
+
+
+@dataclass
+class TierMetrics:
+    calls: int = 0
+    hits: int = 0
+    low_confidence: int = 0
+    seconds: float = 0.0
+
+
+class Resolver:
+    def __init__(self, tiers: list, profile: str = None, min_confidence: float = 0.0, review_queue=None):
+        self.profile = profile
+        self.min_confidence = min_confidence
+        self.review_queue = review_queue
+        self.tiers = [tier for tier in tiers if tier.available]
+        self.cache_tier = next((tier for tier in self.tiers if isinstance(tier, CacheTier)), None)
+        self.metrics = {tier.name: TierMetrics() for tier in self.tiers}
+        self._memo = {}
+        self._lock = threading.Lock()
+
+    @property
+    def tier_names(self) -> list:
+        return [tier.name for tier in self.tiers]
+
+    def resolve(self, name: str, skip: tuple = ()):
+        return self.resolve_many([name], skip)[name]
+
+    def resolve_many(self, names, skip: tuple = ()) -> dict:
+        """{name: Resolution | None}. 각 tier 에는 앞 tier 가 못 풀었거나 기준 미만인 이름만 한 번에 넘긴다"""
+        skip = tuple(skip)
+        results = {}
+        best = {}  # 기준 미만 후보 중 가장 나은 것
+        pending = []
+        with self._lock:
+            for name in dict.fromkeys(names):
+                key = (name, skip)
+                if key in self._memo:
+                    results[name] = self._memo[key]
+                else:
+                    pending.append(name)
+
+        looked_up = list(pending)
+        for tier in self.tiers:
+            if not pending:
+                break
+            if tier.name in skip:
+                continue
+
+            asked = len(pending)
+            started = time.perf_counter()
+            found = tier.lookup_many(pending)
+            elapsed = time.perf_counter() - started
+
+            found = {name: assess(name, candidate) for name, candidate in found.items()}
+            if found and tier.persist and self.cache_tier is not None:
+                self.cache_tier.store_many(found, tier.name)
+
+            low = 0
+            for name, candidate in found.items():
+                resolution = Resolution(candidate.korean, tier.name, candidate.confidence, candidate.reason)
+                if candidate.confidence >= self.min_confidence:
+                    results[name] = resolution
+                    best.pop(name, None)
+                    continue
+                low += 1
+                if name not in best or candidate.confidence > best[name].confidence:
+                    best[name] = resolution
+                if candidate.terminal:
+                    # 캐시된 LLM 결과 등: 비싼 tier 로 다시 보내도 나아지지 않으므로 바로 검수 대상
+                    results[name] = None
+            pending = [name for name in pending if name not in results]
+
+            with self._lock:
+                metrics = self.metrics[tier.name]
+                metrics.calls += asked
+                metrics.hits += len(found) - low
+                metrics.low_confidence += low
+                metrics.seconds += elapsed
+
+        review = {}
+        for name in looked_up:
+            if name in best:
+                results[name] = replace(best[name], needs_review=True)
+                review[name] = results[name]
+            elif name not in results or results[name] is None:
+                results[name] = None
+                # 아무 tier 도 답하지 못한 이름도 검수 대상 (기존 스크립트는 영문 이름을 그대로 출력)
+                review[name] = Resolution(None, None, 0.0, 'untranslated', needs_review=True)
+
+        if self.review_queue is not None and self.profile and looked_up:
+            if review:
+                self.review_queue.add_many(self.profile, review)
+            confident = [name for name in looked_up if results[name] is not None and not results[name].needs_review]
+            if confident:
+                self.review_queue.discard_many(self.profile, confident)
+
+        with self._lock:
+            for name in results:
+                self._memo.setdefault((name, skip), results[name])
+        return results
+
+    def translate(self, name: str, skip: tuple = ()) -> str:
+        """한글 이름, 어느 tier 도 못 찾으면 원래 이름 (기존 스크립트 동작과 동일)"""
+        resolution = self.resolve(name, skip)
+        return resolution.korean if resolution is not None else name
+
+    def translate_many(self, names, skip: tuple = ()) -> dict:
+        """{이름: 한글 또는 원래 이름}. translate 의 배치판 — 이름마다 부르면 LLM tier 가 이름당 요청 하나가 된다"""
+        return {name: resolution.korean if resolution is not None else name
+                for name, resolution in self.resolve_many(names, skip).items()}
+
+    def metrics_rows(self) -> list:
+        rows = []
+        for tier_name in self.tier_names:
+            m = self.metrics[tier_name]
+            rows.append({
+                'tier': tier_name,
+                'calls': m.calls,
+                'hits': m.hits,
+                'hit_rate': round(m.hits / m.calls, 4) if m.calls else 0.0,
+                'low_confidence': m.low_confidence,
+                'total_ms': round(m.seconds * 1000, 3),
+                'avg_us_per_name': round(m.seconds * 1e6 / m.calls, 2) if m.calls else 0.0,
+            })
+        return rows
+
+    def record(self, report):
+        """tier 지표와 사용량(LLM 토큰, 캐시 적중 토큰)을 RunReport 에 누적"""
+        for row in self.metrics_rows():
+            report.add(f'tier:{row["tier"]}', 'calls', row['calls'])
+            report.add(f'tier:{row["tier"]}', 'hits', row['hits'])
+            report.add(f'tier:{row["tier"]}', 'low_confidence', row['low_confidence'])
+            report.add(f'tier:{row["tier"]}', 'total_ms', row['total_ms'])
+        for tier in self.tiers:
+            usage = getattr(tier, 'usage', None)
+            if usage is not None:
+                for key, value in asdict(usage).items():
+                    report.add(f'{tier.name}_usage', key, value)
+
+    def format_metrics(self) -> str:
+        lines = [f"{'tier':<10} {'calls':>8} {'hits':>8} {'hit%':>7} {'low':>6} {'total ms':>10} {'µs/name':>9}"]
+        for row in self.metrics_rows():
+            lines.append(
+                f"{row['tier']:<10} {row['calls']:>8} {row['hits']:>8} {row['hit_rate'] * 100:>6.1f}% "
+                f"{row['low_confidence']:>6} {row['total_ms']:>10.2f} {row['avg_us_per_name']:>9.2f}"
+            )
+        return '\n'.join(lines)
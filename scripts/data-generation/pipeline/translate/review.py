@@ -0,0 +1,91 @@
+"""
+수동 검수 큐
+
+리그 기준 신뢰도(min_confidence)에 못 미쳤고 LLM 으로도 해결되지 않은 번역을 모아 둔다.
+나중에 같은 이름이 기준 이상으로 해결되면 큐에서 빠진다.
+검수한 번역은 리그 스크립트의 사전(KNOWN_PLAYERS 등)에 추가하면 lexicon tier 가 바로 쓴다.
+
+사용법:
+    python -m pipeline review [--league j1-league] [--limit 50] [--export review.json]
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .. import config
+
+REVIEW_PATH = config.CACHE_DIR / 'review.sqlite'
+
+
+class ReviewQueue:
+    def __init__(self, path: Path = REVIEW_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS review_queue ('
+            ' name TEXT NOT NULL, profile TEXT NOT NULL, korean TEXT, confidence REAL, reason TEXT, tier TEXT,'
+            ' updated_at REAL, PRIMARY KEY (name, profile))'
+        )
+        self._conn.commit()
+
+    def add_many(self, profile: str, resolutions: dict):
+        """resolutions: {name: Resolution}"""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO review_queue (name, profile, korean, confidence, reason, tier, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                [(name, profile, r.korean, r.confidence, r.reason, r.tier, now) for name, r in resolutions.items()],
+            )
+            self._conn.commit()
+
+    def discard_many(self, profile: str, names):
+        with self._lock:
+            cursor = self._conn.executemany(
+                'DELETE FROM review_queue WHERE name = ? AND profile = ?', [(name, profile) for name in names]
+            )
+            if cursor.rowcount:
+                self._conn.commit()
+
+    def items(self, profile: str = None, limit: int = None) -> list:
+        query = 'SELECT name, profile, korean, confidence, reason, tier FROM review_queue'
+        params = []
+        if profile:
+            query += ' WHERE profile = ?'
+            params.append(profile)
+        query += ' ORDER BY confidence, name'
+        if limit:
+            query += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        keys = ('name', 'profile', 'korean', 'confidence', 'reason', 'tier')
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('review', help='신뢰도가 낮아 검수가 필요한 번역 목록')
+    parser.add_argument('--league', default=None)
+    parser.add_argument('--limit', type=int, default=50)
+    parser.add_argument('--export', type=Path, default=None, help='전체 목록을 JSON 으로 저장')
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    queue = ReviewQueue()
+    if args.export:
+        items = queue.items(args.league)
+        args.export.write_text(json.dumps(items, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"✓ Exported {len(items)} items: {args.export}")
+        return
+
+    items = queue.items(args.league, args.limit)
+    for item in items:
+        print(f"  {item['confidence']:.2f}  {item['profile']:<18} {item['name']} -> {item['korean']}  "
+              f"[{item['tier']}: {item['reason']}]")
+    print(f"✓ {len(items)} item(s) shown")
@@ -0,0 +1,92 @@
+"""
+규칙 기반 음역 (rule engine tier)
+
+각 규칙은 이름을 받아 한글 문자열 또는 None(적용 불가)을 돌려준다.
+리그 스크립트에 있던 ad hoc 규칙을 그대로 옮긴 것으로, 결과가 부분 번역일 수 있다.
+"""
+
+from .lexicons import load_rule_data
+
+
+def al_prefix_rule():
+    """'Al-Xxx' / 'Al Xxx' → '알 Xxx' (build_saudi_file)"""
+    def rule(name: str):
+        if name.startswith('Al-') or name.startswith('Al '):
+            parts = name.replace('Al-', 'Al ').split()
+            if len(parts) >= 2:
+                return '알 ' + ' '.join(parts[1:])
+        return None
+    return rule
+
+
+def substring_rule(mapping: dict):
+    """사전의 첫 번째 일치 부분 문자열만 치환 (build_saudi_file 의 Abdul-/아랍 이름 규칙)"""
+    def rule(name: str):
+        for eng, kor in mapping.items():
+            if eng in name:
+                return name.replace(eng, kor)
+        return None
+    return rule
+
+
+def token_rule(mapping: dict):
+    """공백 단위 토큰 치환, 'Al-Xxx' 는 '알 ' + Xxx (generate_saudi_players_final)"""
+    def translate_token(token: str):
+        if token in mapping:
+            return mapping[token]
+        if token.startswith('Al-') and len(token) > 3:
+            rest = token[3:]
+            return '알 ' + mapping.get(rest, rest)
+        return None
+
+    def rule(name: str):
+        parts = []
+        translated = 0
+        for token in name.split(' '):
+            korean = translate_token(token)
+            if korean is None:
+                parts.append(token)
+            else:
+                parts.append(korean)
+                translated += 1
+        return ' '.join(parts) if translated else None
+    return rule
+
+
+def japanese_surname_rule(mapping: dict):
+    """'Surname Given' → '성씨 Given', 이니셜이면 '성씨 K.' (generate_j1_players)"""
+    def rule(name: str):
+        parts = name.split()
+        if not parts or parts[0] not in mapping:
+            return None
+        korean_surname = mapping[parts[0]]
+        if len(parts) == 1:
+            return korean_surname
+        given_name = parts[1]
+        if len(given_name) <= 2 and given_name.endswith('.'):
+            return f"{korean_surname} {given_name[0]}."
+        return f"{korean_surname} {given_name}"
+    return rule
+
+
+# 규칙 이름 → (규칙 생성 함수, 부분 이름 사전 이름 | None)
+RULES = {
+    'al-prefix': (al_prefix_rule, None),
+    'abdul': (substring_rule, 'abdul-names'),
+    'arabic-first-name': (substring_rule, 'arabic-first-names'),
+    'arabic-tokens': (token_rule, 'arabic-name-parts'),
+    'japanese-surname': (japanese_surname_rule, 'japanese-surnames'),
+}
+
+
+def rule_data_names(names) -> list:
+    return [RULES[name][1] for name in names if RULES[name][1]]
+
+
+def build_rules(names, load=load_rule_data) -> list:
+    """load: 사전 이름 → 매핑 (기본: 스크립트 리터럴, 샤드 worker 는 mmap 테이블)"""
+    rules = []
+    for name in names:
+        factory, data = RULES[name]
+        rules.append((name, factory(load(data)) if data else factory()))
+    return rules
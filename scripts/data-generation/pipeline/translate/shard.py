@@ -0,0 +1,270 @@
+"""
+CPU tier(유사 이름, 규칙) 샤드 번역 — 프로세스 풀 + mmap 사전
+
+fuzzy / rules tier 는 순수 파이썬 CPU 작업이라 스레드로는 코어 하나만 쓴다.
+이름이 많으면(전체 테이블 재번역) 이름 목록을 청크로 나눠 프로세스 풀에서 돌린다.
+
+- 사전은 worker 마다 pickle 로 보내지 않는다. fuzzy 인덱스(folded/abbreviated/tokens)와 규칙용 부분 이름 사전을
+  한 번 번들 파일(.pipeline-cache/translate/shards/<리그>-<해시>.bin)로 컴파일하고, 각 worker 는 이 파일을
+  mmap 해 그대로 조회한다 (OS 페이지 캐시를 공유, 내용이 같으면 다음 실행도 같은 파일 재사용)
+- 테이블 형식 (FrozenTable): 오프셋 배열 + crc32 열린 주소법 해시 슬롯 + UTF-8 데이터. 조회는 슬롯 탐사 후
+  mmap 위에서 키 바이트 비교, 순회는 원래 순서 (substring 규칙은 사전 순서가 의미 있음).
+  배열은 머신 로컬 캐시라 native byte order
+- worker 로는 이름 청크만 보내고 {이름: Candidate} 만 돌려받는다. 청크는 입력 순서대로 이어 붙여 병합하므로
+  worker 수나 완료 순서와 관계없이 결과가 같다
+- 이름 수가 SHARD_MIN_NAMES 미만이면 프로세스를 쓰지 않고 현재 프로세스의 tier 로 조회
+
+    resolver = build_resolver('saudi-pro-league', workers=8)   # 또는 PIPELINE_TRANSLATE_WORKERS=8
+"""
+
+import atexit
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .. import config
+from ..fetcher import _atomic_write
+from .rules import build_rules, rule_data_names
+from .tiers import FuzzyTier, RuleTier, Tier
+
+SHARD_DIR = config.CACHE_DIR / 'translate' / 'shards'
+SHARDED_TIERS = ('fuzzy', 'rules')
+SHARD_MIN_NAMES = 2000
+CHUNKS_PER_WORKER = 4
+
+TABLE_MAGIC = b'PFT1'
+BUNDLE_MAGIC = b'PSB1'
+
+
+class FrozenTable:
+    """str → str 읽기 전용 매핑. bytes 또는 mmap 의 memoryview 위에서 복사 없이 조회"""
+
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        if bytes(view[:4]) != TABLE_MAGIC:
+            raise ValueError('Not a frozen table')
+        self._count, slot_count, data_length = struct.unpack_from('<III', view, 4)
+        offsets_end = 16 + 4 * (2 * self._count + 1)
+        slots_end = offsets_end + 4 * slot_count
+        self._offsets = view[16:offsets_end].cast('I')
+        self._slots = view[offsets_end:slots_end].cast('I')
+        self._mask = slot_count - 1
+        self._data = view[slots_end:slots_end + data_length]
+        self._items = None
+
+    @staticmethod
+    def build(mapping) -> bytes:
+        offsets, data, keys = array('I'), bytearray(), []
+        for key, value in mapping.items():
+            if not isinstance(key, str) or not isinstance(value, str):
+                raise TypeError(f'FrozenTable only holds str → str ({key!r}: {value!r})')
+            encoded = key.encode('utf-8')
+            keys.append(encoded)
+            offsets.append(len(data))
+            offsets.append(len(data) + len(encoded))
+            data += encoded + value.encode('utf-8')
+        offsets.append(len(data))
+
+        # 열린 주소법 해시 (crc32, 선형 탐사). 슬롯 값은 항목 번호 + 1, 0 은 빈 슬롯
+        slot_count = 1
+        while slot_count < 2 * len(keys):
+            slot_count *= 2
+        slots = array('I', [0]) * slot_count
+        for index, key in enumerate(keys):
+            slot = zlib.crc32(key) & (slot_count - 1)
+            while slots[slot]:
+                slot = (slot + 1) & (slot_count - 1)
+            slots[slot] = index + 1
+        header = TABLE_MAGIC + struct.pack('<III', len(keys), slot_count, len(data))
+        return header + offsets.tobytes() + slots.tobytes() + bytes(data)
+
+    def _find(self, key: str) -> int:
+        target = key.encode('utf-8')
+        offsets, slots, data, mask = self._offsets, self._slots, self._data, self._mask
+        slot = zlib.crc32(target) & mask
+        while True:
+            entry = slots[slot]
+            if not entry:
+                return -1
+            index = entry - 1
+            if data[offsets[2 * index]:offsets[2 * index + 1]] == target:
+                return index
+            slot = (slot + 1) & mask
+
+    def _key(self, index: int) -> str:
+        return str(self._data[self._offsets[2 * index]:self._offsets[2 * index + 1]], 'utf-8')
+
+    def _value(self, index: int) -> str:
+        return str(self._data[self._offsets[2 * index + 1]:self._offsets[2 * index + 2]], 'utf-8')
+
+    def get(self, key: str, default=None):
+        index = self._find(key)
+        return default if index < 0 else self._value(index)
+
+    def __getitem__(self, key: str) -> str:
+        index = self._find(key)
+        if index < 0:
+            raise KeyError(key)
+        return self._value(index)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._find(key) >= 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> list:
+        # 순회하는 규칙(substring)용. 처음 한 번만 풀어 worker 안에 둔다
+        if self._items is None:
+            self._items = [(self._key(index), self._value(index)) for index in range(self._count)]
+        return self._items
+
+    def keys(self):
+        return [key for key, _ in self.items()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+
+def build_bundle(tables: dict) -> bytes:
+    """{테이블 이름: 매핑} → 번들 바이트 (헤더 JSON + 4바이트 정렬된 테이블들)"""
+    blobs = {name: FrozenTable.build(mapping) for name, mapping in tables.items()}
+    layout, position = {}, 0
+    for name, blob in blobs.items():
+        layout[name] = [position, len(blob)]
+        position += len(blob) + (-len(blob) % 4)
+    header = json.dumps(layout, ensure_ascii=False).encode('utf-8')
+    header += b' ' * (-(len(header) + 8) % 4)
+    body = b''.join(blob + b'\0' * (-len(blob) % 4) for blob in blobs.values())
+    return BUNDLE_MAGIC + struct.pack('<I', len(header)) + header + body
+
+
+def open_bundle(path) -> dict:
+    """번들 파일을 mmap 하고 {테이블 이름: FrozenTable} (mmap 은 프로세스가 끝날 때까지 유지)"""
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mapped[:4] != BUNDLE_MAGIC:
+        raise ValueError(f'Not a shard bundle: {path}')
+    (header_length,) = struct.unpack_from('<I', mapped, 4)
+    layout = json.loads(mapped[8:8 + header_length])
+    start = 8 + header_length
+    view = memoryview(mapped)
+    return {name: FrozenTable(view[start + offset:start + offset + length]) for name, (offset, length) in layout.items()}
+
+
+def bundle_tables(tiers: dict, rule_names) -> dict:
+    """현재 프로세스의 tier 에서 worker 가 쓸 테이블을 모은다"""
+    from .lexicons import load_rule_data
+
+    tables = {}
+    if 'fuzzy' in tiers:
+        fuzzy = tiers['fuzzy']
+        tables.update({'fuzzy.folded': fuzzy.folded, 'fuzzy.abbreviated': fuzzy.abbreviated,
+                       'fuzzy.tokens': fuzzy.tokens})
+    if 'rules' in tiers:
+        for data_name in rule_data_names(rule_names):
+            tables[f'rule:{data_name}'] = load_rule_data(data_name)
+    return tables
+
+
+def compile_bundle(league: str, tables: dict, directory: Path = SHARD_DIR) -> Path:
+    """내용 해시로 이름을 붙여 한 번만 쓴다"""
+    payload = build_bundle(tables)
+    path = Path(directory) / f'{league}-{hashlib.sha256(payload).hexdigest()[:16]}.bin'
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, payload)
+    return path
+
+
+# worker 프로세스 상태 (initializer 가 한 번 채움)
+_worker_tiers = {}
+
+
+def _init_worker(bundle_path: str, tier_names: list, rule_names: list):
+    tables = open_bundle(bundle_path)
+    if 'fuzzy' in tier_names:
+        _worker_tiers['fuzzy'] = FuzzyTier.from_tables(tables['fuzzy.folded'], tables['fuzzy.abbreviated'],
+                                                       tables['fuzzy.tokens'])
+    if 'rules' in tier_names:
+        _worker_tiers['rules'] = RuleTier(build_rules(rule_names, load=lambda name: tables[f'rule:{name}']))
+
+
+def _lookup_chunk(job) -> dict:
+    tier_name, names = job
+    return _worker_tiers[tier_name].lookup_many(names)
+
+
+class ShardPool:
+    """리그 하나의 CPU tier 를 돌리는 프로세스 풀 (처음 쓸 때 시작)"""
+
+    def __init__(self, league: str, tiers: dict, rule_names, workers: int):
+        self.league = league
+        self.tier_names = sorted(tiers)
+        self.rule_names = list(rule_names)
+        self.workers = workers
+        self.bundle_path = compile_bundle(league, bundle_tables(tiers, self.rule_names))
+        self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(str(self.bundle_path), self.tier_names, self.rule_names),
+            )
+            atexit.register(self.close)
+        return self._executor
+
+    def lookup_many(self, tier_name: str, names: list) -> dict:
+        size = max(1, -(-len(names) // (self.workers * CHUNKS_PER_WORKER)))
+        jobs = [(tier_name, names[start:start + size]) for start in range(0, len(names), size)]
+        found = {}
+        # map 은 제출 순서대로 결과를 돌려준다 → 입력 순서 그대로 병합
+        for chunk in self._pool().map(_lookup_chunk, jobs):
+            found.update(chunk)
+        return found
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class ShardedTier(Tier):
+    """tier 를 감싸 이름이 많을 때만 프로세스 풀로 조회 (적으면 현재 프로세스의 tier)"""
+
+    def __init__(self, inner: Tier, pool: ShardPool, min_names: int = SHARD_MIN_NAMES):
+        self.inner = inner
+        self.pool = pool
+        self.min_names = min_names
+        self.name = inner.name
+        self.persist = inner.persist
+        self.confidence = inner.confidence
+        self.reason = inner.reason
+
+    def lookup(self, name: str):
+        return self.inner.lookup(name)
+
+    def lookup_many(self, names: list) -> dict:
+        if len(names) < self.min_names:
+            return self.inner.lookup_many(names)
+        return self.pool.lookup_many(self.name, names)
+
+
+def default_workers() -> int:
+    return int(os.environ.get('PIPELINE_TRANSLATE_WORKERS') or 1)
+
+
+def shard_tiers(league: str, tiers: list, rule_names, workers: int, min_names: int = SHARD_MIN_NAMES) -> list:
+    """tier 목록에서 SHARDED_TIERS 를 ShardedTier 로 바꾼 목록 (workers <= 1 이면 그대로)"""
+    cpu_tiers = {tier.name: tier for tier in tiers if tier.name in SHARDED_TIERS and tier.available}
+    if workers <= 1 or not cpu_tiers:
+        return tiers
+    pool = ShardPool(league, cpu_tiers, rule_names, workers)
+    return [ShardedTier(tier, pool, min_names) if tier.name in cpu_tiers else tier for tier in tiers]
@@ -0,0 +1,226 @@
+"""
+번역 tier 구현
+
+모든 tier 는 같은 인터페이스를 가진다:
+    lookup(name) -> str | Candidate | None
+    lookup_many(names) -> {name: Candidate}   (찾은 것만)
+lookup 이 문자열을 돌려주면 tier 의 기본 신뢰도/이유(confidence, reason)로 Candidate 를 만든다.
+tier 는 resolver 를 알지 못하므로 서로를 호출할 수 없다 (fallthrough 는 resolver 가 담당).
+"""
+
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from pathlib import Path
+
+from .confidence import Candidate, hangul_coverage
+
+
+class Tier:
+    name = 'tier'
+    # 이 tier 의 결과를 영구 캐시에 저장할지 (비싼 tier 만)
+    persist = False
+    available = True
+    confidence = 1.0
+    reason = 'tier'
+
+    def lookup(self, name: str):
+        raise NotImplementedError
+
+    def candidate(self, result) -> Candidate:
+        return result if isinstance(result, Candidate) else Candidate(result, self.confidence, self.reason)
+
+    def lookup_many(self, names: list) -> dict:
+        found = {}
+        for name in names:
+            result = self.lookup(name)
+            if result is not None:
+                found[name] = self.candidate(result)
+        return found
+
+
+class LexiconTier(Tier):
+    """사람이 검수한 사전 정확 일치"""
+    name = 'lexicon'
+    reason = 'exact'
+
+    def __init__(self, entries: dict):
+        self.entries = entries
+
+    def lookup(self, name: str):
+        korean = self.entries.get(name)
+        if korean is None:
+            korean = self.entries.get(unicodedata.normalize('NFC', name))
+        return korean
+
+
+class CacheTier(Tier):
+    """이전 실행에서 비싼 tier(LLM 등)가 낸 결과를 sqlite 에 보관
+
+    저장된 결과는 더 비싼 tier 로 다시 보내지 않는다 (terminal). 신뢰도가 낮으면 검수 큐로 간다.
+    """
+    name = 'cache'
+    confidence = 0.9
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            ' name TEXT PRIMARY KEY, korean TEXT NOT NULL, source TEXT, updated_at REAL, confidence REAL)'
+        )
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(translations)')}
+        if 'confidence' not in columns:
+            self._conn.execute('ALTER TABLE translations ADD COLUMN confidence REAL')
+        self._conn.commit()
+
+    def _candidate(self, korean, source, confidence) -> Candidate:
+        return Candidate(korean, self.confidence if confidence is None else confidence, f'cache:{source}', terminal=True)
+
+    def lookup(self, name: str):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT korean, source, confidence FROM translations WHERE name = ?', (name,)
+            ).fetchone()
+        return self._candidate(*row) if row else None
+
+    def lookup_many(self, names: list) -> dict:
+        found = {}
+        with self._lock:
+            for start in range(0, len(names), 500):
+                chunk = names[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT name, korean, source, confidence FROM translations WHERE name IN ({placeholders})', chunk
+                ).fetchall()
+                found.update((name, self._candidate(korean, source, confidence)) for name, korean, source, confidence in rows)
+        return found
+
+    def store_many(self, entries: dict, source: str):
+        """entries: {name: 한글 | Candidate}"""
+        now = time.time()
+        rows = []
+        for name, value in entries.items():
+            if isinstance(value, Candidate):
+                rows.append((name, value.korean, source, now, value.confidence))
+            else:
+                rows.append((name, value, source, now, None))
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO translations (name, korean, source, updated_at, confidence) VALUES (?, ?, ?, ?, ?)',
+                rows,
+            )
+            self._conn.commit()
+
+
+def fold(text: str) -> str:
+    """악센트 제거 + 소문자 + 공백 정리 ('João  Cancelo' → 'joao cancelo')"""
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(stripped.casefold().split())
+
+
+def is_initial(token: str) -> bool:
+    return len(token) <= 2 and token.endswith('.')
+
+
+def abbreviate(folded: str):
+    """'geronimo rulli' → 'g. rulli' (이미 이니셜이면 그대로), 한 단어면 None"""
+    tokens = folded.split(' ')
+    if len(tokens) < 2:
+        return None
+    return ' '.join([tokens[0][0] + '.', *tokens[1:]])
+
+
+class FuzzyTier(Tier):
+    """이미 번역된 비슷한 이름 재사용
+
+    1) 악센트/대소문자만 다른 이름       'Joao Cancelo' ← 'João Cancelo'
+    2) 이름 이니셜 ↔ 전체 이름          'G. Rulli' ↔ 'Gerónimo Rulli'
+    3) 토큰 조합: 토큰 수가 같은 사전 항목에서 토큰별 번역이 항상 같았던 경우만 조합
+    결과가 둘 이상으로 갈리면 사용하지 않는다. 뒤로 갈수록 신뢰도가 낮다.
+    """
+    name = 'fuzzy'
+    CONFIDENCE = {'accent-fold': 0.95, 'initial-match': 0.8, 'token-composition': 0.7}
+
+    def __init__(self, entries: dict):
+        folded = defaultdict(set)
+        abbreviated = defaultdict(set)
+        tokens = defaultdict(set)
+        for english, korean in entries.items():
+            key = fold(english)
+            folded[key].add(korean)
+            short = abbreviate(key)
+            if short:
+                abbreviated[short].add(korean)
+
+            english_tokens = key.split(' ')
+            korean_tokens = korean.split(' ')
+            if len(english_tokens) == len(korean_tokens) and not any(is_initial(t) for t in english_tokens):
+                for e, k in zip(english_tokens, korean_tokens):
+                    tokens[e].add(k)
+
+        self.folded = _unambiguous(folded)
+        self.abbreviated = _unambiguous(abbreviated)
+        self.tokens = _unambiguous(tokens)
+
+    @classmethod
+    def from_tables(cls, folded, abbreviated, tokens) -> 'FuzzyTier':
+        """미리 만든 인덱스로 생성 (샤드 worker 가 mmap 테이블을 그대로 쓴다)"""
+        tier = cls.__new__(cls)
+        tier.folded, tier.abbreviated, tier.tokens = folded, abbreviated, tokens
+        return tier
+
+    def lookup(self, name: str):
+        key = fold(name)
+        if key in self.folded:
+            return self._match(self.folded[key], 'accent-fold')
+
+        short = abbreviate(key)
+        if short and short in self.abbreviated:
+            return self._match(self.abbreviated[short], 'initial-match')
+
+        parts = key.split(' ')
+        if len(parts) >= 2 and all(part in self.tokens for part in parts):
+            return self._match(' '.join(self.tokens[part] for part in parts), 'token-composition')
+        return None
+
+    def _match(self, korean: str, reason: str) -> Candidate:
+        return Candidate(korean, self.CONFIDENCE[reason], reason)
+
+
+def _unambiguous(candidates: dict) -> dict:
+    return {key: next(iter(values)) for key, values in candidates.items() if len(values) == 1}
+
+
+class RuleTier(Tier):
+    """모든 규칙을 적용해 보고 한글로 바뀐 토큰이 가장 많은 결과 사용 (같으면 앞 규칙)
+
+    최선의 결과와 커버리지가 같은데 출력이 다른 규칙이 있으면 rule-ambiguity 로 신뢰도를 낮춘다.
+    """
+    name = 'rules'
+    confidence = 0.75
+    ambiguous_confidence = 0.5
+
+    def __init__(self, rules: list):
+        self.rules = rules
+
+    def lookup(self, name: str):
+        outputs = []
+        for rule_name, rule in self.rules:
+            korean = rule(name)
+            if korean is not None:
+                outputs.append((hangul_coverage(korean), rule_name, korean))
+        if not outputs:
+            return None
+
+        best_coverage = max(coverage for coverage, _, _ in outputs)
+        best = [(rule_name, korean) for coverage, rule_name, korean in outputs if coverage == best_coverage]
+        rule_name, korean = best[0]
+        if len({korean for _, korean in best}) > 1:
+            return Candidate(korean, self.ambiguous_confidence, 'rule-ambiguity')
+        return Candidate(korean, self.confidence, f'rule:{rule_name}')
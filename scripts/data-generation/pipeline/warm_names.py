@@ -0,0 +1,117 @@
+"""
+선수 한글명 L1 캐시 콜드 스타트 워밍 스냅샷
+
+src/domains/livescore/actions/player/getKoreanName.ts 의 globalKoreanNames 는 서버 프로세스마다
+빈 상태로 시작해, 배포 직후 라인업/경기 페이지는 모두 캐시 미스 → DB 조회가 된다.
+이 단계는 자주 조회될 선수의 id → 한글명을 작은 JSON 으로 미리 만들어 두고,
+getKoreanName.ts 가 모듈 로드 시 이 파일로 L1 캐시를 채운다.
+
+- 인기 선수: 선수 열 단위 스냅샷(columns.py)에서 popularity_score 상위 N명
+- 현재 라운드 스쿼드: API-Football fixtures?date= 로 어제~며칠 뒤 경기를 받아 사이트 리그
+  (src/shared/constants/leagueIds.ts 의 ALLOWED_LEAGUE_IDS) 경기에 나오는 팀의 선수 전체
+- 한글명이 있는 선수만 넣는다. null 을 커밋된 스냅샷에 넣으면 그 뒤에 번역된 선수도 L1 캐시가
+  null 을 돌려줘 DB 를 보지 않는다 (없는 선수는 기존대로 DB 조회 후 L1 에 캐시)
+- 형식: {"generated_at", "ids": [오름차순 player_id], "names": [같은 순서의 한글명]}
+- getKoreanName.ts 는 generated_at 이 오래된(기본 7일) 스냅샷은 쓰지 않는다
+- 빌드(next build)는 이 파일을 다시 만들지 않는다 → 배포 전에 실행해 커밋 (scripts/README.md '배포 전 필수 단계')
+
+사용법:
+    python -m pipeline warm-names [--top 2000] [--days-ahead 3] [--refresh]
+"""
+
+import datetime
+import json
+from pathlib import Path
+
+from . import config
+from .columns import PLAYER_COLUMNS_PATH, player_columns
+from .fetcher import ApiFootballFetcher, _atomic_write
+from .http_client import HttpPool
+from .report import RunReport
+
+WARM_NAMES_PATH = config.REPO_ROOT / 'src' / 'domains' / 'livescore' / 'constants' / 'koreanNamesWarm.json'
+WARM_COLUMNS = ['player_id', 'korean_name', 'team_id', 'popularity_score']
+
+# src/shared/constants/leagueIds.ts 의 ALLOWED_LEAGUE_IDS (CUP_LEAGUE_IDS + LEAGUE_IDS)
+WARM_LEAGUE_IDS = {
+    1, 2, 3, 848, 531, 45, 48, 17,
+    39, 140, 78, 61, 135, 40, 179, 88, 94, 292, 293, 98, 169, 307, 253, 71, 262, 119,
+}
+DEFAULT_TOP = 2000
+
+
+def popular_player_ids(rows: list, top: int) -> list:
+    """popularity_score 내림차순 상위 top 명 (점수 없는 선수 제외, 동점은 player_id 순)"""
+    scored = [row for row in rows if row.get('popularity_score')]
+    scored.sort(key=lambda row: (-row['popularity_score'], row['player_id']))
+    return [row['player_id'] for row in scored[:top]]
+
+
+def fixture_team_ids(fetcher, days: list, league_ids: set = WARM_LEAGUE_IDS) -> set:
+    """날짜별 경기 목록에서 사이트 리그 경기의 홈/원정 팀 id"""
+    team_ids = set()
+    for day in days:
+        data = fetcher.get('fixtures', {'date': day.isoformat()})
+        for fixture in data.get('response') or []:
+            if (fixture.get('league') or {}).get('id') not in league_ids:
+                continue
+            for side in ('home', 'away'):
+                team_id = ((fixture.get('teams') or {}).get(side) or {}).get('id')
+                if team_id:
+                    team_ids.add(team_id)
+    return team_ids
+
+
+def round_days(days_behind: int, days_ahead: int, today: datetime.date = None) -> list:
+    today = today or datetime.date.today()
+    return [today + datetime.timedelta(days=offset) for offset in range(-days_behind, days_ahead + 1)]
+
+
+def warm_snapshot(rows: list, player_ids) -> dict:
+    names = {row['player_id']: row['korean_name'] for row in rows if row.get('korean_name')}
+    ids = sorted(set(player_ids) & set(names))
+    return {
+        'generated_at': datetime.datetime.now(datetime.timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'ids': ids,
+        'names': [names[player_id] for player_id in ids],
+    }
+
+
+def register(subparsers):
+    parser = subparsers.add_parser('warm-names', help='선수 한글명 L1 캐시 콜드 스타트용 워밍 스냅샷 생성')
+    parser.add_argument('--snapshot', type=Path, default=PLAYER_COLUMNS_PATH, help='선수 열 단위 스냅샷')
+    parser.add_argument('--refresh', action='store_true', help='스냅샷을 DB 에서 다시 받음')
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP, help='popularity_score 상위 선수 수')
+    parser.add_argument('--days-behind', type=int, default=1, help='오늘 이전 며칠의 경기 스쿼드 포함')
+    parser.add_argument('--days-ahead', type=int, default=3, help='오늘 이후 며칠의 경기 스쿼드 포함')
+    parser.add_argument('--no-fixtures', action='store_true', help='API 를 호출하지 않고 인기 선수만')
+    parser.add_argument('--base-url', default=None, help='API 주소 (로컬 stand-in 서버 테스트용)')
+    parser.add_argument('--out', type=Path, default=WARM_NAMES_PATH)
+    parser.set_defaults(handler=run)
+
+
+def run(args):
+    report = RunReport('warm-names')
+    snapshot = player_columns(WARM_COLUMNS, args.snapshot, args.refresh)
+    rows = list(snapshot.rows(WARM_COLUMNS))
+
+    player_ids = set(popular_player_ids(rows, args.top))
+    popular = len(player_ids)
+    team_ids = set()
+    if not args.no_fixtures:
+        with HttpPool() as pool:
+            fetcher = ApiFootballFetcher(base_url=args.base_url, pool=pool)
+            team_ids = fixture_team_ids(fetcher, round_days(args.days_behind, args.days_ahead))
+        player_ids.update(row['player_id'] for row in rows if row['team_id'] in team_ids)
+
+    data = warm_snapshot(rows, player_ids)
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(args.out, payload)
+
+    unnamed = len(player_ids) - len(data['ids'])
+    report.section('warm_names').update({'players': len(data['ids']), 'popular': popular, 'round_teams': len(team_ids),
+                                         'without_korean_name': unnamed, 'bytes': len(payload)})
+    print(f"✓ {len(data['ids'])} players with a Korean name ({popular} popular + squads of {len(team_ids)} teams, "
+          f"{unnamed} without one left out) → {args.out} ({len(payload) / 1024:.1f} KiB)")
+    print(f"✓ Report: {report.write()}")
@@ -8,6 +8,10 @@ import re
 import sys
 import os
 
+from pipeline.backup import backup_files
+from pipeline.dry_run import preview_or_write
+from pipeline.translate import get_resolver
+
 # 완전한 한글 번역 매핑
 PLAYER_TRANSLATIONS = {
     # Ajax players
@@ -64,68 +68,84 @@ PLAYER_TRANSLATIONS = {
     # Continue with more players...이 부분은 자동 생성
 }
 
-# 자동 번역 규칙 (간단한 규칙 기반)
-def auto_translate_name(name: str) -> str:
-    """자동 번역 규칙 적용"""
+# 한국/일본 선수 (기존 auto_translate_name 의 개별 규칙을 사전으로 정리)
+KNOWN_PLAYERS = {
     # 한국 선수명 (영문 -> 한글)
-    korean_players = {
-        "Hwang In-Beom": "황인범",
-        "Do-Yong Yoon": "윤도영",
-    }
+    "Hwang In-Beom": "황인범",
+    "Do-Yong Yoon": "윤도영",
+    # 일본 선수 (Last First 패턴)
+    "Ko Itakura": "이타쿠라 코",
+    "Gaku Nawata": "나와타 가쿠",
+    "Koki Ogawa": "오가와 코키",
+    "K. Shiogai": "시오가이 코타",
+    "K. Sano": "사노 코다이",
+    "S. Maikuma": "마이쿠마 세이야",
+    "A. Ueda": "우에다 아야세",
+    "Ayase Ueda": "우에다 아야세",
+    "S. Mito": "미토 슌스케",
+    "Shunsuke Mito": "미토 슌스케",
+    "Tsuyoshi Watanabe": "와타나베 츠요시",
+}
 
-    if name in korean_players:
-        return korean_players[name]
 
-    # 일본 선수 (Last First 패턴)
-    if "Ko Itakura" in name:
-        return "이타쿠라 코"
-    if "Gaku Nawata" in name:
-        return "나와타 가쿠"
-    if "Koki Ogawa" in name:
-        return "오가와 코키"
-    if "K. Shiogai" in name:
-        return "시오가이 코타"
-    if "K. Sano" in name:
-        return "사노 코다이"
-    if "S. Maikuma" in name:
-        return "마이쿠마 세이야"
-    if "A. Ueda" in name or "Ayase Ueda" in name:
-        return "우에다 아야세"
-    if "S. Mito" in name or "Shunsuke Mito" in name:
-        return "미토 슌스케"
-    if "Tsuyoshi Watanabe" in name:
-        return "와타나베 츠요시"
-
-    # 기본 변환 (간단한 이니셜 기반)
-    return translate_player_name(name)
+def auto_translate_name(name: str) -> str:
+    """사전에 없는 이름 자동 번역 (캐시 → 유사 이름 재사용 → LLM, 못 찾으면 원본)"""
+    return get_resolver('eredivisie').translate(name, skip=('lexicon',))
 
 
 def translate_player_name(name: str) -> str:
-    """선수 이름 한글 번역"""
-    if name in PLAYER_TRANSLATIONS:
-        return PLAYER_TRANSLATIONS[name]
+    """선수 이름 한글 번역 (eredivisie 프로필: 사전 → 캐시 → 유사 이름 재사용 → LLM)
 
-    # 자동 번역 시도
-    return auto_translate_name(name)
+    이전에는 translate_player_name 과 auto_translate_name 이 서로를 호출해
+    사전에 없는 이름에서 무한 재귀가 발생했다. 이제 둘 다 resolver 한 곳으로 내려간다.
+    """
+    return get_resolver('eredivisie').translate(name)
 
 
-def process_eredivisie_file():
-    """eredivisie.ts 파일 처리"""
+def process_eredivisie_file(dry_run=False):
+    """eredivisie.ts 파일 처리 (dry_run: 백업/저장 없이 선수 단위 diff 요약만 출력)"""
     file_path = r"c:\Users\user\Desktop\web2\123\1234\src\domains\livescore\constants\players\eredivisie.ts"
 
     # 파일 읽기
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # 백업 생성
-    backup_path = file_path + ".backup"
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    print(f"✓ Backup created: {backup_path}")
+    if dry_run:
+        modified_content = '\n'.join(translate_null_names(content.split('\n'), dry_run=True)[0])
+        diff = preview_or_write(file_path, modified_content, dry_run=True)
+        return len(diff.korean_changed)
+
+    # 백업 (원본 옆 .backup 대신 .pipeline-cache/backups, 복원: python -m pipeline restore --run <id>)
+    backup_files([file_path], 'translate_eredivisie_full')
 
     # 수정할 부분만 찾아서 변경
-    # 패턴: korean_name: null
-    lines = content.split('\n')
+    modified_lines, changes_count = translate_null_names(content.split('\n'), verbose=True)
+
+    # 파일 저장
+    modified_content = '\n'.join(modified_lines)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(modified_content)
+
+    print(f"\n✓ Total {changes_count} player names translated")
+    print(f"✓ File updated: {file_path}")
+
+    return changes_count
+
+
+def translate_null_names(lines, verbose=False, dry_run=False):
+    """korean_name: null 인 줄만 번역해서 채움. (수정된 줄 목록, 변경 수) 반환
+
+    먼저 null 인 이름을 모두 모아 resolve_many 한 번으로 번역한다 (LLM tier 요청을 이름마다 보내지 않음).
+    dry_run 이면 LLM 호출/검수 큐 기록 없이 번역한다.
+    """
+    null_names = []
+    for line in lines:
+        if 'korean_name: null' in line:
+            name_match = re.search(r'name:\s*"([^"]+)"', line)
+            if name_match:
+                null_names.append(name_match.group(1))
+    translations = get_resolver('eredivisie', dry_run).translate_many(null_names)
+
     modified_lines = []
     changes_count = 0
 
@@ -135,34 +155,26 @@ def process_eredivisie_file():
             name_match = re.search(r'name:\s*"([^"]+)"', line)
             if name_match:
                 original_name = name_match.group(1)
-                korean_name = translate_player_name(original_name)
+                korean_name = translations[original_name]
 
                 # null을 한글 이름으로 변경
                 modified_line = line.replace('korean_name: null', f'korean_name: "{korean_name}"')
                 modified_lines.append(modified_line)
                 changes_count += 1
 
-                if changes_count <= 10:  # 처음 10개만 출력
+                if verbose and changes_count <= 10:  # 처음 10개만 출력
                     print(f"  {original_name} -> {korean_name}")
             else:
                 modified_lines.append(line)
         else:
             modified_lines.append(line)
 
-    # 파일 저장
-    modified_content = '\n'.join(modified_lines)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(modified_content)
-
-    print(f"\n✓ Total {changes_count} player names translated")
-    print(f"✓ File updated: {file_path}")
-
-    return changes_count
+    return modified_lines, changes_count
 
 
 if __name__ == "__main__":
     try:
-        count = process_eredivisie_file()
+        count = process_eredivisie_file(dry_run='--dry-run' in sys.argv)
         print(f"\n=== Translation Complete ===")
         print(f"Total translations: {count}")
     except Exception as e:
@@ -7,6 +7,10 @@
 import re
 import sys
 
+from pipeline.backup import backup_files
+from pipeline.dry_run import preview_or_write
+from pipeline.translate import get_resolver
+
 # 한글 번역 매핑 (축구 선수 이름 표준 발음)
 PLAYER_TRANSLATIONS = {
     # Ajax (Team ID: 194)
@@ -494,17 +498,25 @@ PLAYER_TRANSLATIONS = {
 
 
 def translate_player_name(name: str) -> str:
-    """선수 이름을 한글로 번역"""
-    # 직접 매핑이 있는 경우
-    if name in PLAYER_TRANSLATIONS:
-        return PLAYER_TRANSLATIONS[name]
+    """선수 이름을 한글로 번역 (eredivisie 프로필: 사전 → 캐시 → 유사 이름 재사용 → LLM)"""
+    return translate_player_names([name])[name]
+
 
-    # 매핑이 없는 경우 알림
-    print(f"Warning: No translation found for '{name}'")
-    return name  # 원래 이름 반환
+def translate_player_names(names, dry_run=False) -> dict:
+    """{이름: 한글} — resolve_many 한 번으로 번역 (LLM tier 까지 가는 이름도 이름마다 요청하지 않음)
+    dry_run 이면 LLM 호출/검수 큐 기록 없이"""
+    translations = {}
+    for name, resolution in get_resolver('eredivisie', dry_run).resolve_many(names).items():
+        if resolution is not None:
+            translations[name] = resolution.korean
+        else:
+            # 매핑이 없는 경우 알림
+            print(f"Warning: No translation found for '{name}'")
+            translations[name] = name  # 원래 이름 반환
+    return translations
 
 
-def process_file(input_path: str) -> str:
+def process_file(input_path: str, dry_run: bool = False) -> str:
     """파일을 읽고 모든 korean_name을 번역"""
     with open(input_path, 'r', encoding='utf-8') as f:
         content = f.read()
@@ -513,6 +525,9 @@ def process_file(input_path: str) -> str:
     # 패턴: { id: ..., name: "...", korean_name: null, ... }
     pattern = r'\{\s*id:\s*(\d+),\s*name:\s*"([^"]+)",\s*korean_name:\s*(null|"[^"]*"),\s*team_id:\s*(\d+),\s*position:\s*([^,]+),\s*number:\s*([^,]+),\s*age:\s*([^}]+)\}'
 
+    # 파일의 이름을 먼저 모두 모아 한 번에 번역
+    translations = translate_player_names([match.group(2) for match in re.finditer(pattern, content)], dry_run)
+
     def replace_korean_name(match):
         id_num = match.group(1)
         name = match.group(2)
@@ -523,7 +538,7 @@ def process_file(input_path: str) -> str:
         age = match.group(7)
 
         # 한글 이름 번역
-        korean_name = translate_player_name(name)
+        korean_name = translations[name]
 
         # null이 아닌 경우도 업데이트
         if current_korean == "null" or True:  # 모든 경우 업데이트
@@ -539,17 +554,20 @@ def process_file(input_path: str) -> str:
 
 def main():
     input_file = r"c:\Users\user\Desktop\web2\123\1234\src\domains\livescore\constants\players\eredivisie.ts"
+    dry_run = '--dry-run' in sys.argv
 
     print(f"Processing {input_file}...")
 
     try:
-        modified_content = process_file(input_file)
+        modified_content = process_file(input_file, dry_run)
+
+        if dry_run:
+            # 백업/저장 없이 현재 파일과 선수 단위 diff 요약만 출력
+            preview_or_write(input_file, modified_content, dry_run=True)
+            return
 
-        # 백업 생성
-        import shutil
-        backup_file = input_file + '.backup'
-        shutil.copy2(input_file, backup_file)
-        print(f"Backup created: {backup_file}")
+        # 백업 (원본 옆 .backup 대신 .pipeline-cache/backups, 복원: python -m pipeline restore --run <id>)
+        backup_files([input_file], 'translate_eredivisie_players')
 
         # 수정된 내용 저장
         with open(input_file, 'w', encoding='utf-8') as f:
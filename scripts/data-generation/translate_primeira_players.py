@@ -1,8 +1,14 @@
-import anthropic
-import os
 import json
+import sys
 
-client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+from pipeline.report import RunReport
+from pipeline.translate import build_resolver
+
+# 캐시 → LLM. 번역 규칙/예시는 캐시 가능한 공통 prefix 로, 요청마다 이름 목록만 보냄 (pipeline/translate/llm.py)
+resolver = build_resolver('primeira-liga', ['cache', 'llm'])
+if 'llm' not in resolver.tier_names:
+    print("ANTHROPIC_API_KEY 와 anthropic 패키지가 필요합니다")
+    sys.exit(1)
 
 # 전체 선수 데이터 (Supabase에서 조회한 데이터)
 players_data = {
@@ -163,44 +169,8 @@ for team_name in teams_batch_1:
     # 선수 이름 리스트 생성
     player_names = [f"{p['name']}" for p in players]
 
-    prompt = f"""다음은 {team_name} 소속 선수들의 이름입니다. 각 선수 이름을 포르투갈어 발음 기준으로 한국어로 번역해주세요.
-
-**번역 규칙:**
-1. 포르투갈 이름 → 포르투갈어 발음 (예: "João" → "조앙", "Gonçalo" → "곤살루", "ç" → "ㅅ" 발음)
-2. 브라질 선수 → 포르투갈어 발음 (예: "Pepê" → "페페")
-3. 스페인 이름 → 스페인어 발음 (예: "Ángel" → "앙헬")
-4. 기타 외국인 → 해당 언어 발음
-
-**선수 목록:**
-{chr(10).join([f"{i+1}. {name}" for i, name in enumerate(player_names)])}
-
-**응답 형식 (JSON):**
-{{
-  "선수이름1": "한국어번역1",
-  "선수이름2": "한국어번역2",
-  ...
-}}
-
-중요: 반드시 JSON 형식으로만 응답하고, 다른 설명은 포함하지 마세요."""
-
-    message = client.messages.create(
-        model="claude-3-5-sonnet-20241022",
-        max_tokens=4000,
-        messages=[{"role": "user", "content": prompt}]
-    )
-
-    response_text = message.content[0].text.strip()
-
-    # JSON 파싱
-    if response_text.startswith("```json"):
-        response_text = response_text[7:]
-    if response_text.startswith("```"):
-        response_text = response_text[3:]
-    if response_text.endswith("```"):
-        response_text = response_text[:-3]
-    response_text = response_text.strip()
-
-    translations = json.loads(response_text)
+    resolved = resolver.resolve_many(player_names)
+    translations = {name: resolution.korean for name, resolution in resolved.items() if resolution is not None}
     all_translations[team_name] = translations
     print(f"✓ {team_name} 완료 ({len(translations)}명)")
 
@@ -209,3 +179,7 @@ with open("c:\\Users\\user\\Desktop\\web2\\primeira_translations_batch1.json", "
     json.dump(all_translations, f, ensure_ascii=False, indent=2)
 
 print(f"\n배치 1 번역 완료! 파일 저장됨: primeira_translations_batch1.json")
+
+report = RunReport('translate-primeira')
+resolver.record(report)
+print(f"✓ Report: {report.write()}")
@@ -1,9 +1,14 @@
+import { getPublishedPlayerSitemapIndex } from '@/shared/seo/sitemap';
 import { buildSitemapSectionXml } from '@/shared/seo/sitemapIndex';
 import { sitemapXmlResponse } from '@/shared/seo/sitemapXml';
 
 export const revalidate = 3600;
 
 export async function GET() {
+  // 파이프라인이 게시한 50k shard index 가 있으면 그대로, 없으면 DB 첫 페이지
+  const published = await getPublishedPlayerSitemapIndex();
+  if (published) return sitemapXmlResponse(published);
+
   const xml = await buildSitemapSectionXml('livescore-players');
   return sitemapXmlResponse(xml || '');
 }
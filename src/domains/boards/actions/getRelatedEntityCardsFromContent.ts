@@ -4,6 +4,7 @@ import { cache } from 'react';
 import { getSupabaseServer } from '@/shared/lib/supabase/server';
 import type { TeamCardData } from '@/shared/types/teamCard';
 import type { PlayerCardData } from '@/shared/types/playerCard';
+import { playerPhotoUrl } from '@/domains/livescore/utils/playerPhoto';
 import {
   extractInternalEntityLinksFromContent,
   type InternalEntityLink,
@@ -43,6 +44,9 @@ function uniqueLinks(links: InternalEntityLink[]) {
   return unique;
 }
 
+// PlayerCard 사진은 64px → 레티나 2배
+const PLAYER_CARD_PHOTO_SIZE = 128;
+
 const CUP_LEAGUE_IDS = new Set([
   1,   // FIFA World Cup
   2,   // UEFA Champions League
@@ -103,7 +107,7 @@ export const getRelatedEntityCardsFromContent = cache(async (content: unknown):
     playerIds.length > 0
       ? supabase
           .from('football_players')
-          .select('player_id,name,korean_name,display_name,slug,photo_url,photo_cached_url,team_id,team_name,position,number,age')
+          .select('player_id,name,korean_name,display_name,slug,photo_url,photo_cached_url,photo_variants,team_id,team_name,position,number,age')
           .in('player_id', playerIds)
       : Promise.resolve({ data: [], error: null }),
   ]);
@@ -168,7 +172,7 @@ export const getRelatedEntityCardsFromContent = cache(async (content: unknown):
           name: player.name,
           slug: player.slug,
           koreanName: player.korean_name || player.display_name || undefined,
-          photo: player.photo_cached_url || player.photo_url || '',
+          photo: playerPhotoUrl(player, PLAYER_CARD_PHOTO_SIZE),
           team: {
             id: player.team_id,
             name: team?.name || player.team_name || '',
@@ -1,6 +1,7 @@
 'use server';
 
 import { getSupabaseAdmin, getSupabaseServer } from '@/shared/lib/supabase/server';
+import koreanNamesWarm from '@/domains/livescore/constants/koreanNamesWarm.json';
 
 /**
  * 선수 한글명 캐시 시스템 (4590 최적화)
@@ -14,10 +15,42 @@ import { getSupabaseAdmin, getSupabaseServer } from '@/shared/lib/supabase/serve
  *    - 캐시가 유실되더라도(콜드 스타트/재시작) 테이블 전체(9,300여명)를 긁지 않고,
  *      현재 요청에 필요한 선수(예: 22명 라인업)의 한글명만 DB에서 콕 집어 가져옵니다.
  *    - DB 트래픽(Egress)과 호출 비용이 99% 감소합니다.
+ *
+ * 3. 콜드 스타트 워밍 (koreanNamesWarm.json):
+ *    - 인기 선수 상위 N명 + 현재 라운드 스쿼드의 한글명 스냅샷으로 모듈 로드 시 L1 캐시를 채웁니다.
+ *    - 배포/재시작 직후 라인업·경기 페이지도 첫 요청부터 캐시 적중합니다.
+ *    - 스냅샷 생성: scripts/data-generation 에서 `python -m pipeline warm-names` (배포 전 필수, scripts/README.md)
+ *      빌드가 다시 만들지 않으므로 7일이 지나면 워밍 없이 DB 조회로 동작합니다.
  */
 
+// 이보다 오래된 워밍 스냅샷은 쓰지 않음 (그 사이 바뀐 한글명을 L1 이 가리지 않도록)
+const WARM_SNAPSHOT_MAX_AGE_MS = 7 * 24 * 60 * 60 * 1000;
+
+/**
+ * 워밍 스냅샷 → L1 캐시 초기값
+ * - ids / names 는 같은 순서의 병렬 배열
+ * - 한글명이 있는 선수만 채움 (null 은 DB 조회 후에만 캐싱)
+ * - generated_at 이 없거나 WARM_SNAPSHOT_MAX_AGE_MS 보다 오래되면 빈 캐시로 시작
+ */
+function seedKoreanNames(snapshot: {
+  generated_at: string | null;
+  ids: number[];
+  names: (string | null)[];
+}): Record<number, string | null> {
+  const cache: Record<number, string | null> = {};
+  const generatedAt = snapshot.generated_at ? Date.parse(snapshot.generated_at) : NaN;
+  if (isNaN(generatedAt) || Date.now() - generatedAt > WARM_SNAPSHOT_MAX_AGE_MS) return cache;
+
+  const { ids, names } = snapshot;
+  for (let i = 0; i < ids.length; i++) {
+    const name = names[i];
+    if (name) cache[ids[i]] = name;
+  }
+  return cache;
+}
+
 // L1 메모리 캐시 (korean_name이 없는 경우 null을 매핑하여 중복 DB 쿼리 방지)
-const globalKoreanNames: Record<number, string | null> = {};
+const globalKoreanNames: Record<number, string | null> = seedKoreanNames(koreanNamesWarm);
 
 /**
  * 단일 선수 한글명 조회
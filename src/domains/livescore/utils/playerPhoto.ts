@@ -0,0 +1,35 @@
+// football_players.photo_variants: { "48.webp": url, "96.webp": url, "192.avif": url, ... }
+// scripts/data-generation 의 `python -m pipeline transcode` 가 채우는 정사각형 썸네일 주소
+
+type PlayerPhotoSource = {
+  photo_variants?: unknown;
+  photo_cached_url?: string | null;
+  photo_url?: string | null;
+};
+
+const VARIANT_KEY = /^(\d+)\.webp$/;
+
+function variantEntries(variants: unknown): Array<[number, string]> {
+  if (!variants || typeof variants !== 'object' || Array.isArray(variants)) return [];
+
+  const entries: Array<[number, string]> = [];
+  for (const [key, url] of Object.entries(variants as Record<string, unknown>)) {
+    const match = VARIANT_KEY.exec(key);
+    if (match && typeof url === 'string' && url) {
+      entries.push([Number(match[1]), url]);
+    }
+  }
+  return entries.sort((a, b) => a[0] - b[0]);
+}
+
+/**
+ * 표시 크기(px, 레티나 배율 포함)를 덮는 가장 작은 WebP 썸네일.
+ * 썸네일이 없거나 모두 작으면 가장 큰 썸네일 → photo_cached_url → photo_url 순으로 쓴다.
+ */
+export function playerPhotoUrl(player: PlayerPhotoSource, size: number): string {
+  const entries = variantEntries(player.photo_variants);
+  const fitting = entries.find(([width]) => width >= size);
+  if (fitting) return fitting[1];
+
+  return player.photo_cached_url || player.photo_url || entries[entries.length - 1]?.[1] || '';
+}
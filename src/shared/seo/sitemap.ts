@@ -18,6 +18,8 @@ const SITEMAP_QUERY_MAX_ATTEMPTS = 3;
 const SITEMAP_QUERY_RETRY_DELAYS_MS = [250, 1000];
 const FIXTURE_TEAM_QUERY_CHUNK_SIZE = 500;
 const sitemapQueryFailures = new Set<string>();
+// football_players.seo_worthless (docs/player-seo-quality.sql) 적용 여부. 컬럼이 없는 DB 면 첫 실패 후 false
+let seoWorthlessColumnAvailable = true;
 
 type SitemapEntry = MetadataRoute.Sitemap[number];
 
@@ -150,6 +152,30 @@ async function runSitemapQuery<T extends SupabaseQueryResult>(
   return result;
 }
 
+function isMissingSeoWorthlessColumn(error: unknown): boolean {
+  const text = errorText(error);
+  return text.includes('seo_worthless') && (text.includes('42703') || text.toLowerCase().includes('does not exist'));
+}
+
+/**
+ * 선수 사이트맵 쿼리: seo_worthless 필터를 걸어 조회하고, 컬럼이 아직 없으면 필터 없이 다시 조회
+ * (그 경우에도 isWorthlessSitemapPlayer 로 JS 에서 거르므로 결과는 같다)
+ */
+async function runPlayerSitemapQuery<T extends SupabaseQueryResult>(
+  label: string,
+  query: (excludeWorthless: boolean) => PromiseLike<T>
+): Promise<T> {
+  if (seoWorthlessColumnAvailable) {
+    const result = await runSitemapQuery(label, () => query(true));
+    if (!isMissingSeoWorthlessColumn(result.error)) return result;
+
+    seoWorthlessColumnAvailable = false;
+    sitemapQueryFailures.delete(label);
+    console.warn('[sitemap] football_players.seo_worthless is missing; run docs/player-seo-quality.sql. Querying without it.');
+  }
+  return runSitemapQuery(label, () => query(false));
+}
+
 export function siteUrl(path: string): string {
   const normalizedPath = path.startsWith('/') ? path : `/${path}`;
   return `${siteConfig.url}${normalizedPath}`;
@@ -535,13 +561,37 @@ export async function getTransferTeamSitemap(): Promise<MetadataRoute.Sitemap> {
   })));
 }
 
+// scripts/data-generation 의 `python -m pipeline sitemap --store ...` 가 올린 선수 사이트맵 index (shard 는 같은 저장소)
+const PLAYER_SITEMAP_INDEX_URL = process.env.PLAYER_SITEMAP_INDEX_URL;
+
+export async function getPublishedPlayerSitemapIndex(): Promise<string | null> {
+  if (!PLAYER_SITEMAP_INDEX_URL) return null;
+
+  try {
+    const response = await fetch(PLAYER_SITEMAP_INDEX_URL, { next: { revalidate: 3600 } });
+    if (!response.ok) {
+      console.error(`[sitemap] published player sitemap index returned ${response.status}; falling back to the DB`);
+      return null;
+    }
+
+    const xml = await response.text();
+    return xml.includes('<sitemapindex') ? xml : null;
+  } catch (error) {
+    console.error('[sitemap] published player sitemap index fetch failed; falling back to the DB:', error);
+    return null;
+  }
+}
+
 export async function getPlayerSitemapCount(): Promise<number> {
   const supabase = getSupabaseAdmin();
-  const { count, error } = await runSitemapQuery('football_players count query', () => supabase
-    .from('football_players')
-    .select('player_id', { count: 'exact', head: true })
-    .eq('is_active', true)
-    .not('name', 'is', null));
+  const { count, error } = await runPlayerSitemapQuery('football_players count query', (excludeWorthless) => {
+    const query = supabase
+      .from('football_players')
+      .select('player_id', { count: 'exact', head: true })
+      .eq('is_active', true)
+      .not('name', 'is', null);
+    return excludeWorthless ? query.not('seo_worthless', 'is', true) : query;
+  });
 
   if (error) {
     console.error('[sitemap] football_players count query failed:', error);
@@ -554,13 +604,16 @@ export async function getPlayerSitemapCount(): Promise<number> {
 export async function getPlayerSitemap(id: string | number): Promise<MetadataRoute.Sitemap> {
   const { from, to } = pageRange(id);
   const supabase = getSupabaseAdmin();
-  const { data, error } = await runSitemapQuery('football_players page query', () => supabase
-    .from('football_players')
-    .select('player_id, slug, updated_at, name, display_name, korean_name, team_id, team_name, position, number, age, photo_url')
-    .eq('is_active', true)
-    .not('name', 'is', null)
-    .order('player_id', { ascending: true })
-    .range(from, to));
+  const { data, error } = await runPlayerSitemapQuery('football_players page query', (excludeWorthless) => {
+    const query = supabase
+      .from('football_players')
+      .select('player_id, slug, updated_at, name, display_name, korean_name, team_id, team_name, position, number, age, photo_url')
+      .eq('is_active', true)
+      .not('name', 'is', null);
+    return (excludeWorthless ? query.not('seo_worthless', 'is', true) : query)
+      .order('player_id', { ascending: true })
+      .range(from, to);
+  });
 
   if (error) {
     console.error('[sitemap] football_players page query failed:', error);
@@ -591,13 +644,16 @@ export async function getCorePlayerSitemap(): Promise<MetadataRoute.Sitemap> {
   const entries: ExtendedSitemapEntry[] = [];
 
   for (const teamIdChunk of chunks([...teamIds], 500)) {
-    const { data, error } = await runSitemapQuery('football_players core query', () => supabase
-      .from('football_players')
-      .select('player_id, slug, updated_at, name, display_name, korean_name, team_id, team_name, position, number, age, photo_url')
-      .eq('is_active', true)
-      .not('name', 'is', null)
-      .in('team_id', teamIdChunk)
-      .order('player_id', { ascending: true }));
+    const { data, error } = await runPlayerSitemapQuery('football_players core query', (excludeWorthless) => {
+      const query = supabase
+        .from('football_players')
+        .select('player_id, slug, updated_at, name, display_name, korean_name, team_id, team_name, position, number, age, photo_url')
+        .eq('is_active', true)
+        .not('name', 'is', null);
+      return (excludeWorthless ? query.not('seo_worthless', 'is', true) : query)
+        .in('team_id', teamIdChunk)
+        .order('player_id', { ascending: true });
+    });
 
     if (error) {
       console.error('[sitemap] football_players core query failed:', error);
@@ -666,13 +722,16 @@ export async function getPlayerSitemapByLeagueSlug(leagueSlug: string): Promise<
   if (!teamIds.size) return [];
 
   const supabase = getSupabaseAdmin();
-  const { data, error } = await runSitemapQuery(`football_players ${leagueSlug} query`, () => supabase
-    .from('football_players')
-    .select('player_id, slug, updated_at, name, display_name, korean_name, team_id, team_name, position, number, age, photo_url')
-    .eq('is_active', true)
-    .not('name', 'is', null)
-    .in('team_id', [...teamIds])
-    .order('player_id', { ascending: true }));
+  const { data, error } = await runPlayerSitemapQuery(`football_players ${leagueSlug} query`, (excludeWorthless) => {
+    const query = supabase
+      .from('football_players')
+      .select('player_id, slug, updated_at, name, display_name, korean_name, team_id, team_name, position, number, age, photo_url')
+      .eq('is_active', true)
+      .not('name', 'is', null);
+    return (excludeWorthless ? query.not('seo_worthless', 'is', true) : query)
+      .in('team_id', [...teamIds])
+      .order('player_id', { ascending: true });
+  });
 
   if (error) {
     console.error(`[sitemap] football_players ${leagueSlug} query failed:`, error);
@@ -654,11 +654,13 @@ export type Database = {
           number: number | null
           photo_cached_url: string | null
           photo_url: string | null
+          photo_variants: Json | null
           player_id: number
           popularity_score: number | null
           position: string | null
           search_keywords: string[] | null
           search_vector: unknown
+          seo_worthless: boolean | null
           slug: string | null
           team_id: number
           team_name: string | null
@@ -681,11 +683,13 @@ export type Database = {
           number?: number | null
           photo_cached_url?: string | null
           photo_url?: string | null
+          photo_variants?: Json | null
           player_id: number
           popularity_score?: number | null
           position?: string | null
           search_keywords?: string[] | null
           search_vector?: unknown
+          seo_worthless?: boolean | null
           slug?: string | null
           team_id: number
           team_name?: string | null
@@ -708,11 +712,13 @@ export type Database = {
           number?: number | null
           photo_cached_url?: string | null
           photo_url?: string | null
+          photo_variants?: Json | null
           player_id?: number
           popularity_score?: number | null
           position?: string | null
           search_keywords?: string[] | null
           search_vector?: unknown
+          seo_worthless?: boolean | null
           slug?: string | null
           team_id?: number
           team_name?: string | null
@@ -0,0 +1,128 @@
+// 선수/팀 별칭 Aho-Corasick 오토마톤 로더
+// scripts/data-generation 의 `python -m pipeline aliases --store ...` 가 올린 aliases.json.gz (FORMAT_VERSION 1) 를 읽어
+// 본문을 한 번만 훑어 findMatches 와 같은 일치를 찾는다 (pipeline/aliases.py AliasAutomaton 과 같은 규칙).
+
+const FORMAT_VERSION = 1;
+const MAX_ARTIFACT_AGE_DAYS = 7;
+const HANGUL_TOPIC_PARTICLES = new Set(["은", "는", "이", "가", "을", "를", "와", "과", "도", "에", "의", "로"]);
+
+export type AliasRecord = { type: "team" | "player"; id: number; team_id: number; alias: string; href: string };
+export type AliasMatch = { start: number; end: number; alias: AliasRecord };
+
+function isAsciiText(value: string) { return /^[\x00-\x7F]+$/.test(value); }
+function foldChar(ch: string) {
+  // aliases.py fold_char: 소문자 + 악센트 제거, 결과가 한 글자가 아니면 소문자만 (본문 오프셋 유지)
+  const lower = ch.toLowerCase();
+  if ([...lower].length !== 1) return ch;
+  if (isAsciiText(lower)) return lower;
+  const stripped = lower.normalize("NFKD").replace(/\p{Mn}/gu, "");
+  return [...stripped].length === 1 ? stripped : lower;
+}
+function hasBoundary(text: string, alias: string, start: number, end: number) {
+  const before = text[start - 1] || "";
+  const after = text[end] || "";
+  if (isAsciiText(alias)) return !/[A-Za-z0-9]/.test(before + after);
+  if (/[가-힣]/.test(before)) return false;
+  if (/[가-힣]/.test(after) && !HANGUL_TOPIC_PARTICLES.has(after)) return false;
+  return true;
+}
+
+export class AliasAutomaton {
+  constructor(
+    readonly records: AliasRecord[],
+    readonly patterns: string[],
+    readonly patternRecords: number[][],
+    readonly goto: Map<string, number>[],
+    readonly fail: number[],
+    readonly terminal: number[],
+    readonly outputLink: number[],
+  ) {}
+
+  static fromJson(data: any): AliasAutomaton {
+    if (data?.format !== FORMAT_VERSION) throw new Error(`Unsupported alias artifact format: ${data?.format}`);
+    const columns = data.records;
+    const records: AliasRecord[] = columns.type.map((type: "team" | "player", i: number) => ({
+      type, id: Number(columns.id[i]), team_id: Number(columns.team_id[i]), alias: columns.alias[i], href: columns.href[i],
+    }));
+    const states = data.states;
+    const chars = [...states.edge_chars as string]; // 코드 포인트 단위 (Python 문자열 인덱스와 같게)
+    const goto: Map<string, number>[] = [];
+    for (let i = 0; i < states.edge_start.length - 1; i++) {
+      const transitions = new Map<string, number>();
+      for (let edge = states.edge_start[i]; edge < states.edge_start[i + 1]; edge++) transitions.set(chars[edge], states.edge_targets[edge]);
+      goto.push(transitions);
+    }
+    return new AliasAutomaton(records, data.patterns, data.pattern_records, goto, states.fail, states.terminal, states.output_link);
+  }
+
+  *occurrences(text: string): Generator<[number, number, number]> {
+    // [start, end, pattern] — end/start 는 UTF-16 오프셋 (text.slice 와 같은 단위)
+    let state = 0;
+    let offset = 0;
+    for (const raw of text) {
+      offset += raw.length;
+      const ch = foldChar(raw);
+      while (state && !this.goto[state].has(ch)) state = this.fail[state];
+      state = this.goto[state].get(ch) ?? 0;
+      let hit = this.terminal[state] >= 0 ? state : this.outputLink[state];
+      while (hit >= 0) {
+        const pattern = this.terminal[hit];
+        yield [offset - this.patterns[pattern].length, offset, pattern];
+        hit = this.outputLink[hit];
+      }
+    }
+  }
+
+  // findMatches 와 같은 선택: 별칭 우선순위(레코드 순서) → 위치 순으로 엔티티당 하나, 겹침 제외
+  // contextTeamIds 가 없으면 선수 제외 (본문 팀을 먼저 찾는 1단계)
+  findMatches(text: string, used: Set<string>, contextTeamIds: Set<number> | null, maxLinks: number, types: string[] = ["player", "team"]): AliasMatch[] {
+    const candidates: [number, number, number][] = [];
+    for (const [start, end, pattern] of this.occurrences(text)) {
+      const seenTypes = new Set<string>();
+      for (const recordIndex of this.patternRecords[pattern]) {
+        const record = this.records[recordIndex];
+        if (!types.includes(record.type) || seenTypes.has(record.type)) continue;
+        if (record.type === "player" && (!contextTeamIds || !contextTeamIds.has(record.team_id))) continue;
+        seenTypes.add(record.type);
+        if (hasBoundary(text, record.alias, start, end)) candidates.push([recordIndex, start, end]);
+      }
+    }
+    candidates.sort((a, b) => a[0] - b[0] || a[1] - b[1]);
+
+    const matches: AliasMatch[] = [];
+    for (const [recordIndex, start, end] of candidates) {
+      if (used.size >= maxLinks) break;
+      const record = this.records[recordIndex];
+      const key = `${record.type}-${record.id}`;
+      if (used.has(key) || matches.some((m) => start < m.end && end > m.start)) continue;
+      matches.push({ start, end, alias: record });
+      used.add(key);
+    }
+    return matches.sort((a, b) => a.start - b.start);
+  }
+}
+
+let cached: Promise<AliasAutomaton | null> | null = null;
+
+// ENTITY_ALIASES_URL 이 없거나, 받기 실패 / 형식 불일치 / 7일보다 오래된 산출물이면 null → 호출하는 쪽은 DB 별칭으로 대체
+export function loadAliasAutomaton(url = Deno.env.get("ENTITY_ALIASES_URL")): Promise<AliasAutomaton | null> {
+  if (!url) return Promise.resolve(null);
+  cached ??= (async () => {
+    try {
+      const res = await fetch(url);
+      if (!res.ok || !res.body) throw new Error(`HTTP ${res.status}`);
+      const json = await new Response(res.body.pipeThrough(new DecompressionStream("gzip"))).json();
+      const builtAt = Date.parse(json?.built_at || "");
+      if (!Number.isFinite(builtAt) || Date.now() - builtAt > MAX_ARTIFACT_AGE_DAYS * 86400000) {
+        console.warn(`alias automaton is older than ${MAX_ARTIFACT_AGE_DAYS} days (built_at=${json?.built_at}); using DB aliases`);
+        return null;
+      }
+      return AliasAutomaton.fromJson(json);
+    } catch (error) {
+      console.warn(`alias automaton load failed (${url}); using DB aliases:`, error);
+      cached = null; // 다음 실행에서 다시 시도
+      return null;
+    }
+  })();
+  return cached;
+}
@@ -1,6 +1,7 @@
 import "jsr:@supabase/functions-js/edge-runtime.d.ts";
 import { createClient } from "https://esm.sh/@supabase/supabase-js@2.45.0";
 import { parse } from "https://deno.land/x/xml@6.0.1/mod.ts";
+import { loadAliasAutomaton } from "./aliasAutomaton.ts";
 
 const CRON_SECRET = Deno.env.get("CRON_SECRET");
 const NEWS_USER_ID = "c4e31b46-be50-4546-bcbf-00776408588a";
@@ -134,8 +135,8 @@ function splitSentences(text: string) {
   if (tail) parts.push(tail);
   return parts.length ? parts : [text];
 }
-function linkSentence(sentence: string, aliases: any[], used: Set<string>) {
-  const matches = findMatches(sentence, aliases, used);
+function linkSentence(sentence: string, match: (text: string, used: Set<string>) => any[], used: Set<string>) {
+  const matches = match(sentence, used);
   const nodes: any[] = [];
   const entityKeys: string[] = [];
   let cursor = 0;
@@ -199,18 +200,27 @@ function buildMatchCard(fixture: any, teamMap: Map<number, any>, leagueMap: Map<
   };
 }
 async function enrichRssContent(supabase: any, content: any, postDate: string) {
+  // 미리 컴파일한 별칭 오토마톤이 있으면 본문을 한 번만 훑고 선수 전체 조회도 생략 (없으면 DB 별칭 + indexOf)
+  const automaton = await loadAliasAutomaton();
   const [{ data: teams }, { data: players }] = await Promise.all([
     supabase.from("football_teams").select(TEAM_SELECT).eq("is_active", true),
-    supabase.from("football_players").select(PLAYER_SELECT).eq("is_active", true)
+    automaton ? Promise.resolve({ data: [] }) : supabase.from("football_players").select(PLAYER_SELECT).eq("is_active", true)
   ]);
   const teamRows = teams || [];
   const playerRows = players || [];
-  const teamAliases = buildTeamAliases(teamRows);
   const bodyText = plainText(content);
   const dryUsed = new Set<string>();
   const contextTeamIds = new Set<number>();
-  for (const match of findMatches(bodyText, teamAliases, dryUsed)) contextTeamIds.add(Number(match.alias.id));
-  const allAliases = [...buildPlayerAliases(playerRows, contextTeamIds), ...teamAliases];
+  let matchAliases: (text: string, used: Set<string>) => any[];
+  if (automaton) {
+    for (const match of automaton.findMatches(bodyText, dryUsed, null, MAX_ENTITY_LINKS, ["team"])) contextTeamIds.add(Number(match.alias.id));
+    matchAliases = (text, used) => automaton.findMatches(text, used, contextTeamIds, MAX_ENTITY_LINKS);
+  } else {
+    const teamAliases = buildTeamAliases(teamRows);
+    for (const match of findMatches(bodyText, teamAliases, dryUsed)) contextTeamIds.add(Number(match.alias.id));
+    const allAliases = [...buildPlayerAliases(playerRows, contextTeamIds), ...teamAliases];
+    matchAliases = (text, used) => findMatches(text, allAliases, used);
+  }
   const used = new Set<string>();
   const linkedTeamIds = new Set<number>();
   const teamMap = new Map(teamRows.map((team: any) => [Number(team.team_id), team]));
@@ -243,7 +253,7 @@ async function enrichRssContent(supabase: any, content: any, postDate: string) {
     const paragraphText = plainText(node).replace(/\s+/g, " ").trim();
     if (!paragraphText) continue;
     for (const sentence of splitSentences(paragraphText)) {
-      const linked = linkSentence(sentence, allAliases, used);
+      const linked = linkSentence(sentence, matchAliases, used);
       const sentenceTeamIds = linked.entityKeys.filter((key) => key.startsWith("team-")).map((key) => Number(key.slice(5)));
       for (const id of sentenceTeamIds) linkedTeamIds.add(id);
       nextContent.push({ type: "paragraph", content: linked.nodes });